@@ -3,15 +3,42 @@
 # All timing follows standard Morse code ratios:
 #   dit = 1 unit, dah = 3 units, inter-element gap = 1 unit,
 #   inter-letter gap = 3 units, inter-word gap = 7 units.
-
+#
+# Nothing touches the audio device at import: sounddevice (and PortAudio with
+# it) is imported on first use, and the sidetone stream + thread start on the
+# first beep or an explicit prewarm().  shutdown() releases them again.
+#
+# Rendered messages are kept in a process-wide LRU cache (render_cache), so
+# repeated short strings are synthesised once.  Renders with random noise
+# are only cached when seeded.
+
+import atexit
+import importlib.util
 import threading
+from collections import OrderedDict
 import numpy as np
 
-try:
-    import sounddevice as sd
-    _HAS_SD = True
-except ImportError:
-    _HAS_SD = False
+import startup_profile
+
+# Cheap check only — the module itself is imported on first use.
+_HAS_SD = importlib.util.find_spec("sounddevice") is not None
+sd = None
+_init_lock = threading.RLock()
+_devices = None             # cached probe_devices() result
+
+
+def _get_sd():
+    """Import sounddevice on first use; None if it is missing or broken."""
+    global sd, _HAS_SD
+    if sd is None and _HAS_SD:
+        with _init_lock:
+            if sd is None and _HAS_SD:
+                try:
+                    import sounddevice
+                    sd = sounddevice
+                except (ImportError, OSError):     # OSError: no PortAudio
+                    _HAS_SD = False
+    return sd
 
 # ── Defaults ───────────────────────────────────────────────────────────────────
 DEFAULT_WPM   = 15          # Paris standard: 1 WPM = 1200 ms / WPM per dit
@@ -23,6 +50,72 @@ SAMPLE_RATE   = 44100       # Hz
 _noise_db: float  = 0.0
 _qrm_freq: float  = 0.0
 
+# ── Render cache ───────────────────────────────────────────────────────────────
+RENDER_CACHE_MB = 32        # total size of cached buffers
+
+
+class RenderCache:
+    """
+    LRU cache of rendered buffers, bounded by their total size in bytes.
+    Buffers are stored (and handed out) read-only, since every caller
+    shares them.
+    """
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._items: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.bypassed = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            audio = self._items.get(key)
+            if audio is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, key, audio: np.ndarray) -> np.ndarray:
+        audio.flags.writeable = False
+        if audio.nbytes > self.max_bytes:
+            return audio                # would evict everything else
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._items[key] = audio
+            self._bytes += audio.nbytes
+            while self._bytes > self.max_bytes:
+                _, dropped = self._items.popitem(last=False)
+                self._bytes -= dropped.nbytes
+                self.evictions += 1
+        return audio
+
+    def bypass(self):
+        """Count a render that did not go through the cache."""
+        with self._lock:
+            self.bypassed += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"entries": len(self._items), "bytes": self._bytes,
+                    "max_bytes": self.max_bytes, "hits": self.hits,
+                    "misses": self.misses, "bypassed": self.bypassed,
+                    "evictions": self.evictions,
+                    "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0}
+
+
+render_cache = RenderCache()
+
 # ── Sidetone queue — ensures rapid Q/E presses play sequentially ───────────────
 import queue as _queue
 
@@ -35,12 +128,18 @@ class _SidetonePlayer:
     def __init__(self):
         self._q: _queue.Queue = _queue.Queue()
         self._stream = None
+        self.ready = threading.Event()      # set once the stream open was tried
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def _open_stream(self):
-        if not _HAS_SD:
+        sd = _get_sd()
+        if sd is None:
             return
+        with startup_profile.span("audio: open output stream"):
+            self._open(sd)
+
+    def _open(self, sd):
         try:
             self._stream = sd.OutputStream(
                 samplerate=SAMPLE_RATE,
@@ -58,9 +157,11 @@ class _SidetonePlayer:
 
     def _run(self):
         self._open_stream()
+        self.ready.set()
         while True:
             audio = self._q.get()
             if audio is None:
+                self._close_stream()
                 break
             if self._stream is not None:
                 try:
@@ -97,8 +198,92 @@ class _SidetonePlayer:
             except _queue.Empty:
                 break
 
+    def close(self, timeout: float = 1.0):
+        """Stop the thread and release the device."""
+        self.clear()
+        self._q.put(None)
+        self._thread.join(timeout)
+
+    def _close_stream(self):
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+
+
+_sidetone = None            # started by _get_sidetone()
 
-_sidetone = _SidetonePlayer()
+
+def _get_sidetone():
+    """The sidetone player, started on first use (thread-safe)."""
+    global _sidetone
+    if _sidetone is None:
+        with _init_lock:
+            if _sidetone is None:
+                _sidetone = _SidetonePlayer()
+    return _sidetone
+
+
+# ── Device lifecycle ──────────────────────────────────────────────────────────
+def prewarm(wait: bool = False, timeout: float = 2.0) -> bool:
+    """
+    Open the sidetone stream ahead of the first beep (e.g. when a tool that
+    uses sound opens).  Returns False if no audio backend is available.
+    """
+    if _get_sd() is None:
+        return False
+    player = _get_sidetone()
+    if wait:
+        player.ready.wait(timeout)
+    return True
+
+
+def probe_devices(refresh: bool = False) -> list:
+    """
+    Output devices as dicts (index, name, channels, samplerate, default);
+    [] without sounddevice or without any output device.  Cached.
+    """
+    global _devices
+    if _devices is not None and not refresh:
+        return _devices
+    sd = _get_sd()
+    found = []
+    if sd is not None:
+        try:
+            default_out = sd.default.device[1]
+            for i, dev in enumerate(sd.query_devices()):
+                if dev["max_output_channels"] > 0:
+                    found.append({
+                        "index": i,
+                        "name": dev["name"],
+                        "channels": dev["max_output_channels"],
+                        "samplerate": dev["default_samplerate"],
+                        "default": i == default_out,
+                    })
+        except Exception:
+            found = []
+    _devices = found
+    return found
+
+
+def shutdown() -> None:
+    """Close the sidetone stream and thread; the next beep reopens them."""
+    global _sidetone
+    with _init_lock:
+        player, _sidetone = _sidetone, None
+    if player is not None:
+        player.close()
+    if sd is not None:
+        try:
+            sd.stop()
+        except Exception:
+            pass
+
+
+atexit.register(shutdown)
 
 
 
@@ -141,7 +326,8 @@ def _silence(duration_ms: float) -> np.ndarray:
 
 def _apply_noise(audio: np.ndarray,
                  noise_db: float,
-                 qrm_freq: float) -> np.ndarray:
+                 qrm_freq: float,
+                 seed: int | None = None) -> np.ndarray:
     """Mix white noise and/or a QRM carrier into an audio array."""
     if len(audio) == 0:
         return audio
@@ -153,7 +339,8 @@ def _apply_noise(audio: np.ndarray,
         sig_power = float(np.mean(audio ** 2)) or 1e-6
         # Noise power from SNR: SNR_dB = 10*log10(P_sig/P_noise)
         noise_power = sig_power / (10 ** (noise_db / 10))
-        noise = np.random.normal(0, np.sqrt(noise_power), n).astype(np.float32)
+        rng = np.random if seed is None else np.random.default_rng(seed)
+        noise = rng.normal(0, np.sqrt(noise_power), n).astype(np.float32)
         result += noise
 
     if qrm_freq > 0:
@@ -175,7 +362,9 @@ def build_audio(morse_string: str,
                 vol: float = DEFAULT_VOL,
                 farnsworth_wpm: int = 0,
                 noise_db: float | None = None,
-                qrm_freq: float | None = None) -> np.ndarray:
+                qrm_freq: float | None = None,
+                seed: int | None = None,
+                cache: bool = True) -> np.ndarray:
     """
     Convert a Morse string (dots, dashes, spaces) to a numpy audio array.
 
@@ -183,7 +372,29 @@ def build_audio(morse_string: str,
     farnsworth_wpm: if > 0, dit/dah timing uses this WPM for character speed,
                     but inter-letter/word gaps are stretched to the slower `wpm`.
     noise_db / qrm_freq: override global noise settings if provided.
+    seed: makes the noise repeatable (and the render cacheable).
+    cache: False for one-off renders (batch output) that should not evict
+           the trainers' buffers.
+
+    The result may come from render_cache and is then read-only.
     """
+    nb = _noise_db if noise_db is None else noise_db
+    qf = _qrm_freq if qrm_freq is None else qrm_freq
+    if not cache or (nb > 0 and seed is None):
+        # One-off, or fresh random noise every time: nothing to reuse
+        render_cache.bypass()
+        return _render(morse_string, wpm, freq, vol, farnsworth_wpm, nb, qf, seed)
+    key = (morse_string, wpm, farnsworth_wpm, freq, vol, nb, qf,
+           seed if nb > 0 else None)
+    audio = render_cache.get(key)
+    if audio is None:
+        audio = render_cache.put(
+            key, _render(morse_string, wpm, freq, vol, farnsworth_wpm, nb, qf, seed))
+    return audio
+
+
+def _render(morse_string: str, wpm: int, freq: float, vol: float,
+            farnsworth_wpm: int, nb: float, qf: float, seed) -> np.ndarray:
     char_wpm = farnsworth_wpm if farnsworth_wpm > wpm else wpm
     dit  = dit_ms(char_wpm)
     gap_el   = dit                      # inter-element
@@ -212,15 +423,39 @@ def build_audio(morse_string: str,
         return np.zeros(0, dtype=np.float32)
 
     audio = np.concatenate(segments)
-
-    nb = _noise_db if noise_db is None else noise_db
-    qf = _qrm_freq if qrm_freq is None else qrm_freq
     if nb > 0 or qf > 0:
-        audio = _apply_noise(audio, nb, qf)
-
+        audio = _apply_noise(audio, nb, qf, seed)
     return audio
 
 
+def build_audio_stream(morse_chunks,
+                       wpm: int = DEFAULT_WPM,
+                       freq: float = DEFAULT_FREQ,
+                       vol: float = DEFAULT_VOL,
+                       farnsworth_wpm: int = 0):
+    """
+    build_audio() for an iterable of Morse chunks (e.g. encode_stream output),
+    yielding one clean float32 block per word so memory stays flat however
+    long the input.  Blocks bypass render_cache.  Concatenating the blocks
+    matches build_audio() on the joined string without noise.
+    """
+    word_gap = np.zeros(int(SAMPLE_RATE * dit_ms(wpm) * 7 / 1000), dtype=np.float32)
+    first = True
+    carry = ""
+    for chunk in morse_chunks:
+        # A word is only complete once the next ' / ' has arrived
+        *words, carry = (carry + chunk).split(" / ")
+        for word in words:
+            if not first:
+                yield word_gap
+            first = False
+            yield build_audio(word, wpm, freq, vol, farnsworth_wpm, 0.0, 0.0, cache=False)
+    if carry.strip():
+        if not first:
+            yield word_gap
+        yield build_audio(carry, wpm, freq, vol, farnsworth_wpm, 0.0, 0.0, cache=False)
+
+
 def play_morse(morse_string: str,
                wpm: int = DEFAULT_WPM,
                freq: float = DEFAULT_FREQ,
@@ -228,10 +463,15 @@ def play_morse(morse_string: str,
                farnsworth_wpm: int = 0,
                blocking: bool = False) -> None:
     """Play a Morse string asynchronously (non-blocking by default)."""
-    if not _HAS_SD:
+    if _get_sd() is None:
         return
-    audio = build_audio(morse_string, wpm, freq, vol, farnsworth_wpm)
-    if len(audio) == 0:
+    play_audio(build_audio(morse_string, wpm, freq, vol, farnsworth_wpm), blocking)
+
+
+def play_audio(audio: np.ndarray, blocking: bool = False) -> None:
+    """Play an already rendered buffer (from build_audio) — no synthesis delay."""
+    sd = _get_sd()
+    if sd is None or len(audio) == 0:
         return
     if blocking:
         sd.play(audio, SAMPLE_RATE)
@@ -248,7 +488,7 @@ def play_dit(wpm: int = DEFAULT_WPM, freq: float = DEFAULT_FREQ,
         return
     pad   = np.zeros(int(SAMPLE_RATE * 0.005), dtype=np.float32)  # 5 ms lead-in
     tone  = _tone(dit_ms(wpm), freq, vol)
-    _sidetone.enqueue(np.concatenate([pad, tone]))
+    _get_sidetone().enqueue(np.concatenate([pad, tone]))
 
 
 def play_dah(wpm: int = DEFAULT_WPM, freq: float = DEFAULT_FREQ,
@@ -258,16 +498,18 @@ def play_dah(wpm: int = DEFAULT_WPM, freq: float = DEFAULT_FREQ,
         return
     pad   = np.zeros(int(SAMPLE_RATE * 0.005), dtype=np.float32)  # 5 ms lead-in
     tone  = _tone(dit_ms(wpm) * 3, freq, vol)
-    _sidetone.enqueue(np.concatenate([pad, tone]))
+    _get_sidetone().enqueue(np.concatenate([pad, tone]))
 
 
 def stop() -> None:
     """Flush the sidetone queue (stream stays open for next use)."""
-    _sidetone.clear()
+    if _sidetone is not None:
+        _sidetone.clear()
 
 
 def is_available() -> bool:
-    return _HAS_SD
+    """True if sounddevice works and there is at least one output device."""
+    return _HAS_SD and bool(probe_devices())
 
 
 # ── Internal ──────────────────────────────────────────────────────────────────
@@ -280,10 +522,11 @@ def _play_blocking(audio: np.ndarray) -> None:
     try:
         # 1. Write a tiny silent chunk through the persistent stream so the
         #    driver is warm before sd.play() touches it.
-        if _sidetone._stream is not None:
+        player = _get_sidetone()
+        if player._stream is not None:
             try:
                 warmup = np.zeros(int(SAMPLE_RATE * 0.06), dtype=np.float32)
-                _sidetone._stream.write(warmup)
+                player._stream.write(warmup)
             except Exception:
                 pass
 
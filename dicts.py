@@ -12,6 +12,39 @@ MORSE_CODE_DICT = {
     '8': '---..', '9': '----.',
     ' ': '/'
 }
+
+# ── Extended code tables ──────────────────────────────────────────────────────
+# Combined by morse_codec.get_codec(); earlier tables win when two entries
+# share a pattern (e.g. '+' and <AR>), so decoding prefers plain punctuation.
+ITU_PUNCTUATION = {
+    '.': '.-.-.-', ',': '--..--', '?': '..--..', "'": '.----.',
+    '!': '-.-.--', '/': '-..-.',  '(': '-.--.',  ')': '-.--.-',
+    '&': '.-...',  ':': '---...', ';': '-.-.-.', '=': '-...-',
+    '+': '.-.-.',  '-': '-....-', '_': '..--.-', '"': '.-..-.',
+    '$': '...-..-', '@': '.--.-.',
+}
+# Prosigns are written as bracketed tokens and sent without letter gaps
+PROSIGNS = {
+    '<AR>': '.-.-.',   '<AS>': '.-...',  '<BT>': '-...-',
+    '<CT>': '-.-.-',   '<KN>': '-.--.',  '<SK>': '...-.-',
+    '<SN>': '...-.',   '<HH>': '........', '<SOS>': '...---...',
+}
+TURKISH_EXTENSIONS = {
+    'Ç': '-.-..', 'Ğ': '--.-.', 'İ': '.-..-',
+    'Ö': '---.',  'Ş': '.--..', 'Ü': '..--',
+}
+GERMAN_EXTENSIONS = {
+    'Ä': '.-.-', 'Ö': '---.', 'Ü': '..--',
+    'ß': '...--..',   # decode only — str.upper() folds ß to SS before encoding
+}
+CODE_TABLES = {
+    "itu":         MORSE_CODE_DICT,
+    "punctuation": ITU_PUNCTUATION,
+    "prosigns":    PROSIGNS,
+    "turkish":     TURKISH_EXTENSIONS,
+    "german":      GERMAN_EXTENSIONS,
+}
+
 TURKISH_REPLACEMENTS = {
     'ç': 'ch',
     'Ç': 'CH',
@@ -56,14 +89,13 @@ NATO_PHONETIC_DICT = {
 }
 
 
+_TURKISH_TABLE = str.maketrans(TURKISH_REPLACEMENTS)
+
+
 def normalize_turkish_characters(text):
-    result = []
-    for char in text:
-        if char in TURKISH_REPLACEMENTS:
-            result.append(TURKISH_REPLACEMENTS[char])
-        else:
-            result.append(char)
-    return ''.join(result)
+    # Kept for callers that only need the Turkish fold; see transliterate.py
+    # for full per-language transliteration.
+    return text.translate(_TURKISH_TABLE)
 
 
 # ── Q-Codes ────────────────────────────────────────────────────────────────────
@@ -0,0 +1,331 @@
+# event_log.py
+# Per-attempt event log — one row per target character, stored column-wise.
+# No Qt imports.
+#
+# Trainers call record_attempt() after every answer.  Rows go into a
+# preallocated NumPy buffer and are flushed in batches to immutable .npz
+# segments (one uncompressed .npy array per column) under session_events/.
+# Scanning loads only the columns asked for.  Compaction is size-tiered:
+# COMPACT_FANOUT neighbouring segments of about the same size are merged into
+# one, so each row is rewritten only O(log n) times and a long history stays
+# a handful of files.  A merged segment is named after the range it replaces
+# ("<newest>~<oldest>.npz"); inputs left behind by a crash before they were
+# deleted fall inside a live range and are dropped instead of read twice.
+# Segment writes, compaction and reads hold an advisory lock (file_lock.py),
+# so several processes can share the directory.
+#
+# Columns (EVENT_DTYPE):
+#   ts          unix time of the answer
+#   tool        index into TOOLS
+#   attempt     attempt number, increasing across sessions
+#   target      expected character (code point)
+#   response    character given for it (code point, 0 = missing)
+#   correct     target == response
+#   latency_ms  time from prompt to answer
+#   wpm, farnsworth, noise_db, qrm_hz   playback settings (0 = n/a)
+
+import difflib
+import io
+import os
+import time
+
+import numpy as np
+
+from file_lock import FileLock
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+EVENTS_DIR = os.path.join(_SCRIPT_DIR, "session_events")
+
+EVENT_DTYPE = np.dtype([
+    ("ts",         "f8"),
+    ("tool",       "u1"),
+    ("attempt",    "u4"),
+    ("target",     "u4"),
+    ("response",   "u4"),
+    ("correct",    "?"),
+    ("latency_ms", "f4"),
+    ("wpm",        "f4"),
+    ("farnsworth", "f4"),
+    ("noise_db",   "f4"),
+    ("qrm_hz",     "f4"),
+])
+COLUMNS = EVENT_DTYPE.names
+
+# Tool ids are stored as u1; append new tools, never reorder.
+TOOLS = ("Unknown", "Morse Exercise", "WPM Trainer", "Send Practice", "Phonetic Drill")
+_TOOL_IDS = {name: i for i, name in enumerate(TOOLS)}
+
+FLUSH_EVERY      = 4096   # buffered rows before an automatic flush
+COMPACT_FANOUT   = 4      # same-tier neighbours merged into one segment
+COMPACT_SEGMENTS = 32     # above this many, small odd-sized segments merge too
+TIER_BYTES       = 1 << 16  # tier 0 is up to this size; each tier is FANOUT x bigger
+
+
+def tool_id(name: str) -> int:
+    return _TOOL_IDS.get(name, 0)
+
+
+def align(target: str, response: str) -> list:
+    """
+    Pair each target character with the response character given for it.
+    Uses a diff so one dropped or extra letter doesn't misalign the rest;
+    dropped characters pair with "".
+    """
+    if len(target) == len(response):
+        return list(zip(target, response))
+    pairs = []
+    matcher = difflib.SequenceMatcher(None, target, response, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "insert":
+            continue                     # extra characters have no target
+        got = response[j1:j2] if op != "delete" else ""
+        for k in range(i2 - i1):
+            pairs.append((target[i1 + k], got[k] if k < len(got) else ""))
+    return pairs
+
+
+def _codepoints(chars) -> np.ndarray:
+    return np.fromiter((ord(c) if c else 0 for c in chars), dtype=np.uint32)
+
+
+# ── Segment names and tiers ───────────────────────────────────────────────────
+def _span(name: str):
+    """(oldest, newest) stem a segment covers: 'b~a.npz' -> ('a', 'b')."""
+    stems = name[:-len(".npz")].split("~")
+    return stems[-1], stems[0]
+
+
+def _tier(size: int) -> int:
+    tier, limit = 0, TIER_BYTES
+    while size > limit:
+        tier += 1
+        limit *= COMPACT_FANOUT
+    return tier
+
+
+def _pick_merge(names: list, sizes: list) -> list:
+    """
+    Segments to merge next, or [] when nothing needs merging: the newest
+    block of neighbours no bigger than tier t holding COMPACT_FANOUT of tier
+    t, smallest t first (smaller segments in the block come along, so odd
+    sizes are not stranded between bigger ones).  Each merge lifts its rows
+    at least one tier.  Past COMPACT_SEGMENTS segments, the smallest one and
+    its smaller neighbour are merged as well.
+    """
+    tiers = [_tier(s) for s in sizes]
+    for t in sorted(set(tiers)):
+        end = len(names)
+        while end > 0:
+            start = end
+            while start > 0 and tiers[start - 1] <= t:
+                start -= 1
+            if tiers[start:end].count(t) >= COMPACT_FANOUT:
+                return names[start:end]
+            end = start - 1              # step over the bigger segment
+    if len(names) > COMPACT_SEGMENTS:
+        i = sizes.index(min(sizes))
+        if i == len(names) - 1 or (i > 0 and sizes[i - 1] <= sizes[i + 1]):
+            i -= 1
+        return names[i:i + 2]
+    return []
+
+
+class EventLog:
+    def __init__(self, directory: str = EVENTS_DIR, flush_every: int = FLUSH_EVERY):
+        self.directory = directory
+        self._buf = np.zeros(flush_every, dtype=EVENT_DTYPE)
+        self._n = 0
+        self._attempt = None             # last attempt number, read lazily
+        # Where flushed rows go; stats_writer points this at its thread.
+        self.sink = self.write_rows
+        # Guards the segment files against stats_writer's thread and other
+        # processes (compaction deletes segments a reader may be opening)
+        self._io_lock = FileLock(os.path.join(directory, ".lock"))
+        self._cache_key = None
+        self._cache = {}
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+    def record_attempt(self, tool: str, target: str, response: str,
+                       latency_ms: float = 0.0, wpm: float = 0.0,
+                       farnsworth: float = 0.0, noise_db: float = 0.0,
+                       qrm_hz: float = 0.0, ignore=" "):
+        """
+        Log one answer as one row per target character.  Characters in
+        `ignore` (word spaces by default) are stripped from both sides first.
+        """
+        for ch in ignore:
+            target = target.replace(ch, "")
+            response = response.replace(ch, "")
+        pairs = align(target, response)
+        if not pairs:
+            return
+        self._attempt = self.last_attempt() + 1
+
+        n = len(pairs)
+        if self._n + n > len(self._buf):
+            self.flush()
+            if n > len(self._buf):
+                self._buf = np.zeros(n, dtype=EVENT_DTYPE)
+        rows = self._buf[self._n:self._n + n]
+        rows["ts"]         = time.time()
+        rows["tool"]       = tool_id(tool)
+        rows["attempt"]    = self._attempt
+        rows["target"]     = _codepoints(t for t, _ in pairs)
+        rows["response"]   = _codepoints(r for _, r in pairs)
+        rows["correct"]    = rows["target"] == rows["response"]
+        rows["latency_ms"] = latency_ms
+        rows["wpm"]        = wpm
+        rows["farnsworth"] = farnsworth
+        rows["noise_db"]   = noise_db
+        rows["qrm_hz"]     = qrm_hz
+        self._n += n
+
+    def take(self) -> np.ndarray:
+        """Detach the buffered rows (a copy) for writing elsewhere."""
+        rows = self._buf[:self._n].copy()
+        self._n = 0
+        return rows
+
+    def flush(self):
+        """Hand buffered rows to the sink (by default: write a segment now)."""
+        if self._n:
+            self.sink(self.take())
+
+    def write_rows(self, rows: np.ndarray):
+        """Write rows (EVENT_DTYPE) as a new segment; safe from any thread."""
+        if not len(rows):
+            return
+        with self._io_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            names = self._segments()
+            # Names must sort after every existing segment, even if the
+            # clock stepped back
+            t = time.time_ns()
+            if names:
+                t = max(t, int(_span(names[-1])[1][:20]) + 1)
+            self._write_segment(f"{t:020d}-{os.getpid()}.npz",
+                                {name: rows[name] for name in COLUMNS})
+            self._compact_tiers()
+
+    def _write_segment(self, name: str, columns: dict):
+        # Serialise in memory, then temp file + rename: readers never see a
+        # half-written segment.
+        data = io.BytesIO()
+        np.savez(data, **columns)
+        path = os.path.join(self.directory, name)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data.getbuffer())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _compact_tiers(self):
+        """Merge same-tier neighbours until no run is left (caller holds the lock)."""
+        while True:
+            names = self._segments()
+            sizes = [os.path.getsize(os.path.join(self.directory, n)) for n in names]
+            run = _pick_merge(names, sizes)
+            if not run:
+                return
+            self._merge(run)
+
+    def _merge(self, names: list):
+        """
+        Replace neighbouring segments with one.  The output becomes visible
+        (atomically) before the inputs are deleted; until they are, its name
+        marks them as superseded, so a crash in between loses and duplicates
+        nothing.
+        """
+        oldest, newest = _span(names[0])[0], _span(names[-1])[1]
+        self._write_segment(f"{newest}~{oldest}.npz", self._read(names, COLUMNS))
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def compact(self):
+        """Merge all segments into one."""
+        with self._io_lock:
+            names = self._segments()
+            if len(names) >= 2:
+                self._merge(names)
+
+    def clear(self):
+        self._n = 0
+        self._attempt = 0
+        with self._io_lock:
+            for name in self._segments():
+                os.remove(os.path.join(self.directory, name))
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+    def _segments(self) -> list:
+        """
+        Live segment names, oldest first (caller holds the lock).  Finishes
+        a compaction cut short by a crash: inputs inside a merged segment's
+        range and half-written temp files are deleted.
+        """
+        try:
+            files = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        names = sorted(n for n in files if n.endswith(".npz"))
+        merged = [_span(n) for n in names if "~" in n]
+        stale = [n for n in files if n.endswith(".tmp")]
+        if merged:
+            live = []
+            for name in names:
+                first, last = span = _span(name)
+                if any(lo <= first and last <= hi and (lo, hi) != span
+                       for lo, hi in merged):
+                    stale.append(name)
+                else:
+                    live.append(name)
+            names = live
+        for name in stale:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return names
+
+    def last_attempt(self) -> int:
+        if self._attempt is None:
+            # Segments are time-ordered, so the newest one holds the maximum.
+            with self._io_lock:
+                names = self._segments()
+                self._attempt = 0
+                if names:
+                    with np.load(os.path.join(self.directory, names[-1])) as seg:
+                        if len(seg["attempt"]):
+                            self._attempt = int(seg["attempt"].max())
+        return self._attempt
+
+    def load(self, columns=None) -> dict:
+        """
+        Column name -> array over the whole history (flushed rows only).
+        Concatenated arrays are cached until the segment set changes.
+        """
+        columns = tuple(columns or COLUMNS)
+        with self._io_lock:
+            names = self._segments()
+            key = tuple(names)
+            if key != self._cache_key:
+                self._cache_key, self._cache = key, {}
+            missing = [c for c in columns if c not in self._cache]
+            if missing:
+                self._cache.update(self._read(names, missing))
+            return {c: self._cache[c] for c in columns}
+
+    def _read(self, names, columns) -> dict:
+        parts = {c: [] for c in columns}
+        for name in names:
+            with np.load(os.path.join(self.directory, name)) as seg:
+                for c in columns:
+                    parts[c].append(seg[c])
+        return {c: np.concatenate(parts[c]) if parts[c]
+                else np.zeros(0, dtype=EVENT_DTYPE[c]) for c in columns}
+
+    def __len__(self) -> int:
+        return len(self.load(("attempt",))["attempt"])
@@ -1,20 +1,19 @@
+import importlib
+import os
 import sys
+from collections import OrderedDict, namedtuple
+
+import startup_profile
+if __name__ == "__main__":
+    # Before Qt is imported, so that its import time is in the profile
+    startup_profile.install_from_args(sys.argv)
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
-    QLabel, QFrame, QGraphicsDropShadowEffect
+    QLabel, QFrame, QGraphicsDropShadowEffect, QMessageBox
 )
 from PyQt5.QtGui import QFont, QColor, QPalette
-from PyQt5.QtCore import Qt
-from tools.morse2svg import run_morse2svg_gui
-from tools.svg2morse import Svg2MorseWindow
-from training.morse_exercise import MorseExerciseApp
-from tools.text2morse_window import TextToMorseWindow
-from training.wpm_trainer import WpmTrainer
-from training.send_practice import SendPractice
-from tools.qcode_reference import ReferenceWindow
-from training.phonetic_drill import PhoneticDrill
-from session_stats import StatsViewer
-from tools.tra import MyApp
+from PyQt5.QtCore import Qt, QTimer, QThread
 
 
 # ── Dark theme stylesheet ─────────────────────────────────────────────────────
@@ -137,12 +136,194 @@ def _divider() -> QFrame:
     return line
 
 
+# ── Tool registry ─────────────────────────────────────────────────────────────
+# Each tool is imported only when its button is first clicked, so the menu
+# starts without loading Qt tool windows, audio, Pillow or matplotlib.
+# factory is "module:attr"; windows are built with return_callback=…,
+# actions (window=False) are simply called.
+ToolSpec = namedtuple("ToolSpec", "label tooltip factory window prewarm",
+                      defaults=(True, True))
+
+_REGISTRY = [
+    ("TRAINING", "▸  TRAINING", [
+        ToolSpec("Morse Exercise",
+                 "Learn the alphabet: hear → identify each letter",
+                 "training.morse_exercise:MorseExerciseApp"),
+        ToolSpec("WPM Speed Trainer",
+                 "Decode random Morse sequences to improve speed",
+                 "training.wpm_trainer:WpmTrainer"),
+        ToolSpec("Send Practice  (WPM)",
+                 "Encode words with Q/E — get timed WPM score",
+                 "training.send_practice:SendPractice"),
+        ToolSpec("Phonetic Alphabet Drill",
+                 "Practise NATO phonetics in both directions",
+                 "training.phonetic_drill:PhoneticDrill"),
+    ]),
+    ("INPUT", "▸  INPUT & CONVERSION", [
+        ToolSpec("Real-Time Morse Input",
+                 "Type Q/E live and see decoded text in real time",
+                 "tools.tra:MyApp"),
+        ToolSpec("Text → Morse Converter",
+                 "Convert any text (incl. Turkish) to Morse and play it",
+                 "tools.text2morse_window:TextToMorseWindow"),
+    ]),
+    ("RADIO", "▸  RADIO UTILITIES", [
+        ToolSpec("Q-Code & CW Abbreviations",
+                 "Searchable reference of Q-codes, prosigns, and abbreviations",
+                 "tools.qcode_reference:ReferenceWindow"),
+    ]),
+    ("IMAGE", "▸  IMAGE TOOLS", [
+        ToolSpec("Decode Morse from Image",
+                 "Read green-bar Morse signal from a PNG/JPG image",
+                 "tools.svg2morse:Svg2MorseWindow"),
+        ToolSpec("Generate SVG from Morse",
+                 "Create a visual Morse waveform SVG file",
+                 "tools.morse2svg:run_morse2svg_gui", window=False),
+    ]),
+    ("PROGRESS", "▸  PROGRESS", [
+        ToolSpec("Session Stats",
+                 "View accuracy and WPM history across all training tools",
+                 "session_stats:StatsViewer"),
+    ]),
+]
+
+PREWARM_ENV      = "MORSE_PREWARM"     # set to 0 to disable idle pre-loading
+PREWARM_DELAY_MS = 300                 # after the menu is first shown
+# Widget-free modules the tools depend on — nearly all of a tool's import
+# time.  They are imported on a worker thread; the tool modules themselves
+# (a few ms each once these are loaded) are then imported on the GUI thread.
+PREWARM_MODULES = ("numpy", "cw_audio", "morse_codec", "morse_handler", "transliterate",
+                   "stats_store", "event_log", "stats_analytics", "stats_writer")
+
+_factories: dict = {}
+
+
+def load_factory(spec: ToolSpec):
+    """Import the tool's module on first use and return its factory."""
+    factory = _factories.get(spec.factory)
+    if factory is None:
+        module_name, attr = spec.factory.split(":")
+        factory = getattr(importlib.import_module(module_name), attr)
+        _factories[spec.factory] = factory
+    return factory
+
+
+class PrewarmWorker(QThread):
+    """Imports PREWARM_MODULES off the GUI thread."""
+
+    def run(self):
+        for name in PREWARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass                # reported when a tool needing it is opened
+
+
+# ── Window pool ───────────────────────────────────────────────────────────────
+# Closed tool windows are only hidden, and reopened with reset_session()
+# instead of being rebuilt.  Windows without reset_session() are never pooled.
+POOL_ENV    = "MORSE_POOL_SIZE"       # windows kept for reuse; 0 disables
+POOL_SIZE   = 6
+POOL_MAX_MB = 400                     # above this RSS keep only the open window
+                                      # (peak RSS on macOS, see _rss_mb)
+
+
+def _rss_mb():
+    """
+    Resident memory of this process in MB, or None where unknown: current
+    RSS from /proc on Linux and GetProcessMemoryInfo on Windows.  Elsewhere
+    (macOS, BSD) the stdlib only offers the peak RSS, which never shrinks,
+    so there the pool stays small once the process has been that big.
+    """
+    if sys.platform == "win32":
+        return _rss_mb_windows()
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, KB elsewhere
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _rss_mb_windows():
+    import ctypes
+    from ctypes import wintypes
+
+    class Counters(ctypes.Structure):          # PROCESS_MEMORY_COUNTERS
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                "PeakWorkingSetSize", "WorkingSetSize",
+                "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                "PagefileUsage", "PeakPagefileUsage")]
+
+    try:
+        kernel32 = ctypes.WinDLL("kernel32")
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        info = kernel32.K32GetProcessMemoryInfo      # Windows 7+
+        info.argtypes = [wintypes.HANDLE, ctypes.POINTER(Counters), wintypes.DWORD]
+        info.restype = wintypes.BOOL
+        counters = Counters()
+        counters.cb = ctypes.sizeof(Counters)
+        if not info(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return None
+    except (OSError, AttributeError):
+        return None
+    return counters.WorkingSetSize / (1 << 20)
+
+
+class WindowPool:
+    """Tool windows by factory, least recently used evicted first."""
+
+    def __init__(self, size: int = POOL_SIZE, max_mb: float = POOL_MAX_MB):
+        self.size = size
+        self.max_mb = max_mb
+        self._windows = OrderedDict()
+
+    def acquire(self, key: str, build):
+        """(window, reused): the pooled window reset for a new session, or build()."""
+        window = self._windows.pop(key, None)
+        reused = window is not None
+        if reused:
+            window.reset_session()
+        else:
+            window = build()
+        if self.size > 0 and hasattr(window, "reset_session"):
+            self._windows[key] = window            # most recently used last
+            self._evict(keep=window)
+        return window, reused
+
+    def _evict(self, keep):
+        rss = _rss_mb() if self.max_mb else None
+        over_memory = rss is not None and rss > self.max_mb
+        for key in list(self._windows):
+            if len(self._windows) <= self.size and not over_memory:
+                break
+            window = self._windows[key]
+            if window is not keep:
+                del self._windows[key]
+                window.deleteLater()
+
+    def __len__(self):
+        return len(self._windows)
+
+
 class MainMenu(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Morse / CW Toolkit")
         self.setGeometry(300, 100, 440, 700)
         self.child_window = None
+        self.pool = WindowPool(int(os.environ.get(POOL_ENV, POOL_SIZE)))
+        self._prewarm_queue = None
+        self._prewarm_worker = None
         self._build_ui()
 
     def _build_ui(self):
@@ -163,60 +344,13 @@ class MainMenu(QWidget):
         subtitle.setAlignment(Qt.AlignCenter)
         layout.addWidget(subtitle)
 
-        layout.addWidget(_divider())
-
-        # ── Training ───────────────────────────────────────────────────────
-        layout.addWidget(_section_label("▸  TRAINING", _SECTION_COLORS["TRAINING"]))
-        self._btn(layout, "Morse Exercise",
-                  "Learn the alphabet: hear → identify each letter",
-                  self.launch_exercise)
-        self._btn(layout, "WPM Speed Trainer",
-                  "Decode random Morse sequences to improve speed",
-                  self.launch_wpm_trainer)
-        self._btn(layout, "Send Practice  (WPM)",
-                  "Encode words with Q/E — get timed WPM score",
-                  self.launch_send_practice)
-        self._btn(layout, "Phonetic Alphabet Drill",
-                  "Practise NATO phonetics in both directions",
-                  self.launch_phonetic_drill)
-
-        layout.addWidget(_divider())
-
-        # ── Input & Conversion ─────────────────────────────────────────────
-        layout.addWidget(_section_label("▸  INPUT & CONVERSION", _SECTION_COLORS["INPUT"]))
-        self._btn(layout, "Real-Time Morse Input",
-                  "Type Q/E live and see decoded text in real time",
-                  self.launch_realtime)
-        self._btn(layout, "Text → Morse Converter",
-                  "Convert any text (incl. Turkish) to Morse and play it",
-                  self.launch_text2morse)
-
-        layout.addWidget(_divider())
-
-        # ── Radio Utilities ────────────────────────────────────────────────
-        layout.addWidget(_section_label("▸  RADIO UTILITIES", _SECTION_COLORS["RADIO"]))
-        self._btn(layout, "Q-Code & CW Abbreviations",
-                  "Searchable reference of Q-codes, prosigns, and abbreviations",
-                  self.launch_reference)
-
-        layout.addWidget(_divider())
-
-        # ── Image Tools ────────────────────────────────────────────────────
-        layout.addWidget(_section_label("▸  IMAGE TOOLS", _SECTION_COLORS["IMAGE"]))
-        self._btn(layout, "Decode Morse from Image",
-                  "Read green-bar Morse signal from a PNG/JPG image",
-                  self.launch_svg2morse)
-        self._btn(layout, "Generate SVG from Morse",
-                  "Create a visual Morse waveform SVG file",
-                  run_morse2svg_gui)
-
-        layout.addWidget(_divider())
-
-        # ── Progress ───────────────────────────────────────────────────────
-        layout.addWidget(_section_label("▸  PROGRESS", _SECTION_COLORS["PROGRESS"]))
-        self._btn(layout, "Session Stats",
-                  "View accuracy and WPM history across all training tools",
-                  self.launch_stats)
+        # ── Sections from the registry ─────────────────────────────────────
+        for section, heading, specs in _REGISTRY:
+            layout.addWidget(_divider())
+            layout.addWidget(_section_label(heading, _SECTION_COLORS[section]))
+            for spec in specs:
+                self._btn(layout, spec.label, spec.tooltip,
+                          lambda checked=False, s=spec: self.launch(s))
 
         layout.addStretch()
         self.setLayout(layout)
@@ -230,41 +364,26 @@ class MainMenu(QWidget):
         layout.addWidget(btn)
         return btn
 
-    # ── Launchers ──────────────────────────────────────────────────────────
-    def launch_exercise(self):
-        self.child_window = MorseExerciseApp(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_wpm_trainer(self):
-        self.child_window = WpmTrainer(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_send_practice(self):
-        self.child_window = SendPractice(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_phonetic_drill(self):
-        self.child_window = PhoneticDrill(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_realtime(self):
-        self.child_window = MyApp(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_text2morse(self):
-        self.child_window = TextToMorseWindow(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_svg2morse(self):
-        self.child_window = Svg2MorseWindow(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_reference(self):
-        self.child_window = ReferenceWindow(return_callback=self.show_main)
-        self._show_child()
-
-    def launch_stats(self):
-        self.child_window = StatsViewer(return_callback=self.show_main)
+    # ── Launching ──────────────────────────────────────────────────────────
+    def launch(self, spec: ToolSpec):
+        timer = startup_profile.launch(spec.label)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            factory = load_factory(spec)
+        except ImportError as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, spec.label,
+                                f"{spec.label} is unavailable:\n{e}")
+            return
+        QApplication.restoreOverrideCursor()
+        timer.step("import")
+        if not spec.window:
+            factory()
+            return
+        self.child_window, reused = self.pool.acquire(
+            spec.factory, lambda: factory(return_callback=self.show_main))
+        timer.step("reuse" if reused else "construct")
+        timer.watch_paint(self.child_window)
         self._show_child()
 
     def _show_child(self):
@@ -275,10 +394,39 @@ class MainMenu(QWidget):
     def show_main(self):
         self.show()
 
+    # ── Idle pre-warm ──────────────────────────────────────────────────────
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._prewarm_queue is None and os.environ.get(PREWARM_ENV, "1") != "0":
+            self._prewarm_queue = [s for _, _, specs in _REGISTRY
+                                   for s in specs if s.prewarm]
+            QTimer.singleShot(PREWARM_DELAY_MS, self._prewarm_start)
+
+    def _prewarm_start(self):
+        self._prewarm_worker = PrewarmWorker(self)
+        self._prewarm_worker.finished.connect(self._prewarm_next)
+        self._prewarm_worker.start()
+
+    def _prewarm_next(self):
+        """
+        Import one tool module per event-loop pass (after the worker has
+        loaded their dependencies), so input stays responsive.
+        """
+        if not self._prewarm_queue:
+            return
+        spec = self._prewarm_queue.pop(0)
+        try:
+            load_factory(spec)
+        except ImportError:
+            pass                    # reported when the button is clicked
+        QTimer.singleShot(0, self._prewarm_next)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet(_DARK_STYLE)
     menu = MainMenu()
+    startup_profile.mark("main menu built")
+    startup_profile.mark_first_paint(menu, "main menu painted")
     menu.show()
     sys.exit(app.exec_())
@@ -0,0 +1,143 @@
+# morse_bits.py
+# Bit-packed Morse symbols — one pattern is one small int, a message is a
+# numpy uint16 array.  Comparisons and whole-message decoding are integer /
+# vectorised operations instead of string hashing.
+#
+# Packing: a leading 1 bit marks the length, then one bit per element
+# (dit = 0, dah = 1), most significant first:
+#   ''   -> 0b1    (1)      '.'  -> 0b10  (2)      '-' -> 0b11 (3)
+#   '.-' -> 0b101  (5)      '-..' -> 0b1100 (12)
+# In packed messages 0 is the word separator ('/').
+
+import numpy as np
+
+from morse_codec import DEFAULT_CODEC, UNKNOWN_CHAR
+
+WORD_SEP     = 0
+EMPTY        = 1
+INVALID      = 0xFFFF        # overlong / unparsable pattern
+MAX_ELEMENTS = 14            # 1 length bit + 14 elements fit below INVALID
+
+_BITS = str.maketrans(".-", "01")
+_ELEMENTS = str.maketrans("01", ".-")
+
+
+# ── Single symbols ────────────────────────────────────────────────────────────
+def pack(pattern: str) -> int:
+    """
+    Pack a dot/dash pattern into an int.  Raises ValueError on any other
+    character; a pattern longer than MAX_ELEMENTS packs to INVALID.
+    """
+    if pattern.strip(".-"):
+        raise ValueError(f"not a dot/dash pattern: {pattern!r}")
+    if len(pattern) > MAX_ELEMENTS:
+        return INVALID
+    return int("1" + pattern.translate(_BITS), 2)
+
+
+def unpack(code: int) -> str:
+    """Inverse of pack(): 5 -> '.-'."""
+    if code == WORD_SEP:
+        return "/"
+    if code == INVALID:
+        return ""
+    return bin(code)[3:].translate(_ELEMENTS)
+
+
+def length(code: int) -> int:
+    """Number of elements in a packed symbol."""
+    return code.bit_length() - 1
+
+
+def append(code: int, element: str) -> int:
+    """Add one element ('.' or '-') to a packed symbol."""
+    return (code << 1) | (element == "-")
+
+
+# ── Packed alphabet ───────────────────────────────────────────────────────────
+class PackedAlphabet:
+    """Packed encode/decode lookups compiled from a codec's table."""
+
+    def __init__(self, codec):
+        self.codec = codec
+        # Keyed by the codec's internal single-char form (prosigns -> PUA char)
+        self.char_to_code = {}
+        for ch, pattern in codec.table.items():
+            key = codec.token_chars.get(ch, ch)
+            self.char_to_code[key] = WORD_SEP if pattern == "/" else pack(pattern)
+        self.code_to_char = {}
+        for ch, code in self.char_to_code.items():
+            self.code_to_char.setdefault(code, ch)
+
+        # Code -> code point lookup, for vectorised decoding.
+        size = max(self.code_to_char) + 2
+        self._unknown_slot = size - 1
+        self._decode_lut = np.full(size, ord(UNKNOWN_CHAR), dtype=np.uint32)
+        for code, ch in self.code_to_char.items():
+            self._decode_lut[code] = ord(ch)
+
+        # Code point -> code lookup, for vectorised encoding.
+        cp_size = max(map(ord, self.char_to_code)) + 2
+        self._encode_lut = np.full(cp_size, INVALID, dtype=np.uint16)
+        for ch, code in self.char_to_code.items():
+            self._encode_lut[ord(ch)] = code
+
+    def pack_message(self, morse: str) -> np.ndarray:
+        """'.- / -...' -> uint16 array [5, 0, 24]."""
+        tokens = morse.split()
+        return np.fromiter(
+            (WORD_SEP if t == "/" else _pack_lenient(t) for t in tokens),
+            dtype=np.uint16, count=len(tokens),
+        )
+
+    def pack_text(self, text: str) -> np.ndarray:
+        """Encode text straight to a packed array (unknown chars -> INVALID)."""
+        text = self.codec.normalize(text)
+        cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        cps = np.minimum(cps, len(self._encode_lut) - 1)
+        return self._encode_lut[cps]
+
+    def decode(self, codes: np.ndarray) -> str:
+        """Vectorised decode of a packed array to text."""
+        codes = np.asarray(codes, dtype=np.uint16)
+        idx = np.minimum(codes, self._unknown_slot)
+        text = self._decode_lut[idx].tobytes().decode("utf-32-le")
+        if self.codec.token_chars:
+            text = text.translate(self.codec.expand_table)
+        return text
+
+
+def _pack_lenient(token: str) -> int:
+    try:
+        return pack(token)
+    except ValueError:
+        return INVALID
+
+
+# ── Vectorised comparison ─────────────────────────────────────────────────────
+def symbols_equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise symbol comparison of two equal-length packed arrays."""
+    return np.equal(a, b)
+
+
+def messages_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    return a.shape == b.shape and bool(np.array_equal(a, b))
+
+
+# ── Module-level defaults ────────────────────────────────────────────────────
+DEFAULT_ALPHABET = PackedAlphabet(DEFAULT_CODEC)
+
+CODE_TO_CHAR = DEFAULT_ALPHABET.code_to_char   # 5 -> 'A'
+CHAR_TO_CODE = DEFAULT_ALPHABET.char_to_code   # 'A' -> 5
+
+
+def pack_message(morse: str) -> np.ndarray:
+    return DEFAULT_ALPHABET.pack_message(morse)
+
+
+def pack_text(text: str) -> np.ndarray:
+    return DEFAULT_ALPHABET.pack_text(text)
+
+
+def decode(codes: np.ndarray) -> str:
+    return DEFAULT_ALPHABET.decode(codes)
@@ -0,0 +1,274 @@
+# morse_cli.py
+# Headless command line for the toolkit — never imports PyQt5, so it runs in
+# batch pipelines and on servers without a display.
+#
+#   python -m morse_cli encode -t "CQ DE TA1ABC"             # text  -> Morse
+#   python -m morse_cli decode morse.txt -o text.txt         # Morse -> text
+#   python -m morse_cli render-audio book.txt -o book.wav --wpm 20
+#   python -m morse_cli decode-image signal.png --to-text    # image -> Morse / text
+#   python -m morse_cli render-svg -t "... --- ..." -o sos.svg
+#   python -m morse_cli stats [--tool "WPM Trainer"] [--format csv]
+#   python -m morse_cli stats weak                           # per-character weak spots
+#
+# INPUT is a file or "-" for stdin (the default); -o writes to a file instead
+# of stdout.  Text is streamed in chunks (morse_codec.read_chunks), so encode,
+# decode and render-audio keep memory flat on inputs of any size.
+
+import argparse
+import csv
+import json
+import sys
+import wave
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import numpy as np
+
+import cw_audio
+import morse_codec
+import transliterate
+
+_STDIO = "-"
+_UNKNOWN = (morse_codec.UNKNOWN_SKIP, morse_codec.UNKNOWN_REPLACE,
+            morse_codec.UNKNOWN_STRICT)
+
+
+# ── I/O helpers ───────────────────────────────────────────────────────────────
+def _text_chunks(args):
+    """Text chunks from -t/--text, or from the INPUT file / stdin."""
+    if args.text is not None:
+        yield args.text
+        return
+    if args.input == _STDIO:
+        yield from morse_codec.read_chunks(sys.stdin)
+        return
+    with open(args.input, "r", encoding="utf-8", errors="replace") as f:
+        yield from morse_codec.read_chunks(f)
+
+
+@contextmanager
+def _text_output(path: str):
+    if path == _STDIO:
+        yield sys.stdout
+        sys.stdout.flush()
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            yield f
+
+
+def _write_lines(chunks, path: str):
+    with _text_output(path) as out:
+        for chunk in chunks:
+            out.write(chunk)
+        out.write("\n")
+
+
+def _morse_chunks(args):
+    """Morse chunks: the input itself, or the encoded text with --from-text."""
+    if getattr(args, "from_text", False):
+        codec, translit = transliterate.pipeline(args.language)
+        return codec.encode_stream(translit.stream(_text_chunks(args)), args.unknown)
+    return _text_chunks(args)
+
+
+# ── Commands ──────────────────────────────────────────────────────────────────
+def cmd_encode(args) -> int:
+    codec, translit = transliterate.pipeline(args.language)
+    _write_lines(codec.encode_stream(translit.stream(_text_chunks(args)), args.unknown),
+                 args.output)
+    return 0
+
+
+def cmd_decode(args) -> int:
+    codec = morse_codec.get_codec(transliterate.LANGUAGES[args.language][0])
+    _write_lines(codec.decode_stream(_text_chunks(args), args.unknown), args.output)
+    return 0
+
+
+def _pcm16(block: np.ndarray) -> bytes:
+    return (np.clip(block, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def cmd_render_audio(args) -> int:
+    blocks = cw_audio.build_audio_stream(
+        _morse_chunks(args), wpm=args.wpm, freq=args.freq, vol=args.volume,
+        farnsworth_wpm=args.farnsworth)
+    out = sys.stdout.buffer if args.output == _STDIO else open(args.output, "wb")
+    try:
+        if not out.seekable():
+            # A pipe: the WAV header needs the length up front, so buffer
+            blocks = [np.concatenate(list(blocks) or [np.zeros(0, np.float32)])]
+        with wave.open(out, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(cw_audio.SAMPLE_RATE)
+            if not out.seekable():
+                wav.setnframes(len(blocks[0]))
+            for block in blocks:
+                wav.writeframes(_pcm16(block))
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    return 0
+
+
+def cmd_decode_image(args) -> int:
+    from tools.morse_image import extract_morse, NO_SIGNAL
+
+    source = sys.stdin.buffer if args.input == _STDIO else args.input
+    morse = extract_morse(source, word_sep=" / ").strip(" /")
+    if not morse:
+        print(NO_SIGNAL, file=sys.stderr)
+        return 1
+    if args.to_text:
+        codec = morse_codec.get_codec(transliterate.LANGUAGES[args.language][0])
+        morse = codec.decode(morse, args.unknown)
+    _write_lines([morse], args.output)
+    return 0
+
+
+def cmd_render_svg(args) -> int:
+    from tools.morse_image import morse_to_svg
+
+    morse = "".join(_morse_chunks(args))
+    target = sys.stdout.buffer if args.output == _STDIO else args.output
+    try:
+        morse_to_svg(morse, target)
+    except ValueError as e:
+        print(f"render-svg: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+_SUMMARY_FIELDS = ("tool", "sessions", "attempts", "avg_accuracy", "sd_accuracy",
+                   "avg_wpm", "sd_wpm")
+_WEAK_FIELDS = ("char", "attempts", "accuracy", "p50_ms", "p90_ms", "confused_with")
+
+
+def _date_bounds(args):
+    """ISO --since / --until (inclusive days) -> store start / exclusive end."""
+    end = None
+    if args.until:
+        end = (date.fromisoformat(args.until) + timedelta(days=1)).isoformat()
+    return args.since, end
+
+
+def cmd_stats(args) -> int:
+    start, end = _date_bounds(args)
+    if args.view == "weak":
+        import event_log
+        import stats_analytics
+        events = stats_analytics.load_events(event_log.EventLog(), args.tool, start, end)
+        rows, fields = stats_analytics.char_stats(events), _WEAK_FIELDS
+    else:
+        import stats_store
+        store = stats_store.open_store(args.backend)
+        rows, fields = store.summary(args.tool, start, end), _SUMMARY_FIELDS
+
+    with _text_output(args.output) as out:
+        if args.format == "json":
+            json.dump(rows, out, ensure_ascii=False, indent=1)
+            out.write("\n")
+        elif args.format == "csv":
+            writer = csv.DictWriter(out, fields, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            _write_table(out, rows, fields)
+    return 0
+
+
+def _write_table(out, rows: list, fields: tuple):
+    def fmt(v):
+        return f"{v:.1f}" if isinstance(v, float) else str(v)
+    cells = [[fmt(r.get(f, "")) for f in fields] for r in rows]
+    widths = [max([len(f)] + [len(c[i]) for c in cells]) for i, f in enumerate(fields)]
+    out.write("  ".join(f.ljust(w) for f, w in zip(fields, widths)).rstrip() + "\n")
+    for c in cells:
+        out.write("  ".join(v.ljust(w) for v, w in zip(c, widths)).rstrip() + "\n")
+    if not rows:
+        out.write("(no data)\n")
+
+
+# ── Argument parsing ──────────────────────────────────────────────────────────
+def _add_io(p, input_help: str = "text file, or - for stdin (default)"):
+    p.add_argument("input", nargs="?", default=_STDIO, help=input_help)
+    p.add_argument("-t", "--text", help="use this string instead of INPUT")
+    p.add_argument("-o", "--output", default=_STDIO, help="output file (default stdout)")
+
+
+def _add_codec(p, unknown: str):
+    p.add_argument("-l", "--language", choices=sorted(transliterate.LANGUAGES),
+                   default="international", help="code table (default international)")
+    p.add_argument("--unknown", choices=_UNKNOWN, default=unknown,
+                   help=f"characters with no code (default {unknown})")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m morse_cli",
+        description="Morse / CW toolkit on the command line (no GUI)")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    p = sub.add_parser("encode", help="text -> Morse")
+    _add_io(p)
+    _add_codec(p, morse_codec.UNKNOWN_SKIP)
+    p.set_defaults(func=cmd_encode)
+
+    p = sub.add_parser("decode", help="Morse -> text")
+    _add_io(p, "Morse file ('/' between words), or - for stdin")
+    _add_codec(p, morse_codec.UNKNOWN_REPLACE)
+    p.set_defaults(func=cmd_decode)
+
+    p = sub.add_parser("render-audio", help="Morse (or text) -> 16-bit mono WAV")
+    _add_io(p, "Morse file, or - for stdin")
+    p.add_argument("--from-text", action="store_true", help="input is plain text")
+    _add_codec(p, morse_codec.UNKNOWN_SKIP)
+    p.add_argument("--wpm", type=int, default=cw_audio.DEFAULT_WPM)
+    p.add_argument("--farnsworth", type=int, default=0, metavar="WPM",
+                   help="character speed for Farnsworth timing (0 = off)")
+    p.add_argument("--freq", type=float, default=cw_audio.DEFAULT_FREQ, help="tone Hz")
+    p.add_argument("--volume", type=float, default=cw_audio.DEFAULT_VOL, help="0.0 - 1.0")
+    p.set_defaults(func=cmd_render_audio)
+
+    p = sub.add_parser("decode-image", help="green-bar Morse image -> Morse (or text)")
+    p.add_argument("input", nargs="?", default=_STDIO, help="image file, or - for stdin")
+    p.add_argument("-o", "--output", default=_STDIO, help="output file (default stdout)")
+    p.add_argument("--to-text", action="store_true",
+                   help="decode the Morse to text")
+    _add_codec(p, morse_codec.UNKNOWN_REPLACE)
+    p.set_defaults(func=cmd_decode_image)
+
+    p = sub.add_parser("render-svg", help="Morse (or text) -> SVG waveform")
+    _add_io(p, "Morse file, or - for stdin")
+    p.add_argument("--from-text", action="store_true", help="input is plain text")
+    _add_codec(p, morse_codec.UNKNOWN_SKIP)
+    p.set_defaults(func=cmd_render_svg)
+
+    p = sub.add_parser("stats", help="session stats summary or weak spots")
+    p.add_argument("view", nargs="?", choices=("summary", "weak"), default="summary")
+    p.add_argument("--tool", help="only this tool (e.g. \"WPM Trainer\")")
+    p.add_argument("--since", metavar="YYYY-MM-DD", help="first day (inclusive)")
+    p.add_argument("--until", metavar="YYYY-MM-DD", help="last day (inclusive)")
+    p.add_argument("--backend", choices=("jsonl", "sqlite"),
+                   help="stats store (default $MORSE_STATS_BACKEND or jsonl)")
+    p.add_argument("--format", choices=("table", "csv", "json"), default="table")
+    p.add_argument("-o", "--output", default=_STDIO, help="output file (default stdout)")
+    p.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:               # e.g. piped into `head`
+        sys.stderr.close()
+        return 0
+    except (OSError, ValueError, ImportError) as e:   # ImportError: Pillow / matplotlib
+        print(f"{args.command}: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+# morse_codec.py
+# Shared text <-> Morse codec used by every tool.
+# Encoding runs through a precompiled str.translate table (one C-level pass
+# over the text); decoding splits into tokens and maps them through a dict.
+#
+# Output format (same one cw_audio.build_audio expects):
+#   letters separated by ' ', words separated by ' / '   e.g. '.... .. / -.-'
+
+import re
+from itertools import repeat
+
+import dicts
+
+# ── Unknown-character policies ────────────────────────────────────────────────
+UNKNOWN_SKIP    = "skip"      # silently drop characters with no Morse code
+UNKNOWN_REPLACE = "replace"   # emit UNKNOWN_TOKEN / UNKNOWN_CHAR in their place
+UNKNOWN_STRICT  = "strict"    # raise ValueError
+
+UNKNOWN_TOKEN = "?"           # placeholder written into Morse output
+UNKNOWN_CHAR  = "?"           # placeholder written into decoded text
+
+_POLICIES = (UNKNOWN_SKIP, UNKNOWN_REPLACE, UNKNOWN_STRICT)
+
+# Private-use code point that stands in for "unknown" between the
+# pre-pass and the translate table, so it can never clash with real text.
+_UNKNOWN_SENTINEL = "\ue000"
+
+# First private-use code point handed out to multi-character tokens
+_TOKEN_BASE = 0xE100
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Newlines, tabs, NBSP and every other Unicode space fold to ' ' (a word gap)
+# before the table lookup, so line breaks separate words instead of vanishing.
+# (The characters str.isspace() accepts, spelled out to keep import cheap.)
+_WHITESPACE = str.maketrans(dict.fromkeys(
+    "\t\n\v\f\r\x1c\x1d\x1e\x1f\x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000", " "))
+
+# Sort key helper: order patterns dit-before-dah ('.' < '-' in ASCII is false).
+_DIT_FIRST = str.maketrans(".-", "01")
+
+
+# ── Decode trie ───────────────────────────────────────────────────────────────
+class TrieNode:
+    """
+    One Morse prefix.  `char` is the character this exact pattern decodes to
+    (or None); `candidates` lists every character reachable from here,
+    shortest pattern first, so live hints are a plain attribute read.
+    """
+    __slots__ = ("pattern", "char", "dit", "dah", "candidates")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.char = None
+        self.dit = None
+        self.dah = None
+        self.candidates = ()
+
+    def step(self, element: str):
+        """Child node for '.' or '-', or None if no code continues that way."""
+        return self.dit if element == "." else self.dah
+
+
+class MorseTrie:
+    """Binary prefix trie over a Morse table: dit = left, dah = right."""
+
+    def __init__(self, table: dict):
+        self.root = TrieNode("")
+        for ch, code in table.items():
+            if code == "/":
+                continue
+            node = self.root
+            for el in code:
+                attr = "dit" if el == "." else "dah"
+                child = getattr(node, attr)
+                if child is None:
+                    child = TrieNode(node.pattern + el)
+                    setattr(node, attr, child)
+                node = child
+            if node.char is None:          # first table entry wins on clashes
+                node.char = ch
+        self._fill_candidates(self.root)
+
+    def _fill_candidates(self, node: TrieNode) -> list:
+        key = (len(node.pattern), node.pattern.translate(_DIT_FIRST))
+        found = [(key, node.char)] if node.char else []
+        for child in (node.dit, node.dah):
+            if child is not None:
+                found.extend(self._fill_candidates(child))
+        found.sort()
+        node.candidates = tuple(ch for _, ch in found)
+        return found
+
+    def find(self, pattern: str):
+        node = self.root
+        for el in pattern:
+            node = node.step(el)
+            if node is None:
+                return None
+        return node
+
+
+class MorseCodec:
+    """Compiled encoder/decoder for one Morse code table."""
+
+    def __init__(self, table: dict):
+        self.table = dict(table)
+
+        # Multi-character keys (prosigns like '<AR>') are swapped for a
+        # private-use code point up front, so the translate table stays
+        # strictly one character -> one code.
+        self.token_chars = {}
+        for i, key in enumerate(k for k in self.table if len(k) > 1):
+            self.token_chars[key] = chr(_TOKEN_BASE + i)
+        self.expand_table = str.maketrans({c: k for k, c in self.token_chars.items()})
+        if self.token_chars:
+            by_length = sorted(self.token_chars, key=len, reverse=True)
+            self._token_re = re.compile("|".join(map(re.escape, by_length)))
+            self._token_starts = frozenset(k[0] for k in self.token_chars)
+            self._token_max = len(by_length[0])
+        else:
+            self._token_re = None
+            self._token_starts = frozenset()
+            self._token_max = 0
+
+        # ' ' is the word separator; every other key encodes to a letter.
+        self._encode_table = {
+            ord(self.token_chars.get(ch, ch)): code + " "
+            for ch, code in self.table.items()
+        }
+        self._encode_table[ord(_UNKNOWN_SENTINEL)] = UNKNOWN_TOKEN + " "
+
+        # First table entry wins when several share a pattern.
+        self.decode_table = {}
+        for ch, code in self.table.items():
+            self.decode_table.setdefault(code, ch)
+        self.trie = MorseTrie(self.table)
+
+        known = "".join(re.escape(self.token_chars.get(ch, ch)) for ch in self.table)
+        self._unknown_re = re.compile(f"[^{known}]")
+
+    def normalize(self, text: str) -> str:
+        """
+        Upper-case text, fold whitespace to ' ' and swap prosign tokens for
+        their internal chars.
+        """
+        text = text.upper().translate(_WHITESPACE)
+        if self._token_re is not None and any(c in text for c in self._token_starts):
+            text = self._token_re.sub(lambda m: self.token_chars[m.group()], text)
+        return text
+
+    # ── Encoding ──────────────────────────────────────────────────────────────
+    def _prepare(self, text: str, unknown: str) -> str:
+        text = self.normalize(text)
+        if unknown == UNKNOWN_SKIP:
+            return self._unknown_re.sub("", text)
+        if unknown == UNKNOWN_REPLACE:
+            return self._unknown_re.sub(_UNKNOWN_SENTINEL, text)
+        if unknown == UNKNOWN_STRICT:
+            m = self._unknown_re.search(text)
+            if m:
+                raise ValueError(f"No Morse code for {m.group()!r}")
+            return text
+        raise ValueError(f"Unknown policy {unknown!r}, expected one of {_POLICIES}")
+
+    def encode(self, text: str, unknown: str = UNKNOWN_SKIP) -> str:
+        """Encode text to a Morse string (trailing whitespace is not a word gap)."""
+        return self._prepare(text.rstrip(), unknown).translate(self._encode_table).rstrip(" ")
+
+    def encode_stream(self, chunks, unknown: str = UNKNOWN_SKIP):
+        """
+        Encode an iterable of text chunks, yielding Morse chunks.
+        Joining the output gives the same result as encode() on the joined input.
+        """
+        sep = ""
+        carry = ""
+        for chunk in chunks:
+            chunk, carry = self._split_partial_token(carry + chunk)
+            # Trailing whitespace waits for more text: at the very end of
+            # the input it is dropped, as encode() does.
+            text = chunk.rstrip()
+            carry = chunk[len(text):] + carry
+            out = self._prepare(text, unknown).translate(self._encode_table)
+            if out:
+                # Every code ends in ' '; hold the last one back so the
+                # stream never ends with a trailing separator.
+                yield sep + out[:-1]
+                sep = " "
+        carry = carry.rstrip()
+        if carry:
+            out = self._prepare(carry, unknown).translate(self._encode_table)
+            if out:
+                yield sep + out[:-1]
+
+    def _split_partial_token(self, text: str):
+        """Hold back a trailing '<A' that may be the start of a prosign."""
+        if not self._token_starts:
+            return text, ""
+        start = max(text.rfind(c) for c in self._token_starts)
+        if start < 0 or len(text) - start >= self._token_max:
+            return text, ""
+        tail = text[start:].upper()
+        if any(tok.startswith(tail) for tok in self.token_chars):
+            return text[:start], text[start:]
+        return text, ""
+
+    # ── Decoding ──────────────────────────────────────────────────────────────
+    def _decode_tokens(self, tokens: list, unknown: str) -> str:
+        if unknown == UNKNOWN_REPLACE:
+            return "".join(map(self.decode_table.get, tokens, repeat(UNKNOWN_CHAR)))
+        if unknown == UNKNOWN_SKIP:
+            return "".join(map(self.decode_table.get, tokens, repeat("")))
+        if unknown == UNKNOWN_STRICT:
+            try:
+                return "".join([self.decode_table[t] for t in tokens])
+            except KeyError as e:
+                raise ValueError(f"Unknown Morse token {e.args[0]!r}") from None
+        raise ValueError(f"Unknown policy {unknown!r}, expected one of {_POLICIES}")
+
+    def decode(self, morse: str, unknown: str = UNKNOWN_REPLACE) -> str:
+        """Decode a Morse string ('/' separates words) back to text."""
+        return self._decode_tokens(morse.split(), unknown)
+
+    def decode_stream(self, chunks, unknown: str = UNKNOWN_REPLACE):
+        """Decode an iterable of Morse chunks, yielding text chunks."""
+        tail = ""
+        for chunk in chunks:
+            tokens = (tail + chunk).split()
+            # A token touching the chunk end may continue in the next chunk.
+            if tokens and not chunk[-1:].isspace():
+                tail = tokens.pop()
+            else:
+                tail = ""
+            if tokens:
+                yield self._decode_tokens(tokens, unknown)
+        if tail:
+            yield self._decode_tokens([tail], unknown)
+
+
+# ── Code table registry ───────────────────────────────────────────────────────
+# Tables are merged in the order given (see dicts.CODE_TABLES) and each
+# combination is compiled only once.
+DEFAULT_TABLES  = ("itu", "punctuation", "prosigns")
+TURKISH_TABLES  = DEFAULT_TABLES + ("turkish",)
+GERMAN_TABLES   = DEFAULT_TABLES + ("german",)
+
+_codecs: dict = {}
+
+
+def get_codec(tables=DEFAULT_TABLES) -> MorseCodec:
+    """Compiled codec for a tuple of table names from dicts.CODE_TABLES."""
+    tables = tuple(tables)
+    codec = _codecs.get(tables)
+    if codec is None:
+        merged = {}
+        for name in tables:
+            for ch, code in dicts.CODE_TABLES[name].items():
+                merged.setdefault(ch, code)
+        codec = _codecs[tables] = MorseCodec(merged)
+    return codec
+
+
+# ── Module-level default codec ────────────────────────────────────────────────
+DEFAULT_CODEC = get_codec(DEFAULT_TABLES)
+
+# Morse pattern -> character, e.g. '.-' -> 'A'
+MORSE_TO_CHAR = DEFAULT_CODEC.decode_table
+
+
+def encode(text: str, unknown: str = UNKNOWN_SKIP) -> str:
+    return DEFAULT_CODEC.encode(text, unknown)
+
+
+def decode(morse: str, unknown: str = UNKNOWN_REPLACE) -> str:
+    return DEFAULT_CODEC.decode(morse, unknown)
+
+
+def encode_stream(chunks, unknown: str = UNKNOWN_SKIP):
+    return DEFAULT_CODEC.encode_stream(chunks, unknown)
+
+
+def decode_stream(chunks, unknown: str = UNKNOWN_REPLACE):
+    return DEFAULT_CODEC.decode_stream(chunks, unknown)
+
+
+def read_chunks(f, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield fixed-size chunks from an open text file."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
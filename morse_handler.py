@@ -1,50 +1,128 @@
 # morse_handler.py
-import dicts
+# Live Q/E keying for the Real-Time Morse Input tool: each element walks the
+# codec's prefix trie (so candidate hints are a node lookup), and decoded
+# text goes into an append-only TextBuffer that views follow incrementally.
 
-# Reverse the dict: morse pattern -> letter (e.g. '.-' -> 'A')
-MORSE_TO_CHAR = {v: k for k, v in dicts.MORSE_CODE_DICT.items()}
+from morse_codec import DEFAULT_CODEC
 
+# Change notifications sent by TextBuffer: listener(event, text)
+BUFFER_APPEND = "append"
+BUFFER_DELETE = "delete"
+BUFFER_CLEAR  = "clear"
 
-class MorseHandler:
+
+class TextBuffer:
+    """
+    List-backed, append-only decoded text.  Each append is one item (a
+    character, or a whole prosign like '<SK>'), so appending and deleting the
+    last item are O(1); listeners receive just the change so views can
+    update incrementally instead of re-rendering everything.
+    """
     def __init__(self):
+        self._items = []
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event, text=""):
+        for listener in self._listeners:
+            listener(event, text)
+
+    def append(self, text):
+        self._items.append(text)
+        self._notify(BUFFER_APPEND, text)
+
+    def delete_last(self):
+        if self._items:
+            self._notify(BUFFER_DELETE, self._items.pop())
+
+    def clear(self):
+        self._items.clear()
+        self._notify(BUFFER_CLEAR)
+
+    def text(self):
+        return "".join(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class MorseHandler:
+    def __init__(self, codec=DEFAULT_CODEC):
+        self.trie = codec.trie
         self.current_symbol = ""
-        self.decoded_text = ""
+        self.decoded = TextBuffer()
+        # One trie node per element typed; None once the prefix is invalid.
+        self._path = [self.trie.root]
 
     def handle_key(self, key_code):
         from PyQt5.QtCore import Qt
 
         if key_code == Qt.Key_Q:
-            self.current_symbol += "."
+            self._add_element(".")
         elif key_code == Qt.Key_E:
-            self.current_symbol += "-"
+            self._add_element("-")
         elif key_code == Qt.Key_Space:
             self._commit_current_symbol()
         elif key_code == Qt.Key_Backspace:
             self._handle_backspace()
         elif key_code == Qt.Key_Slash or key_code == Qt.Key_Tab:
-            self.decoded_text += " "
+            self.decoded.append(" ")
         else:
             return False
         return True
 
+    def _add_element(self, element):
+        self.current_symbol += element
+        node = self._path[-1]
+        self._path.append(node.step(element) if node is not None else None)
+
     def _commit_current_symbol(self):
         if self.current_symbol:
-            char = MORSE_TO_CHAR.get(self.current_symbol, '?')
-            self.decoded_text += char
-            self.current_symbol = ""
+            node = self._path[-1]
+            char = node.char if node is not None and node.char else '?'
+            self.decoded.append(char)
+            self._reset_symbol()
 
     def _handle_backspace(self):
         if self.current_symbol:
             self.current_symbol = self.current_symbol[:-1]
-        elif self.decoded_text:
-            self.decoded_text = self.decoded_text[:-1]
+            self._path.pop()
+        else:
+            self.decoded.delete_last()
+
+    def _reset_symbol(self):
+        self.current_symbol = ""
+        del self._path[1:]
+
+    # ── Live prefix state ─────────────────────────────────────────────────────
+    def is_valid_prefix(self):
+        """False as soon as the typed elements cannot lead to any character."""
+        return self._path[-1] is not None
+
+    def current_match(self):
+        """Character the current symbol would decode to right now, or None."""
+        node = self._path[-1]
+        return node.char if node is not None else None
+
+    def candidates(self):
+        """Characters still reachable from the current prefix, shortest first."""
+        node = self._path[-1]
+        if node is None or not self.current_symbol:
+            return ()
+        return node.candidates
 
     def get_morse_buffer(self):
         return self.current_symbol
 
     def get_decoded_text(self):
-        return self.decoded_text
+        return self.decoded.text()
 
     def clear(self):
-        self.current_symbol = ""
-        self.decoded_text = ""
+        self._reset_symbol()
+        self.decoded.clear()
@@ -1,27 +1,74 @@
 # session_stats.py
-# Session Progress & Stats — persistent JSON log of practice sessions.
+# Session Progress & Stats — persistent append-only log of practice sessions.
 # Records WPM, accuracy per tool, and overall progress over time.
+# Storage lives in stats_store.py (Qt-free); this module adds the viewer.
+# Writes go through stats_writer.py's background thread, so logging from a
+# closeEvent never blocks on disk I/O.
 
-import json
-import os
 import time
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
-    QFrame, QTabWidget
+    QPushButton, QTableView, QHeaderView, QAbstractItemView,
+    QFrame, QTabWidget, QComboBox, QDateEdit, QCheckBox, QLineEdit
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (
+    Qt, QDate, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+import event_log
+import stats_analytics
+import stats_charts
+import stats_store
+import stats_writer
+
+STATS_FILE = stats_store.STATS_FILE
+
+_ALL_TOOLS = "All tools"
+
+LOG_PAGE_SIZE = 500      # rows fetched from the store per fetchMore()
+CHART_SESSIONS = 20_000  # most recent sessions plotted at "Sessions" resolution
+SEARCH_DELAY_MS = 200    # debounce: the log is searched by the store
+
+_store = None
+_events = None
+_writer = None
+
+
+def _get_store():
+    # Opened on first use so migration / DB setup never runs at import.
+    # Backend is chosen by MORSE_STATS_BACKEND (jsonl | sqlite).
+    global _store
+    if _store is None:
+        _store = stats_store.open_store()
+    return _store
 
-_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-STATS_FILE   = os.path.join(_SCRIPT_DIR, "session_stats.json")
+
+def _get_writer():
+    # Also owns the event log, whose flushed batches it writes.
+    global _events, _writer
+    if _writer is None:
+        _events = event_log.EventLog()
+        _writer = stats_writer.start(_get_store(), _events)
+    return _writer
+
+
+def _get_events():
+    _get_writer()
+    return _events
+
+
+def _sync():
+    """Wait for queued writes, so reads see everything logged so far."""
+    if _writer is not None:
+        flush_events()
+        _writer.flush()
 
 
 # ── Public API (called by other modules) ──────────────────────────────────────
 def log_session(tool: str, correct: int, total: int, wpm: float = 0.0):
     """
-    Append one session record to the stats file.
+    Queue one session record for the stats file (written in the background).
 
     tool    : e.g. "Morse Exercise", "WPM Trainer", "Send Practice"
     correct : number of correct answers
@@ -36,24 +83,213 @@ def log_session(tool: str, correct: int, total: int, wpm: float = 0.0):
         "accuracy": round(correct / total * 100, 1) if total else 0.0,
         "wpm": round(wpm, 1),
     }
-    records = _load()
-    records.append(record)
-    _save(records)
+    _get_writer().append(record)
+    flush_events()
 
 
-def _load() -> list:
-    if os.path.exists(STATS_FILE):
-        try:
-            with open(STATS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            pass
-    return []
+def log_attempt(tool: str, target: str, response: str, latency_ms: float = 0.0,
+                **settings):
+    """
+    Record one answer in the per-character event log (see event_log.py).
+
+    target / response : expected text and what the user gave
+    latency_ms        : prompt-to-answer time
+    settings          : wpm, farnsworth, noise_db, qrm_hz where relevant
+    Rows are buffered; flush_events() (called by log_session and at exit)
+    queues them for the background writer.
+    """
+    _get_events().record_attempt(tool, target, response, latency_ms, **settings)
+
+
+def flush_events():
+    if _events is not None:
+        _events.flush()
+
 
+def _writer_warning() -> str:
+    """Totals-line note when background writes failed or were dropped."""
+    if _writer is None:
+        return ""
+    st = _writer.stats()
+    lost = st["dropped_records"] + st["dropped_rows"]
+    if not (st["failures"] or lost):
+        return ""
+    note = f"   |   ⚠ {st['failures']} failed writes"
+    if lost:
+        note += f", {st['dropped_records']} sessions / {st['dropped_rows']} events lost"
+    if st["last_error"]:
+        note += f" (last: {st['last_error']})"
+    return note
 
-def _save(records: list):
-    with open(STATS_FILE, "w", encoding="utf-8") as f:
-        json.dump(records, f, indent=2)
+
+def _load() -> list:
+    _sync()
+    return _get_store().load()
+
+
+# ── Table models ──────────────────────────────────────────────────────────────
+def _fmt_wpm(v) -> str:
+    return f"{v:.1f}" if v else "—"
+
+
+# (header, record key, display formatter)
+_LOG_COLUMNS = [
+    ("Date / Time", "timestamp", str),
+    ("Tool",        "tool",      str),
+    ("Correct",     "correct",   str),
+    ("Total",       "total",     str),
+    ("Accuracy %",  "accuracy",  lambda v: f"{v:.1f}"),
+]
+_SUMMARY_COLUMNS = [
+    ("Tool",           "tool",         str),
+    ("Sessions",       "sessions",     str),
+    ("Total Attempts", "attempts",     str),
+    ("Avg Accuracy %", "avg_accuracy", lambda v: f"{v:.1f}"),
+    ("Accuracy σ",     "sd_accuracy",  lambda v: f"{v:.1f}"),
+    ("Avg WPM",        "avg_wpm",      _fmt_wpm),
+]
+
+_CHAR_COLUMNS = [
+    ("Char",           "char",          str),
+    ("Attempts",       "attempts",      str),
+    ("Accuracy %",     "accuracy",      lambda v: f"{v:.1f}"),
+    ("Median ms",      "p50_ms",        lambda v: f"{v:.0f}" if v else "—"),
+    ("90th pct ms",    "p90_ms",        lambda v: f"{v:.0f}" if v else "—"),
+    ("Often taken as", "confused_with", str),
+]
+_WPM_COLUMNS = [
+    ("WPM",        "wpm",      lambda v: f"{v:g}"),
+    ("Characters", "attempts", str),
+    ("Accuracy %", "accuracy", lambda v: f"{v:.1f}"),
+]
+
+
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table over a list of dicts.  Qt.UserRole gives the raw value
+    so the sort proxy orders numbers numerically."""
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, key, fmt = self._columns[index.column()]
+        value = self._rows[index.row()].get(key, "")
+        if role == Qt.DisplayRole:
+            return fmt(value)
+        if role == Qt.UserRole:
+            return value
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section][0]
+        return None
+
+
+class SessionLogModel(RecordTableModel):
+    """
+    Session log that pages rows in from the store as the view scrolls.
+    Sorting and search run in the store (ORDER BY / LIKE for SQLite), so
+    they cover every matching session, not just the pages fetched so far.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(_LOG_COLUMNS, parent)
+        self._store = None
+        self._filters = {}
+        self._search = ""
+        self._order = None           # record key, None = store order
+        self._descending = True
+        self._total = 0
+
+    def load(self, store, filters: dict):
+        self._store = store
+        self._filters = filters
+        self._reset()
+
+    def set_search(self, text: str):
+        if text != self._search:
+            self._search = text
+            self._reset()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Called by the view when a header is clicked."""
+        self._order = self._columns[column][1] if column >= 0 else None
+        self._descending = order == Qt.DescendingOrder
+        self._reset()
+
+    def _reset(self):
+        if self._store is None:
+            return
+        self._total = self._store.count(search=self._search, **self._filters)
+        self.set_rows([])
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def total(self) -> int:
+        return self._total
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._store is None:
+            return
+        page = self._store.query(limit=LOG_PAGE_SIZE, offset=len(self._rows),
+                                 search=self._search, order=self._order,
+                                 descending=self._descending, **self._filters)
+        if not page:
+            self._total = len(self._rows)
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+
+def _make_view(model, stretch_col: int) -> QTableView:
+    """
+    Sortable, searchable table.  Fully loaded models get a sort / filter
+    proxy; SessionLogModel sorts and searches itself, in the store.
+    """
+    view = QTableView()
+    if isinstance(model, SessionLogModel):
+        view.setModel(model)
+        view.setSortingEnabled(True)
+        view.sortByColumn(0, Qt.DescendingOrder)    # the store's order: newest first
+    else:
+        proxy = QSortFilterProxyModel()
+        proxy.setSourceModel(model)
+        proxy.setSortRole(Qt.UserRole)
+        proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        proxy.setFilterKeyColumn(-1)          # search every column
+        view.setModel(proxy)
+        view.setSortingEnabled(True)
+        view.sortByColumn(-1, Qt.AscendingOrder)   # keep the store's order until clicked
+    hdr = view.horizontalHeader()
+    for i in range(model.columnCount()):
+        hdr.setSectionResizeMode(
+            i, QHeaderView.Stretch if i == stretch_col else QHeaderView.ResizeToContents
+        )
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.verticalHeader().setVisible(False)
+    return view
 
 
 # ── Stats Viewer Widget ────────────────────────────────────────────────────────
@@ -64,7 +300,7 @@ class StatsViewer(QWidget):
         self.setWindowTitle("Session Stats")
         self.setGeometry(200, 100, 700, 500)
         self._build_ui()
-        self._load_data()
+        self._reload()
 
     def _build_ui(self):
         layout = QVBoxLayout()
@@ -80,11 +316,42 @@ class StatsViewer(QWidget):
         header_row.addWidget(self.clear_btn)
 
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.clicked.connect(self._load_data)
+        self.refresh_btn.clicked.connect(self._reload)
         header_row.addWidget(self.refresh_btn)
 
         layout.addLayout(header_row)
 
+        # ── Filters ──
+        filter_row = QHBoxLayout()
+        filter_row.addWidget(QLabel("Tool:"))
+        self.tool_combo = QComboBox()
+        self.tool_combo.addItem(_ALL_TOOLS)
+        self.tool_combo.currentIndexChanged.connect(self._load_data)
+        filter_row.addWidget(self.tool_combo)
+
+        filter_row.addSpacing(12)
+        self.range_cb = QCheckBox("Date range:")
+        self.range_cb.toggled.connect(self._load_data)
+        filter_row.addWidget(self.range_cb)
+
+        today = QDate.currentDate()
+        self.from_date = QDateEdit(today.addMonths(-1))
+        self.to_date   = QDateEdit(today)
+        for edit in (self.from_date, self.to_date):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.dateChanged.connect(self._on_date_changed)
+        filter_row.addWidget(self.from_date)
+        filter_row.addWidget(QLabel("→"))
+        filter_row.addWidget(self.to_date)
+
+        filter_row.addSpacing(12)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search…")
+        filter_row.addWidget(self.search_box)
+        filter_row.addStretch()
+        layout.addLayout(filter_row)
+
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
         line.setStyleSheet("color: #444;")
@@ -93,6 +360,8 @@ class StatsViewer(QWidget):
         self.tabs = QTabWidget()
         self.tabs.addTab(self._make_log_tab(),      "Session Log")
         self.tabs.addTab(self._make_summary_tab(),  "Summary by Tool")
+        self.tabs.addTab(self._make_weak_tab(),     "Weak Spots")
+        self.tabs.addTab(self._make_chart_tab(),    "Progress Chart")
         layout.addWidget(self.tabs)
 
         self.setLayout(layout)
@@ -101,19 +370,15 @@ class StatsViewer(QWidget):
     def _make_log_tab(self) -> QWidget:
         w = QWidget()
         v = QVBoxLayout(w)
-        self.log_table = QTableWidget(0, 5)
-        self.log_table.setHorizontalHeaderLabels(
-            ["Date / Time", "Tool", "Correct", "Total", "Accuracy %"]
-        )
-        hdr = self.log_table.horizontalHeader()
-        hdr.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        hdr.setSectionResizeMode(1, QHeaderView.Stretch)
-        hdr.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        hdr.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        hdr.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.log_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.log_table.verticalHeader().setVisible(False)
+        self.log_model = SessionLogModel(self)
+        self.log_table = _make_view(self.log_model, stretch_col=1)
+        # Each search is a store query, so wait for a pause in typing
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(
+            lambda: self.log_model.set_search(self.search_box.text()))
+        self.search_box.textChanged.connect(self._search_timer.start)
         v.addWidget(self.log_table)
         return w
 
@@ -121,17 +386,10 @@ class StatsViewer(QWidget):
     def _make_summary_tab(self) -> QWidget:
         w = QWidget()
         v = QVBoxLayout(w)
-        self.summary_table = QTableWidget(0, 5)
-        self.summary_table.setHorizontalHeaderLabels(
-            ["Tool", "Sessions", "Total Attempts", "Avg Accuracy %", "Avg WPM"]
-        )
-        hdr = self.summary_table.horizontalHeader()
-        hdr.setSectionResizeMode(0, QHeaderView.Stretch)
-        for i in range(1, 5):
-            hdr.setSectionResizeMode(i, QHeaderView.ResizeToContents)
-        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.summary_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.summary_table.verticalHeader().setVisible(False)
+        self.summary_model = RecordTableModel(_SUMMARY_COLUMNS, self)
+        self.summary_table = _make_view(self.summary_model, stretch_col=0)
+        self.search_box.textChanged.connect(
+            self.summary_table.model().setFilterFixedString)
 
         self.label_totals = QLabel("")
         self.label_totals.setFont(QFont("Arial", 10))
@@ -141,54 +399,156 @@ class StatsViewer(QWidget):
         v.addWidget(self.label_totals)
         return w
 
+    # ── Weak spots tab ────────────────────────────────────────────────────────
+    def _make_weak_tab(self) -> QWidget:
+        w = QWidget()
+        v = QVBoxLayout(w)
+        self.char_model = RecordTableModel(_CHAR_COLUMNS, self)
+        self.char_table = _make_view(self.char_model, stretch_col=5)
+        self.search_box.textChanged.connect(
+            self.char_table.model().setFilterFixedString)
+        self.wpm_model = RecordTableModel(_WPM_COLUMNS, self)
+        self.wpm_table = _make_view(self.wpm_model, stretch_col=2)
+
+        self.label_confusions = QLabel("")
+        self.label_confusions.setWordWrap(True)
+        self.label_confusions.setFont(QFont("Arial", 10))
+        self.label_events = QLabel("")
+        self.label_events.setFont(QFont("Arial", 10))
+        self.label_events.setStyleSheet("color: #aaa; margin-top: 6px;")
+
+        v.addWidget(QLabel("Per character (worst first):"))
+        v.addWidget(self.char_table, 3)
+        v.addWidget(self.label_confusions)
+        v.addWidget(QLabel("Accuracy by speed:"))
+        v.addWidget(self.wpm_table, 2)
+        v.addWidget(self.label_events)
+        return w
+
+    def _load_weak_spots(self, filters: dict):
+        t0 = time.perf_counter()
+        events = stats_analytics.load_events(_get_events(), **filters)
+        labels, matrix = stats_analytics.confusion_matrix(events)
+        self.char_model.set_rows(
+            stats_analytics.char_stats(events, confusion=(labels, matrix)))
+        self.wpm_model.set_rows(stats_analytics.accuracy_by_wpm(events))
+        top = stats_analytics.top_confusions(labels, matrix, n=8)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+
+        self.label_confusions.setText(
+            "Most common mix-ups:  " + "   ".join(f"{t} → {r} ({n})" for t, r, n in top)
+            if top else "No mix-ups recorded."
+        )
+        self.label_events.setText(
+            f"{len(events['target'])} characters analysed in {elapsed_ms:.0f} ms"
+        )
+
+    # ── Progress chart tab ────────────────────────────────────────────────────
+    def _make_chart_tab(self) -> QWidget:
+        w = QWidget()
+        v = QVBoxLayout(w)
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Resolution:"))
+        self.resolution_combo = QComboBox()
+        self.resolution_combo.addItems(stats_charts.RESOLUTIONS)
+        self.resolution_combo.setCurrentText(stats_charts.RES_DAILY)
+        self.resolution_combo.currentIndexChanged.connect(self._load_chart)
+        row.addWidget(self.resolution_combo)
+        legend = QLabel(
+            f"<span style='color:{stats_charts.ACC_COLOR.name()}'>■ Accuracy %</span>"
+            f"&nbsp;&nbsp;<span style='color:{stats_charts.WPM_COLOR.name()}'>■ WPM</span>"
+            "&nbsp;&nbsp;&nbsp;(wheel: zoom, drag: pan, double-click: reset)")
+        legend.setStyleSheet("color: #888;")
+        row.addWidget(legend)
+        row.addStretch()
+        v.addLayout(row)
+        self.chart = stats_charts.ProgressChart()
+        v.addWidget(self.chart)
+        return w
+
+    def _load_chart(self):
+        store = _get_store()
+        filters = self._filters()
+        resolution = self.resolution_combo.currentText()
+        if resolution == stats_charts.RES_SESSIONS:
+            # Newest CHART_SESSIONS only; longer histories read best at
+            # daily / weekly resolution, which come from the aggregates
+            records = store.query(limit=CHART_SESSIONS, **filters)[::-1]   # oldest first
+            series = stats_charts.session_series(records)
+        else:
+            cells = store.daily(filters["tool"])
+            start, end = filters["start"], filters["end"]
+            cells = [(d, c) for d, c in cells
+                     if (not start or d >= start) and (not end or d < end)]
+            if resolution == stats_charts.RES_WEEKLY:
+                cells = stats_charts.rollup_weekly(cells)
+            series = stats_charts.rollup_series(cells)
+        self.chart.set_series(*series)
+
     # ── Data ──────────────────────────────────────────────────────────────────
+    def _filters(self) -> dict:
+        tool = self.tool_combo.currentText()
+        f = {"tool": None if tool == _ALL_TOOLS else tool, "start": None, "end": None}
+        if self.range_cb.isChecked():
+            f["start"] = self.from_date.date().toString(Qt.ISODate)
+            # Inclusive "to" date -> exclusive upper bound
+            f["end"] = self.to_date.date().addDays(1).toString(Qt.ISODate)
+        return f
+
+    def _on_date_changed(self):
+        if self.range_cb.isChecked():
+            self._load_data()
+
+    def _reload(self):
+        """Refresh button: re-read the tool list, then the data."""
+        _sync()
+        self._refresh_tool_list(_get_store())
+        self._load_data()
+
+    def _refresh_tool_list(self, store):
+        current = self.tool_combo.currentText()
+        self.tool_combo.blockSignals(True)
+        self.tool_combo.clear()
+        self.tool_combo.addItem(_ALL_TOOLS)
+        self.tool_combo.addItems(store.tools())
+        idx = self.tool_combo.findText(current)
+        self.tool_combo.setCurrentIndex(max(idx, 0))
+        self.tool_combo.blockSignals(False)
+
     def _load_data(self):
-        records = _load()
-
-        # Log tab (most recent first)
-        self.log_table.setRowCount(0)
-        for rec in reversed(records):
-            r = self.log_table.rowCount()
-            self.log_table.insertRow(r)
-            self.log_table.setItem(r, 0, QTableWidgetItem(rec.get("timestamp", "")))
-            self.log_table.setItem(r, 1, QTableWidgetItem(rec.get("tool", "")))
-            self.log_table.setItem(r, 2, QTableWidgetItem(str(rec.get("correct", 0))))
-            self.log_table.setItem(r, 3, QTableWidgetItem(str(rec.get("total", 0))))
-            acc = rec.get("accuracy", 0)
-            self.log_table.setItem(r, 4, QTableWidgetItem(f"{acc:.1f}"))
+        _sync()
+        store = _get_store()
+        filters = self._filters()
+
+        # Log tab (most recent first, paged in on scroll)
+        self.log_model.load(store, filters)
 
         # Summary tab
-        by_tool: dict[str, list] = {}
-        for rec in records:
-            tool = rec.get("tool", "Unknown")
-            by_tool.setdefault(tool, []).append(rec)
-
-        self.summary_table.setRowCount(0)
-        total_sessions = len(records)
-        total_attempts = sum(r.get("total", 0) for r in records)
-
-        for tool, recs in sorted(by_tool.items()):
-            sessions   = len(recs)
-            attempts   = sum(r.get("total", 0) for r in recs)
-            avg_acc    = sum(r.get("accuracy", 0) for r in recs) / sessions
-            wpm_vals   = [r.get("wpm", 0) for r in recs if r.get("wpm", 0) > 0]
-            avg_wpm    = sum(wpm_vals) / len(wpm_vals) if wpm_vals else 0
-
-            r = self.summary_table.rowCount()
-            self.summary_table.insertRow(r)
-            self.summary_table.setItem(r, 0, QTableWidgetItem(tool))
-            self.summary_table.setItem(r, 1, QTableWidgetItem(str(sessions)))
-            self.summary_table.setItem(r, 2, QTableWidgetItem(str(attempts)))
-            self.summary_table.setItem(r, 3, QTableWidgetItem(f"{avg_acc:.1f}"))
-            self.summary_table.setItem(r, 4, QTableWidgetItem(f"{avg_wpm:.1f}" if avg_wpm else "—"))
+        rows = store.summary(**filters)
+        self.summary_model.set_rows(rows)
+        total_sessions = sum(row["sessions"] for row in rows)
+        total_attempts = sum(row["attempts"] for row in rows)
 
         self.label_totals.setText(
             f"Total sessions: {total_sessions}   |   Total attempts: {total_attempts}"
+            + _writer_warning()
         )
 
+        # Weak spots tab
+        self._load_weak_spots(filters)
+
+        # Progress chart tab
+        self._load_chart()
+
     def _clear(self):
-        _save([])
-        self._load_data()
+        _sync()
+        _get_store().clear()
+        _get_events().clear()
+        self._reload()
+
+    def reset_session(self):
+        """Reused window (see main_menu.WindowPool): keep the filters, show fresh data."""
+        self._reload()
 
     def closeEvent(self, event):
         if self.return_callback:
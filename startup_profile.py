@@ -0,0 +1,388 @@
+# startup_profile.py
+# Built-in startup profiler — off unless asked for:
+#
+#   MORSE_PROFILE=1 python main_menu.py              # -> startup_profile.json
+#   python main_menu.py --profile [report.json]
+#
+# Records
+#   imports   per-module import time as a tree (total and self ms), timed by a
+#             meta-path finder that wraps each module's loader
+#   spans     named sections such as opening the audio device (see span())
+#   tools     per tool launched from the menu: import, construction (or reset
+#             of a pooled window) and time until the window's first paint
+# and at exit writes a JSON report plus a readable tree (same name, .txt),
+# also printed to stderr.  Stdlib only: main_menu installs it before Qt is
+# imported so that Qt's own import time shows up too.
+
+import atexit
+import contextlib
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+ENV            = "MORSE_PROFILE"       # 1 / path.json to enable
+FLAG           = "--profile"
+DEFAULT_REPORT = "startup_profile.json"
+TREE_MIN_MS    = 1.0                   # smaller imports are folded in the tree
+TOP_SELF       = 15                    # "slowest modules" list length
+
+_profiler = None
+
+
+# ── Import timing ─────────────────────────────────────────────────────────────
+class _Node:
+    __slots__ = ("name", "total", "children", "failed")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total = 0.0
+        self.children = []
+        self.failed = False
+
+    @property
+    def self_time(self) -> float:
+        return max(self.total - sum(c.total for c in self.children), 0.0)
+
+    def to_dict(self) -> dict:
+        d = {"module": self.name,
+             "total_ms": round(self.total * 1000, 3),
+             "self_ms": round(self.self_time * 1000, 3)}
+        if self.failed:
+            d["failed"] = True
+        if self.children:
+            d["children"] = [c.to_dict() for c in self.children]
+        return d
+
+
+class _TimedLoader:
+    """Proxy for a module loader that adds its create/exec time to a node."""
+
+    def __init__(self, loader, finder, node: _Node):
+        self._loader = loader
+        self._finder = finder
+        self._node = node
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        if create is None:
+            return None
+        with self._finder.timing(self._node):
+            return create(spec)
+
+    def exec_module(self, module):
+        try:
+            with self._finder.timing(self._node):
+                self._loader.exec_module(module)
+        finally:
+            # Hand the real loader back so isinstance checks / reloads work
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self):
+        self.roots = {}                 # thread name -> [top-level _Node]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            root = _Node(threading.current_thread().name)
+            with self._lock:
+                self.roots.setdefault(root.name, []).append(root)
+            stack = self._local.stack = [root]
+        return stack
+
+    @contextlib.contextmanager
+    def timing(self, node: _Node):
+        stack = self._stack()
+        stack.append(node)
+        t0 = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            node.failed = True
+            raise
+        finally:
+            node.total += time.perf_counter() - t0
+            stack.pop()
+
+    def find_spec(self, name, path, target=None):
+        t0 = time.perf_counter()
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            spec = find(name, path, target) if find is not None else None
+            if spec is not None:
+                break
+        else:
+            return None
+        # Namespace packages and legacy loaders are left untimed
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        node = _Node(name)
+        node.total = time.perf_counter() - t0           # path search counts too
+        self._stack()[-1].children.append(node)
+        spec.loader = _TimedLoader(spec.loader, self, node)
+        return spec
+
+    def top_level(self) -> dict:
+        with self._lock:
+            return {thread: [n for root in roots for n in root.children]
+                    for thread, roots in self.roots.items()}
+
+
+# ── Profiler ──────────────────────────────────────────────────────────────────
+class _Profiler:
+    def __init__(self, path: str):
+        self.path = path
+        self.t0 = time.perf_counter()
+        self.started = datetime.now()
+        self.imports = _ImportTimer()
+        self.spans = []
+        self.tools = []
+        self.marks = {}
+        self._lock = threading.Lock()
+        self._written = False
+
+    def ms(self, t: float) -> float:
+        return round((t - self.t0) * 1000, 3)
+
+    def add_span(self, name: str, start: float, end: float):
+        with self._lock:
+            self.spans.append({"name": name,
+                               "thread": threading.current_thread().name,
+                               "start_ms": self.ms(start),
+                               "ms": round((end - start) * 1000, 3)})
+
+    def report(self) -> dict:
+        imports = self.imports.top_level()
+        return {
+            "created": self.started.isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "argv": sys.argv,
+            "uptime_ms": self.ms(time.perf_counter()),
+            "marks": dict(self.marks),
+            "import_total_ms": round(sum(n.total for nodes in imports.values()
+                                         for n in nodes) * 1000, 3),
+            "imports": {thread: [n.to_dict() for n in nodes]
+                        for thread, nodes in imports.items() if nodes},
+            "spans": list(self.spans),
+            "tools": list(self.tools),
+        }
+
+    def write(self):
+        if self._written:
+            return
+        self._written = True
+        report = self.report()
+        text = format_tree(report)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        with open(os.path.splitext(self.path)[0] + ".txt", "w", encoding="utf-8") as f:
+            f.write(text)
+        print(text, file=sys.stderr)
+        print(f"startup profile written to {self.path}", file=sys.stderr)
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+def install(path: str = DEFAULT_REPORT) -> bool:
+    """Start profiling now; the report is written at exit.  Idempotent."""
+    global _profiler
+    if _profiler is None:
+        _profiler = _Profiler(path)
+        sys.meta_path.insert(0, _profiler.imports)
+        atexit.register(write_report)
+    return True
+
+
+def install_from_args(argv: list) -> bool:
+    """
+    Enable profiling from --profile [PATH] (removed from argv so Qt never
+    sees it) or from $MORSE_PROFILE.  Returns whether profiling is on.
+    """
+    path = None
+    for i, arg in enumerate(argv[1:], 1):
+        if arg == FLAG or arg.startswith(FLAG + "="):
+            if "=" in arg:
+                path, drop = arg.split("=", 1)[1], 1
+            elif i + 1 < len(argv) and argv[i + 1].endswith(".json"):
+                path, drop = argv[i + 1], 2
+            else:
+                path, drop = DEFAULT_REPORT, 1
+            del argv[i:i + drop]
+            break
+    if path is None:
+        value = os.environ.get(ENV, "").strip()
+        if value.lower() in ("", "0", "false", "no", "off"):
+            return False
+        path = value if value.endswith(".json") else DEFAULT_REPORT
+    return install(path)
+
+
+def enabled() -> bool:
+    return _profiler is not None
+
+
+def span(name: str):
+    """Context manager timing a named section; free when profiling is off."""
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _span(name)
+
+
+@contextlib.contextmanager
+def _span(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profiler.add_span(name, t0, time.perf_counter())
+
+
+def mark(name: str):
+    """Record a one-off milestone (first occurrence wins)."""
+    if _profiler is not None:
+        _profiler.marks.setdefault(name, _profiler.ms(time.perf_counter()))
+
+
+def write_report():
+    if _profiler is not None:
+        _profiler.write()
+
+
+# ── Tool launches ─────────────────────────────────────────────────────────────
+class _NullLaunch:
+    def step(self, name: str):
+        pass
+
+    def watch_paint(self, widget):
+        pass
+
+
+class _Launch(_NullLaunch):
+    """Times one tool launch: step() after each stage, then first paint."""
+
+    def __init__(self, label: str):
+        self.entry = {"tool": label, "start_ms": _profiler.ms(time.perf_counter())}
+        self._t0 = self._last = time.perf_counter()
+        _profiler.tools.append(self.entry)
+
+    def step(self, name: str):
+        now = time.perf_counter()
+        self.entry[f"{name}_ms"] = round((now - self._last) * 1000, 3)
+        self._last = now
+
+    def watch_paint(self, widget):
+        """Record first_paint_ms (from the click) once the widget has painted."""
+        _watch_paint(widget, self._painted)
+
+    def _painted(self):
+        self.entry["first_paint_ms"] = round((time.perf_counter() - self._t0) * 1000, 3)
+
+
+def launch(label: str):
+    """Timer for a tool launch; a no-op object when profiling is off."""
+    return _Launch(label) if _profiler is not None else _NullLaunch()
+
+
+def mark_first_paint(widget, name: str):
+    """mark(name) once `widget` has painted for the first time."""
+    if _profiler is not None:
+        _watch_paint(widget, lambda: mark(name))
+
+
+_watcher_class = None
+
+
+def _watch_paint(widget, callback):
+    # The watcher class is defined on first use so this module never
+    # imports Qt itself
+    global _watcher_class
+    if widget is None:
+        return
+    if _watcher_class is None:
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+
+        class PaintWatcher(QObject):
+            def __init__(self, widget, callback):
+                super().__init__(widget)
+                self._callback = callback
+
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    # Stamp once the paint event itself has been handled
+                    QTimer.singleShot(0, self._callback)
+                return False
+
+        _watcher_class = PaintWatcher
+    widget.installEventFilter(_watcher_class(widget, callback))
+
+
+# ── Readable tree ─────────────────────────────────────────────────────────────
+def _tree_lines(nodes: list, depth: int, out: list):
+    shown = [n for n in nodes if n["total_ms"] >= TREE_MIN_MS]
+    for n in sorted(shown, key=lambda n: -n["total_ms"]):
+        flag = "  (failed)" if n.get("failed") else ""
+        out.append(f"{n['total_ms']:9.1f} {n['self_ms']:9.1f}  "
+                   f"{'  ' * depth}{n['module']}{flag}")
+        _tree_lines(n.get("children", []), depth + 1, out)
+    rest = [n for n in nodes if n["total_ms"] < TREE_MIN_MS]
+    if rest:
+        out.append(f"{sum(n['total_ms'] for n in rest):9.1f} {'':9}  "
+                   f"{'  ' * depth}… {len(rest)} more")
+
+
+def _flatten(nodes: list, out: list):
+    for n in nodes:
+        out.append(n)
+        _flatten(n.get("children", []), out)
+
+
+def format_tree(report: dict) -> str:
+    out = [f"Startup profile  {report['created']}  (python {report['python']})", ""]
+    if report["marks"]:
+        out.append("Milestones (ms since start)")
+        for name, ms in sorted(report["marks"].items(), key=lambda kv: kv[1]):
+            out.append(f"{ms:9.1f}  {name}")
+        out.append("")
+    out.append(f"Imports: {report['import_total_ms']:.1f} ms total")
+    out.append(f"{'total ms':>9} {'self ms':>9}  module")
+    for thread, nodes in report["imports"].items():
+        if len(report["imports"]) > 1:
+            out.append(f"[{thread}]")
+        _tree_lines(nodes, 0, out)
+    flat = []
+    for nodes in report["imports"].values():
+        _flatten(nodes, flat)
+    if flat:
+        out += ["", "Slowest modules (self time)"]
+        for n in sorted(flat, key=lambda n: -n["self_ms"])[:TOP_SELF]:
+            out.append(f"{n['self_ms']:9.1f}  {n['module']}")
+    if report["spans"]:
+        out += ["", "Spans"]
+        for s in report["spans"]:
+            out.append(f"{s['ms']:9.1f}  {s['name']}  "
+                       f"(at {s['start_ms']:.0f} ms, {s['thread']})")
+    if report["tools"]:
+        out += ["", "Tool launches (ms)",
+                f"{'import':>9} {'build':>9} {'paint':>9}  tool"]
+        for t in report["tools"]:
+            cells = [t.get("import_ms"), t.get("construct_ms", t.get("reuse_ms")),
+                     t.get("first_paint_ms")]
+            reused = "  (reused window)" if "reuse_ms" in t else ""
+            out.append(" ".join(f"{c:9.1f}" if c is not None else f"{'–':>9}"
+                                for c in cells) + f"  {t['tool']}{reused}")
+    return "\n".join(out) + "\n"
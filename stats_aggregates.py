@@ -0,0 +1,154 @@
+# stats_aggregates.py
+# Running per-tool / per-day session aggregates, updated in O(1) per record.
+# Means and variances use Welford's online algorithm; cells are combined with
+# Chan's parallel merge, so date-range summaries only touch one cell per day.
+#
+# Cells are keyed by (day, tool); day ALL_TIME holds the all-time total for a
+# tool, so the plain per-tool summary is a direct lookup.
+
+import math
+
+ALL_TIME = "*"
+
+
+class RunningStat:
+    """Count / mean / M2 (sum of squared deviations) of a stream of values."""
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other: "RunningStat"):
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class Aggregate:
+    """Totals for one (day, tool) cell."""
+    __slots__ = ("sessions", "attempts", "correct", "accuracy", "wpm")
+
+    def __init__(self):
+        self.sessions = 0
+        self.attempts = 0
+        self.correct  = 0
+        self.accuracy = RunningStat()
+        self.wpm      = RunningStat()     # only sessions that report a WPM
+
+    def add(self, record: dict):
+        self.sessions += 1
+        self.attempts += record.get("total", 0)
+        self.correct  += record.get("correct", 0)
+        self.accuracy.add(record.get("accuracy", 0.0))
+        wpm = record.get("wpm", 0.0)
+        if wpm > 0:
+            self.wpm.add(wpm)
+
+    def merge(self, other: "Aggregate"):
+        self.sessions += other.sessions
+        self.attempts += other.attempts
+        self.correct  += other.correct
+        self.accuracy.merge(other.accuracy)
+        self.wpm.merge(other.wpm)
+
+    def to_row(self, tool: str) -> dict:
+        return {
+            "tool": tool,
+            "sessions": self.sessions,
+            "attempts": self.attempts,
+            "avg_accuracy": self.accuracy.mean,
+            "avg_wpm": self.wpm.mean,
+            "sd_accuracy": self.accuracy.std,
+            "sd_wpm": self.wpm.std,
+        }
+
+    # Flat tuple form, shared by the JSON sidecar and the SQLite table
+    def to_tuple(self) -> tuple:
+        a, w = self.accuracy, self.wpm
+        return (self.sessions, self.attempts, self.correct,
+                a.n, a.mean, a.m2, w.n, w.mean, w.m2)
+
+    @classmethod
+    def from_tuple(cls, t) -> "Aggregate":
+        agg = cls()
+        agg.sessions, agg.attempts, agg.correct = t[0], t[1], t[2]
+        agg.accuracy = RunningStat(t[3], t[4], t[5])
+        agg.wpm      = RunningStat(t[6], t[7], t[8])
+        return agg
+
+
+def day_of(record: dict) -> str:
+    return record.get("timestamp", "")[:10]
+
+
+def is_day_range(start, end) -> bool:
+    """True when a filter only uses whole days, so day cells can answer it."""
+    return all(v is None or len(v) == 10 for v in (start, end))
+
+
+class Aggregates:
+    def __init__(self):
+        self.cells: dict = {}     # (day, tool) -> Aggregate
+
+    def _cell(self, day: str, tool: str) -> Aggregate:
+        cell = self.cells.get((day, tool))
+        if cell is None:
+            cell = self.cells[(day, tool)] = Aggregate()
+        return cell
+
+    def add(self, record: dict):
+        tool = record.get("tool", "Unknown")
+        self._cell(day_of(record), tool).add(record)
+        self._cell(ALL_TIME, tool).add(record)
+
+    def clear(self):
+        self.cells.clear()
+
+    def summary(self, tool=None, start=None, end=None) -> list:
+        """Per-tool summary rows; start/end are whole ISO days, end exclusive."""
+        if start is None and end is None:
+            merged = {t: c for (d, t), c in self.cells.items() if d == ALL_TIME}
+        else:
+            merged = {}
+            for (d, t), c in self.cells.items():
+                if d == ALL_TIME or (start and d < start) or (end and d >= end):
+                    continue
+                merged.setdefault(t, Aggregate()).merge(c)
+        return [merged[t].to_row(t) for t in sorted(merged) if not tool or t == tool]
+
+    def daily(self, tool=None) -> list:
+        """[(day, Aggregate)] oldest first, merged over tools unless one is given."""
+        days: dict = {}
+        for (d, t), c in self.cells.items():
+            if d == ALL_TIME or (tool and t != tool):
+                continue
+            days.setdefault(d, Aggregate()).merge(c)
+        return sorted(days.items())
+
+    def to_json(self) -> list:
+        return [[d, t, *c.to_tuple()] for (d, t), c in self.cells.items()]
+
+    @classmethod
+    def from_json(cls, rows: list) -> "Aggregates":
+        aggs = cls()
+        for row in rows:
+            aggs.cells[(row[0], row[1])] = Aggregate.from_tuple(row[2:])
+        return aggs
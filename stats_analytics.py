@@ -0,0 +1,160 @@
+# stats_analytics.py
+# Per-character weakness analytics over the event log (event_log.py).
+# No Qt imports; everything is vectorised NumPy over the event columns, so a
+# million attempts take milliseconds:
+#   confusion_matrix()  target x response counts via one np.bincount
+#   char_stats()        per-character accuracy, latency percentiles and the
+#                       most common wrong answer
+#   accuracy_by_wpm()   accuracy curve over playback speed
+
+from datetime import datetime
+
+import numpy as np
+
+import event_log
+
+MISSING = "∅"            # label for "no / unrecognised response"
+
+_COLUMNS = ("ts", "tool", "target", "response", "correct", "latency_ms", "wpm")
+
+
+def _epoch(iso: str) -> float:
+    return datetime.fromisoformat(iso).timestamp()
+
+
+def load_events(log: event_log.EventLog, tool=None, start=None, end=None,
+                columns=_COLUMNS) -> dict:
+    """
+    Event columns filtered like the session log: tool name, and ISO
+    `start` / `end` (end exclusive, local time as in the session records).
+    """
+    events = log.load(columns)
+    mask = None
+    if tool:
+        mask = events["tool"] == event_log.tool_id(tool)
+    if start:
+        m = events["ts"] >= _epoch(start)
+        mask = m if mask is None else mask & m
+    if end:
+        m = events["ts"] < _epoch(end)
+        mask = m if mask is None else mask & m
+    if mask is None:
+        return events
+    return {c: v[mask] for c, v in events.items()}
+
+
+def char_label(cp: int) -> str:
+    return MISSING if cp == 0 else chr(cp)
+
+
+# ── Confusion matrix ──────────────────────────────────────────────────────────
+def confusion_matrix(events: dict):
+    """
+    (labels, matrix): labels are the code points seen as target or response
+    (0 = missing), matrix[i, j] counts target labels[i] answered as labels[j].
+    """
+    target, response = events["target"], events["response"]
+    if not len(target):
+        return np.zeros(0, dtype=np.uint32), np.zeros((0, 0), dtype=np.int64)
+    # Dense re-index through a code point LUT — linear, no sort
+    size = int(max(target.max(), response.max())) + 1
+    seen = np.bincount(target, minlength=size) + np.bincount(response, minlength=size)
+    labels = np.flatnonzero(seen).astype(np.uint32)
+    lut = np.zeros(size, dtype=np.intp)
+    lut[labels] = np.arange(len(labels))
+    k = len(labels)
+    flat = lut[target] * k + lut[response]
+    return labels, np.bincount(flat, minlength=k * k).reshape(k, k)
+
+
+def top_confusions(labels, matrix, n: int = 10) -> list:
+    """[(target, response, count)] of the most frequent wrong answers."""
+    off = matrix.copy()
+    np.fill_diagonal(off, 0)
+    flat = np.argsort(off, axis=None)[::-1][:n]
+    rows, cols = np.unravel_index(flat, off.shape)
+    return [(char_label(labels[r]), char_label(labels[c]), int(off[r, c]))
+            for r, c in zip(rows, cols) if off[r, c]]
+
+
+# ── Per-character stats ───────────────────────────────────────────────────────
+_GROUP_STRIDE = float(1 << 24)      # > any latency in ms we care about
+
+
+def _group_percentiles(groups, values, n_groups, percentiles) -> np.ndarray:
+    """
+    Linear-interpolated percentiles of `values` within each group id.
+    One plain sort of group * stride + value orders by group then value
+    (much cheaper than lexsort / argsort); the value is the key minus the
+    group offset.
+    """
+    values = np.minimum(values, _GROUP_STRIDE - 1)
+    keys = np.sort(groups * _GROUP_STRIDE + values)
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    out = np.zeros((len(percentiles), n_groups))
+    has = np.flatnonzero(counts)
+    offset = has * _GROUP_STRIDE
+    for i, p in enumerate(percentiles):
+        pos = (counts[has] - 1) * (p / 100.0)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.minimum(lo + 1, counts[has] - 1)
+        frac = pos - lo
+        base = starts[has]
+        out[i, has] = ((keys[base + lo] - offset) * (1 - frac)
+                       + (keys[base + hi] - offset) * frac)
+    return out
+
+
+def char_stats(events: dict, percentiles=(50, 90), confusion=None) -> list:
+    """
+    One row per target character, worst accuracy first:
+    char, attempts, accuracy (%), latency percentiles (p50_ms, p90_ms, …)
+    and confused_with (most common wrong answer, "" if none).
+    Pass `confusion` (from confusion_matrix) to avoid recomputing it.
+    """
+    labels, matrix = confusion if confusion is not None else confusion_matrix(events)
+    if not len(labels):
+        return []
+    attempts = matrix.sum(axis=1)
+    correct = np.diag(matrix)
+    off = matrix.copy()
+    np.fill_diagonal(off, 0)
+    worst = off.argmax(axis=1)
+
+    # Latency per target, ignoring attempts that didn't time the answer
+    lut = np.zeros(int(labels.max()) + 1, dtype=np.intp)
+    lut[labels] = np.arange(len(labels))
+    timed = events["latency_ms"] > 0
+    lat = _group_percentiles(lut[events["target"][timed]],
+                             events["latency_ms"][timed].astype(np.float64),
+                             len(labels), percentiles)
+
+    rows = []
+    for i in np.flatnonzero(attempts):
+        row = {
+            "char": char_label(labels[i]),
+            "attempts": int(attempts[i]),
+            "accuracy": float(correct[i] / attempts[i] * 100),
+            "confused_with": char_label(labels[worst[i]]) if off[i, worst[i]] else "",
+        }
+        for j, p in enumerate(percentiles):
+            row[f"p{p}_ms"] = float(lat[j, i])
+        rows.append(row)
+    rows.sort(key=lambda r: (r["accuracy"], -r["attempts"]))
+    return rows
+
+
+# ── Accuracy vs speed ─────────────────────────────────────────────────────────
+def accuracy_by_wpm(events: dict, bin_width: float = 1.0) -> list:
+    """[{wpm, attempts, accuracy}] for events played at a known speed."""
+    wpm = events["wpm"]
+    has = wpm > 0
+    if not has.any():
+        return []
+    bins = np.round(wpm[has] / bin_width).astype(np.intp)
+    total = np.bincount(bins)
+    right = np.bincount(bins, weights=events["correct"][has])
+    return [{"wpm": float(b * bin_width), "attempts": int(total[b]),
+             "accuracy": float(right[b] / total[b] * 100)}
+            for b in np.flatnonzero(total)]
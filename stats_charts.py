@@ -0,0 +1,247 @@
+# stats_charts.py
+# Progress chart for the stats viewer — plain QPainter, no matplotlib.
+#
+# Series are downsampled with Largest-Triangle-Three-Buckets (LTTB) to about
+# one point per horizontal pixel of the visible range, so drawing costs the
+# same for ten sessions or ten years of them.  Daily and weekly series come
+# from the store's running aggregates (stats_aggregates.py) rather than the
+# raw log.  Wheel zooms around the cursor, drag pans, double-click resets.
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QPen, QColor, QFont
+from PyQt5.QtCore import Qt, QPointF, QRectF, QLineF
+
+from stats_aggregates import Aggregate
+
+RES_SESSIONS = "Sessions"
+RES_DAILY    = "Daily"
+RES_WEEKLY   = "Weekly"
+RESOLUTIONS  = (RES_SESSIONS, RES_DAILY, RES_WEEKLY)
+
+_SECONDS_PER_DAY = 86400.0
+
+ACC_COLOR  = QColor("#4fc3f7")
+WPM_COLOR  = QColor("#ffcc80")
+GRID_COLOR = QColor("#2a2a4a")
+TEXT_COLOR = QColor("#aaaacc")
+
+
+# ── Downsampling ──────────────────────────────────────────────────────────────
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int):
+    """
+    Largest-Triangle-Three-Buckets: keep n_out points (first and last always)
+    that best preserve the visual shape of the line.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Third vertex: average of the next bucket (the last point at the end)
+        if i + 1 < n_out - 2:
+            cx, cy = mean_x[i + 1], mean_y[i + 1]
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - cx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy - ay))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return x[idx], y[idx]
+
+
+# ── Series ────────────────────────────────────────────────────────────────────
+class Series:
+    """x in days since the epoch; y values, sorted by x."""
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.x)
+
+
+def session_series(records: list):
+    """(accuracy, wpm) series, one point per session (wpm only where logged)."""
+    if not records:
+        return Series([], []), Series([], [])
+    ts = np.array([r["timestamp"] for r in records], dtype="datetime64[s]")
+    x = ts.astype(np.float64) / _SECONDS_PER_DAY
+    acc = np.array([r.get("accuracy", 0.0) for r in records], dtype=np.float64)
+    wpm = np.array([r.get("wpm", 0.0) for r in records], dtype=np.float64)
+    order = np.argsort(x, kind="stable")
+    x, acc, wpm = x[order], acc[order], wpm[order]
+    has = wpm > 0
+    return Series(x, acc), Series(x[has], wpm[has])
+
+
+def rollup_weekly(daily: list) -> list:
+    """[(day, Aggregate)] -> [(monday, Aggregate)] merged per ISO week."""
+    weeks: dict = {}
+    for day, agg in daily:
+        d = np.datetime64(day, "D")
+        monday = d - (d.astype(np.int64) + 3) % 7      # 1970-01-01 was a Thursday
+        weeks.setdefault(str(monday), Aggregate()).merge(agg)
+    return sorted(weeks.items())
+
+
+def rollup_series(cells: list):
+    """(accuracy, wpm) series from [(day, Aggregate)] rollups."""
+    if not cells:
+        return Series([], []), Series([], [])
+    x = np.array([d for d, _ in cells], dtype="datetime64[D]").astype(np.float64)
+    acc = np.array([c.accuracy.mean for _, c in cells])
+    wpm = np.array([c.wpm.mean for _, c in cells])
+    has = np.array([c.wpm.n > 0 for _, c in cells], dtype=bool)
+    return Series(x, acc), Series(x[has], wpm[has])
+
+
+def _day_label(x: float) -> str:
+    return str(np.datetime64(int(np.floor(x)), "D"))
+
+
+# ── Chart widget ──────────────────────────────────────────────────────────────
+class ProgressChart(QWidget):
+    """Accuracy % (left axis) and WPM (right axis) over time."""
+
+    MARGIN_L, MARGIN_R, MARGIN_T, MARGIN_B = 44, 44, 14, 28
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(220)
+        self._acc = Series([], [])
+        self._wpm = Series([], [])
+        self._full = (0.0, 1.0)
+        self._view = (0.0, 1.0)
+        self._wpm_max = 10.0
+        self._cache_key = None
+        self._cache = ((np.empty(0), np.empty(0)), (np.empty(0), np.empty(0)))
+        self._drag_x = None
+
+    def set_series(self, accuracy: Series, wpm: Series):
+        self._acc, self._wpm = accuracy, wpm
+        xs = [s.x for s in (accuracy, wpm) if len(s)]
+        if xs:
+            lo = min(x[0] for x in xs)
+            hi = max(x[-1] for x in xs)
+            pad = max((hi - lo) * 0.02, 0.5)
+            self._full = (lo - pad, hi + pad)
+        else:
+            self._full = (0.0, 1.0)
+        self._view = self._full
+        self._wpm_max = max(10.0, float(np.ceil(wpm.y.max() / 5) * 5)) if len(wpm) else 10.0
+        self._cache_key = None
+        self.update()
+
+    # ── Geometry ──────────────────────────────────────────────────────────────
+    def _plot_rect(self) -> QRectF:
+        return QRectF(self.MARGIN_L, self.MARGIN_T,
+                      max(1, self.width() - self.MARGIN_L - self.MARGIN_R),
+                      max(1, self.height() - self.MARGIN_T - self.MARGIN_B))
+
+    def _visible(self):
+        """Downsampled visible points, recomputed only on zoom / resize / data."""
+        rect = self._plot_rect()
+        key = (self._view, int(rect.width()))
+        if key != self._cache_key:
+            x0, x1 = self._view
+            out = []
+            for s in (self._acc, self._wpm):
+                # One point either side of the view so lines run to the edges
+                i0 = max(np.searchsorted(s.x, x0) - 1, 0)
+                i1 = min(np.searchsorted(s.x, x1) + 1, len(s))
+                out.append(lttb(s.x[i0:i1], s.y[i0:i1], int(rect.width())))
+            self._cache_key, self._cache = key, tuple(out)
+        return self._cache
+
+    def _segments(self, x, y, y_max, rect) -> list:
+        # Separate segments rather than one polyline: Qt strokes a wide,
+        # self-intersecting polyline as a single outline, which is ~100x slower.
+        x0, x1 = self._view
+        px = (rect.left() + (x - x0) / (x1 - x0) * rect.width()).tolist()
+        py = (rect.bottom() - np.clip(y / y_max, 0, 1) * rect.height()).tolist()
+        return [QLineF(px[i], py[i], px[i + 1], py[i + 1]) for i in range(len(px) - 1)]
+
+    # ── Painting ──────────────────────────────────────────────────────────────
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        rect = self._plot_rect()
+        p.setFont(QFont("Arial", 8))
+
+        # Grid + axes labels
+        for i in range(5):
+            frac = i / 4
+            y = rect.bottom() - frac * rect.height()
+            p.setPen(QPen(GRID_COLOR, 1))
+            p.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+            p.setPen(ACC_COLOR)
+            p.drawText(QRectF(0, y - 8, self.MARGIN_L - 6, 16),
+                       Qt.AlignRight | Qt.AlignVCenter, f"{frac * 100:.0f}%")
+            p.setPen(WPM_COLOR)
+            p.drawText(QRectF(rect.right() + 6, y - 8, self.MARGIN_R - 6, 16),
+                       Qt.AlignLeft | Qt.AlignVCenter, f"{frac * self._wpm_max:.0f}")
+
+        x0, x1 = self._view
+        p.setPen(TEXT_COLOR)
+        for frac, align in ((0.0, Qt.AlignLeft), (0.5, Qt.AlignHCenter), (1.0, Qt.AlignRight)):
+            left = rect.left() + frac * rect.width() - 120 * frac
+            p.drawText(QRectF(left, rect.bottom() + 6, 120, 16),
+                       align | Qt.AlignTop, _day_label(x0 + frac * (x1 - x0)))
+
+        (ax, ay), (wx, wy) = self._visible()
+        if not len(ax) and not len(wx):
+            p.setPen(TEXT_COLOR)
+            p.drawText(rect, Qt.AlignCenter, "No sessions to chart yet.")
+            return
+        p.setClipRect(rect)
+        p.setPen(QPen(ACC_COLOR, 1.6))
+        p.drawLines(self._segments(ax, ay, 100.0, rect))
+        p.setPen(QPen(WPM_COLOR, 1.6))
+        p.drawLines(self._segments(wx, wy, self._wpm_max, rect))
+
+    # ── Zoom / pan ────────────────────────────────────────────────────────────
+    def _x_at(self, px: float) -> float:
+        rect = self._plot_rect()
+        x0, x1 = self._view
+        return x0 + (px - rect.left()) / rect.width() * (x1 - x0)
+
+    def _set_view(self, x0: float, x1: float):
+        lo, hi = self._full
+        span = min(max(x1 - x0, 1 / 24), hi - lo)      # no closer than an hour
+        x0 = min(max(x0, lo), hi - span)
+        self._view = (x0, x0 + span)
+        self.update()
+
+    def wheelEvent(self, event):
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        anchor = self._x_at(event.pos().x())
+        x0, x1 = self._view
+        self._set_view(anchor - (anchor - x0) * factor, anchor + (x1 - anchor) * factor)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_x = event.pos().x()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_x is not None:
+            shift = self._x_at(self._drag_x) - self._x_at(event.pos().x())
+            self._drag_x = event.pos().x()
+            x0, x1 = self._view
+            self._set_view(x0 + shift, x1 + shift)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self._view = self._full
+        self.update()
@@ -0,0 +1,635 @@
+# stats_store.py
+# Storage backend for session stats — no Qt imports, so it can be used from
+# scripts and the command line as well as from the GUI.
+#
+# Format: JSON lines, one session record per line, append-only.  Each append
+# is a single write() on an O_APPEND descriptor followed by fsync, so a crash
+# can at worst leave one torn last line, which readers skip and compaction
+# removes.  The old whole-file JSON array is read in place until the first
+# write, which migrates it — read-only uses (morse_cli stats) never touch it.
+#
+# Optional SQLite backend (MORSE_STATS_BACKEND=sqlite): WAL mode so several
+# toolkit instances can write at once, indexes on timestamp and tool, and
+# summaries / filters computed with SQL aggregates instead of in Python.
+#
+# Both backends share one interface:
+#   append(record), append_many(records), load(), clear(), compact(), flush(),
+#   tools(), query(tool, start, end, limit, offset, search, order, descending),
+#   count(tool, start, end, search), summary(tool, start, end), daily(tool)
+# `start` / `end` are ISO date or datetime strings; `end` is exclusive.
+# `search` is a case-insensitive substring of the timestamp or tool name;
+# `order` is a record key from SORT_KEYS (default: newest first).
+#
+# Per-tool / per-day running aggregates (stats_aggregates.py) are updated in
+# memory on every append and persisted next to the log on compaction and
+# flush(), so summaries over whole days never rescan the history.  The sidecar
+# records how much of the log it covers (byte offset + a checksum of the bytes
+# just before it); on load only the records appended after that are read.
+#
+# Stores are safe to share between threads (stats_writer.py appends from a
+# background thread while the viewer reads) and between processes: the JSONL
+# store takes an advisory lock (file_lock.py) around every read-modify-write,
+# and whole-file rewrites go through temp file + rename; SQLite does its own
+# locking.
+
+import functools
+import json
+import os
+import sqlite3
+import threading
+import zlib
+
+from file_lock import FileLock
+
+from stats_aggregates import Aggregate, Aggregates, ALL_TIME, is_day_range
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATS_FILE        = os.path.join(_SCRIPT_DIR, "session_stats.jsonl")
+LEGACY_STATS_FILE = os.path.join(_SCRIPT_DIR, "session_stats.json")
+STATS_DB          = os.path.join(_SCRIPT_DIR, "session_stats.db")
+
+BACKEND_JSONL  = "jsonl"
+BACKEND_SQLITE = "sqlite"
+BACKEND_ENV    = "MORSE_STATS_BACKEND"
+
+COMPACT_EVERY = 500      # appends between automatic compactions (and sidecar saves)
+_CHECK_BYTES  = 256      # log bytes checksummed to recognise a covered prefix
+
+# Sortable record keys, with the value used when a record lacks one
+SORT_KEYS = {"timestamp": "", "tool": "Unknown", "correct": 0, "total": 0,
+             "accuracy": 0.0, "wpm": 0.0}
+
+# Read access is only needed to peek at the last byte before appending.
+_APPEND_FLAGS = os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _locked(method):
+    """Run a JsonlStore method under the store's thread + process lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class JsonlStore:
+    def __init__(self, path: str = STATS_FILE, legacy_path: str = LEGACY_STATS_FILE):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.agg_path = os.path.splitext(path)[0] + ".agg.json"
+        self._lock = FileLock(path + ".lock")
+        # In-memory aggregates, the log (mtime, size) they were last checked
+        # against, and the prefix they cover: (offset, checksum)
+        self._aggs, self._aggs_key = None, None
+        self._aggs_covers = (0, 0)
+        self._aggs_dirty = False
+        self._appends = 0
+        # Parsed records, reused until the file's (mtime, size) changes
+        self._cache_key = None
+        self._cache = []
+        self._filter_cache = (None, None, [])
+        self._order_cache = (None, None, [])
+        self._legacy_aggs = (None, None)      # (records, aggregates)
+
+    # ── Migration ─────────────────────────────────────────────────────────────
+    def _legacy(self) -> bool:
+        """True while only the old JSON array file exists."""
+        return not os.path.exists(self.path) and os.path.exists(self.legacy_path)
+
+    def _read_legacy(self) -> list:
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return []
+        return records if isinstance(records, list) else []
+
+    @_locked
+    def _migrate(self):
+        """One-time conversion of the old JSON array file, before the first write."""
+        if not self._legacy():
+            return
+        records = self._read_legacy()
+        if not records:
+            return
+        self._rewrite(records)
+        try:
+            os.replace(self.legacy_path, self.legacy_path + ".migrated")
+        except OSError:
+            pass
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+    def append(self, record: dict):
+        self.append_many([record])
+
+    @_locked
+    def append_many(self, records: list):
+        """Append records with a single write + fsync."""
+        if not records:
+            return
+        self._migrate()
+        aggs = self._aggregates()        # validated against the pre-append size
+        data = "".join(_dump(r) for r in records).encode("utf-8")
+        fd = os.open(self.path, _APPEND_FLAGS, 0o644)
+        try:
+            if not _ends_with_newline(fd):
+                data = b"\n" + data      # never glue onto a torn last line
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Reads back just what was written (and a torn line before it, if any)
+        self._catch_up(aggs, *self._aggs_covers, self._file_key())
+        self._appends += len(records)
+        if self._appends >= COMPACT_EVERY:
+            self.compact()
+
+    @_locked
+    def compact(self):
+        """Rewrite the log without torn / unparsable lines; save the aggregates."""
+        self._appends = 0
+        self._migrate()
+        records, bad = self._read()
+        if bad:
+            self._rewrite(records)
+        else:
+            self._save_aggregates()
+
+    @_locked
+    def flush(self):
+        """Persist the in-memory aggregates (called when the writer closes)."""
+        self._save_aggregates()
+
+    @_locked
+    def clear(self):
+        self._rewrite([])
+        if os.path.exists(self.legacy_path):
+            try:
+                os.replace(self.legacy_path, self.legacy_path + ".migrated")
+            except OSError:
+                pass
+
+    def _rewrite(self, records: list):
+        """Atomically replace the whole log (temp file + fsync + rename)."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(_dump(r) for r in records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._aggs_dirty = True
+        self._catch_up(Aggregates(), 0, 0, self._file_key())
+        self._save_aggregates()
+
+    # ── Aggregates ────────────────────────────────────────────────────────────
+    def _aggregates(self) -> Aggregates:
+        """
+        Running aggregates for the current log.  What we hold in memory (or
+        else the sidecar) is brought up to date by reading just the records
+        appended since; if the covered prefix no longer matches (the log was
+        rewritten or replaced) they are rebuilt from the whole history once.
+        """
+        if self._legacy():
+            # Not migrated yet: aggregate the old file in memory, save nothing
+            records = self.load()
+            cached_records, aggs = self._legacy_aggs
+            if cached_records is not records:
+                aggs = Aggregates()
+                for r in records:
+                    aggs.add(r)
+                self._legacy_aggs = (records, aggs)
+            return aggs
+        key = self._file_key()
+        if self._aggs is not None and self._aggs_key == key:
+            return self._aggs        # nobody (in any process) touched the log
+        if self._aggs is not None:
+            known = (self._aggs, *self._aggs_covers)
+        else:
+            known = self._read_aggregates()
+        if known is not None and self._catch_up(*known, key):
+            return self._aggs
+        self._catch_up(Aggregates(), 0, 0, key)
+        self._save_aggregates()      # a full rebuild is worth keeping at once
+        return self._aggs
+
+    def _catch_up(self, aggs: Aggregates, offset: int, check: int, key) -> bool:
+        """Add the records after byte `offset`; False if that prefix is gone."""
+        size = key[1] if key else 0
+        if offset > size:
+            return False
+        tail = b""
+        if key is not None:
+            try:
+                fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except OSError:
+                return False
+            try:
+                if _tail_check(fd, offset) != check:
+                    return False
+                os.lseek(fd, offset, os.SEEK_SET)
+                tail = os.read(fd, size - offset)
+                # Only whole lines: a torn last line is read again next time
+                end = tail.rfind(b"\n") + 1
+                tail = tail[:end]
+                check = _tail_check(fd, offset + end)
+            finally:
+                os.close(fd)
+        elif offset:
+            return False
+        for line in tail.splitlines():
+            if line.strip():
+                try:
+                    aggs.add(json.loads(line))
+                except ValueError:
+                    pass                 # unparsable lines are skipped, as in load()
+        self._aggs, self._aggs_key = aggs, key
+        self._aggs_covers = (offset + len(tail), check)
+        self._aggs_dirty = self._aggs_dirty or bool(tail)
+        return True
+
+    def _read_aggregates(self):
+        """(aggregates, offset, checksum) from the sidecar, or None."""
+        try:
+            with open(self.agg_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            return (Aggregates.from_json(saved["cells"]),
+                    int(saved["log_size"]), int(saved["log_check"]))
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+    def _save_aggregates(self):
+        if self._aggs is None or not self._aggs_dirty:
+            return
+        offset, check = self._aggs_covers
+        tmp = self.agg_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"log_size": offset, "log_check": check,
+                           "cells": self._aggs.to_json()}, f,
+                          ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.agg_path)
+            self._aggs_dirty = False
+        except OSError:
+            pass    # aggregates are a cache; they are rebuilt if missing
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+    def _file_key(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @_locked
+    def load(self) -> list:
+        """All records, oldest first.  The returned list is shared — don't mutate."""
+        key = self._file_key()
+        if key is None:
+            if not self._legacy():
+                return []
+            st = os.stat(self.legacy_path)
+            key = ("legacy", st.st_mtime_ns, st.st_size)
+            if key != self._cache_key:
+                self._cache = self._read_legacy()
+                self._cache_key = key
+            return self._cache
+        if key != self._cache_key:
+            self._cache = self._read()[0]
+            self._cache_key = key
+        return self._cache
+
+    def tools(self) -> list:
+        return sorted({r.get("tool", "Unknown") for r in self.load()})
+
+    @_locked
+    def _filtered(self, tool=None, start=None, end=None, search=None) -> list:
+        """Matching records, newest first (cached so paging stays cheap)."""
+        records = self.load()
+        filters = (tool, start, end, search or None)
+        cached_records, cached_filters, rows = self._filter_cache
+        if cached_records is not records or cached_filters != filters:
+            needle = search.lower() if search else None
+            rows = [r for r in reversed(records)
+                    if _matches(r, tool, start, end)
+                    and (needle is None or _contains(r, needle))]
+            self._filter_cache = (records, filters, rows)
+        return rows
+
+    @_locked
+    def _ordered(self, rows: list, order, descending: bool) -> list:
+        """`rows` re-sorted by a record key (cached alongside the filter)."""
+        if order is None and descending:
+            return rows
+        cached_rows, cached_order, ordered = self._order_cache
+        if cached_rows is not rows or cached_order != (order, descending):
+            if order is None:
+                ordered = rows[::-1]
+            else:
+                default = _sort_default(order)
+                ordered = sorted(rows, key=lambda r: r.get(order, default),
+                                 reverse=descending)
+            self._order_cache = (rows, (order, descending), ordered)
+        return ordered
+
+    def query(self, tool=None, start=None, end=None, limit=None, offset=0,
+              search=None, order=None, descending=True) -> list:
+        """Matching records, newest first unless `order` says otherwise."""
+        rows = self._ordered(self._filtered(tool, start, end, search), order, descending)
+        stop = None if limit is None else offset + limit
+        return rows[offset:stop]
+
+    def count(self, tool=None, start=None, end=None, search=None) -> int:
+        return len(self._filtered(tool, start, end, search))
+
+    @_locked
+    def summary(self, tool=None, start=None, end=None) -> list:
+        if is_day_range(start, end):
+            return self._aggregates().summary(tool, start, end)
+        # Sub-day bounds: aggregate just the matching records
+        aggs = Aggregates()
+        for rec in self._filtered(tool, start, end):
+            aggs.add(rec)
+        return aggs.summary()
+
+    @_locked
+    def daily(self, tool=None) -> list:
+        return self._aggregates().daily(tool)
+
+    def _read(self):
+        records, bad = [], 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        bad += 1
+        except OSError:
+            pass
+        return records, bad
+
+
+# ── SQLite backend ────────────────────────────────────────────────────────────
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id        INTEGER PRIMARY KEY,
+    timestamp TEXT    NOT NULL,
+    tool      TEXT    NOT NULL,
+    correct   INTEGER NOT NULL DEFAULT 0,
+    total     INTEGER NOT NULL DEFAULT 0,
+    accuracy  REAL    NOT NULL DEFAULT 0,
+    wpm       REAL    NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_sessions_timestamp ON sessions(timestamp);
+CREATE INDEX IF NOT EXISTS ix_sessions_tool_ts   ON sessions(tool, timestamp);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS daily_aggregates (
+    day      TEXT    NOT NULL,          -- ISO date, or '*' for all time
+    tool     TEXT    NOT NULL,
+    sessions INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    correct  INTEGER NOT NULL,
+    acc_n    INTEGER NOT NULL, acc_mean REAL NOT NULL, acc_m2 REAL NOT NULL,
+    wpm_n    INTEGER NOT NULL, wpm_mean REAL NOT NULL, wpm_m2 REAL NOT NULL,
+    PRIMARY KEY (day, tool)
+);
+"""
+
+_COLUMNS = ("timestamp", "tool", "correct", "total", "accuracy", "wpm")
+
+
+class SqliteStore:
+    def __init__(self, path: str = STATS_DB, import_from: str = STATS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        # One connection shared by the GUI thread and any writer thread.
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        self._import_once(import_from)
+        self._build_aggregates_once()
+
+    def _import_once(self, jsonl_path: str):
+        """Pull in the JSON-lines history the first time the DB is used."""
+        with self._lock, self._conn:
+            # Claiming the marker takes the write lock first, so two processes
+            # opening a fresh DB can't both import.
+            if not self._claim("imported"):
+                return
+            # Legacy JSON array next to the log, if it was never migrated
+            legacy = os.path.splitext(jsonl_path)[0] + ".json"
+            self._insert(JsonlStore(jsonl_path, legacy).load())
+
+    def _build_aggregates_once(self):
+        """Aggregate any sessions stored before the aggregate table existed."""
+        with self._lock, self._conn:
+            if not self._claim("aggregates"):
+                return
+            self._conn.execute("DELETE FROM daily_aggregates")
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM sessions").fetchall()
+            self._update_aggregates([dict(r) for r in rows])
+
+    def _claim(self, key: str) -> bool:
+        """Set a one-time meta marker; False if it was already set."""
+        cur = self._conn.execute("INSERT OR IGNORE INTO meta VALUES (?, '1')", (key,))
+        return cur.rowcount == 1
+
+    def _insert(self, records: list):
+        self._conn.executemany(
+            f"INSERT INTO sessions ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+            [(r.get("timestamp", ""), r.get("tool", "Unknown"), r.get("correct", 0),
+              r.get("total", 0), r.get("accuracy", 0.0), r.get("wpm", 0.0))
+             for r in records],
+        )
+        self._update_aggregates(records)
+
+    def _update_aggregates(self, records: list):
+        """Merge a batch into the stored cells (caller holds the transaction)."""
+        batch = Aggregates()
+        for r in records:
+            batch.add(r)
+        for (day, tool), cell in batch.cells.items():
+            row = self._conn.execute(
+                "SELECT sessions, attempts, correct, acc_n, acc_mean, acc_m2, "
+                "wpm_n, wpm_mean, wpm_m2 FROM daily_aggregates "
+                "WHERE day = ? AND tool = ?", (day, tool)).fetchone()
+            if row is not None:
+                stored = Aggregate.from_tuple(tuple(row))
+                stored.merge(cell)
+                cell = stored
+            self._conn.execute(
+                "INSERT OR REPLACE INTO daily_aggregates "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (day, tool, *cell.to_tuple()))
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+    def append(self, record: dict):
+        self.append_many([record])
+
+    def append_many(self, records: list):
+        if records:
+            with self._lock, self._conn:
+                self._insert(records)
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions")
+            self._conn.execute("DELETE FROM daily_aggregates")
+
+    def compact(self):
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def flush(self):
+        pass        # every write is committed; the aggregates live in the DB
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+    def _where(self, tool, start, end, search=None):
+        clauses, params = [], []
+        if tool:
+            clauses.append("tool = ?")
+            params.append(tool)
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        if search:
+            clauses.append("(timestamp LIKE ? ESCAPE '\\' OR tool LIKE ? ESCAPE '\\')")
+            params += [_like_pattern(search)] * 2
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _fetch(self, sql: str, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def load(self) -> list:
+        return [dict(r) for r in self._fetch(
+            f"SELECT {', '.join(_COLUMNS)} FROM sessions ORDER BY timestamp, id")]
+
+    def tools(self) -> list:
+        return [r[0] for r in self._fetch(
+            "SELECT DISTINCT tool FROM sessions ORDER BY tool")]
+
+    def query(self, tool=None, start=None, end=None, limit=None, offset=0,
+              search=None, order=None, descending=True) -> list:
+        """Matching records, newest first unless `order` says otherwise."""
+        where, params = self._where(tool, start, end, search)
+        direction = "DESC" if descending else "ASC"
+        column = "timestamp" if order is None else order
+        _sort_default(column)                        # only known column names
+        sql = (f"SELECT {', '.join(_COLUMNS)} FROM sessions{where} "
+               f"ORDER BY {column} {direction}, id {direction} LIMIT ? OFFSET ?")
+        params += [-1 if limit is None else limit, offset]
+        return [dict(r) for r in self._fetch(sql, params)]
+
+    def count(self, tool=None, start=None, end=None, search=None) -> int:
+        where, params = self._where(tool, start, end, search)
+        return self._fetch(f"SELECT COUNT(*) FROM sessions{where}", params)[0][0]
+
+    def _cells(self, tool=None, start=None, end=None) -> Aggregates:
+        """Stored aggregate cells for a whole-day range (or all time)."""
+        if start is None and end is None:
+            clauses, params = ["day = ?"], [ALL_TIME]
+        else:
+            clauses, params = ["day != ?"], [ALL_TIME]
+            if start:
+                clauses.append("day >= ?")
+                params.append(start)
+            if end:
+                clauses.append("day < ?")
+                params.append(end)
+        if tool:
+            clauses.append("tool = ?")
+            params.append(tool)
+        rows = self._fetch(
+            "SELECT day, tool, sessions, attempts, correct, acc_n, acc_mean, acc_m2, "
+            "wpm_n, wpm_mean, wpm_m2 FROM daily_aggregates WHERE "
+            + " AND ".join(clauses), params)
+        return Aggregates.from_json([tuple(r) for r in rows])
+
+    def summary(self, tool=None, start=None, end=None) -> list:
+        if is_day_range(start, end):
+            return self._cells(tool, start, end).summary(tool, start, end)
+        # Sub-day bounds: SQL aggregate over the matching sessions
+        where, params = self._where(tool, start, end)
+        sql = (f"SELECT tool, COUNT(*), SUM(total), AVG(accuracy), "
+               f"AVG(NULLIF(wpm, 0)) FROM sessions{where} "
+               f"GROUP BY tool ORDER BY tool")
+        return [_summary_row(t, n, att or 0, acc or 0.0, wpm or 0.0)
+                for t, n, att, acc, wpm in self._fetch(sql, params)]
+
+    def daily(self, tool=None) -> list:
+        return self._cells(tool, start="", end=None).daily(tool)
+
+
+# ── Factory ───────────────────────────────────────────────────────────────────
+def open_store(backend: str | None = None):
+    """Open the configured backend (MORSE_STATS_BACKEND, default jsonl)."""
+    backend = backend or os.environ.get(BACKEND_ENV, BACKEND_JSONL)
+    if backend == BACKEND_SQLITE:
+        return SqliteStore()
+    if backend == BACKEND_JSONL:
+        return JsonlStore()
+    raise ValueError(f"Unknown stats backend {backend!r}")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+def _summary_row(tool, sessions, attempts, avg_accuracy, avg_wpm,
+                 sd_accuracy=0.0, sd_wpm=0.0) -> dict:
+    return {"tool": tool, "sessions": sessions, "attempts": attempts,
+            "avg_accuracy": avg_accuracy, "avg_wpm": avg_wpm,
+            "sd_accuracy": sd_accuracy, "sd_wpm": sd_wpm}
+
+
+def _matches(rec: dict, tool, start, end) -> bool:
+    ts = rec.get("timestamp", "")
+    return ((not tool or rec.get("tool", "Unknown") == tool)
+            and (not start or ts >= start)
+            and (not end or ts < end))
+
+
+def _contains(rec: dict, needle: str) -> bool:
+    """`needle` (lower case) in the record's timestamp or tool name."""
+    return (needle in rec.get("timestamp", "").lower()
+            or needle in rec.get("tool", "Unknown").lower())
+
+
+def _like_pattern(search: str) -> str:
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _sort_default(order: str):
+    try:
+        return SORT_KEYS[order]
+    except KeyError:
+        raise ValueError(f"Cannot sort by {order!r}, expected one of "
+                         f"{tuple(SORT_KEYS)}") from None
+
+
+def _dump(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _tail_check(fd: int, offset: int) -> int:
+    """Checksum of the _CHECK_BYTES of the file just before `offset`."""
+    start = max(offset - _CHECK_BYTES, 0)
+    os.lseek(fd, start, os.SEEK_SET)
+    return zlib.crc32(os.read(fd, offset - start))
+
+
+def _ends_with_newline(fd: int) -> bool:
+    size = os.fstat(fd).st_size
+    if size == 0:
+        return True
+    # The descriptor is O_APPEND, so seeking here does not move the write.
+    os.lseek(fd, size - 1, os.SEEK_SET)
+    return os.read(fd, 1) == b"\n"
@@ -0,0 +1,179 @@
+# stats_writer.py
+# Background writer for session records and attempt events — no Qt imports.
+#
+# Callers on the GUI thread only enqueue; one daemon thread drains what is
+# pending, coalescing it into a single store.append_many() and a single event
+# segment, so closing a window never waits on the disk.
+#
+# Pending work is capped at MAX_PENDING items without ever blocking a caller:
+# past the cap the oldest event batch is dropped (sessions only once no event
+# batches are left) and counted.  Records and event rows are written
+# separately; whatever fails stays pending and is retried every RETRY_DELAY
+# seconds.  Failures and drops are reported by stats(), like
+# cw_audio.RenderCache.  close() drains everything; it is registered with
+# atexit and, when a QApplication exists, with aboutToQuit.
+
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+MAX_PENDING = 1024       # queued items (sessions or event batches)
+RETRY_DELAY = 1.0        # seconds before a failed write is tried again
+
+
+class StatsWriter:
+    def __init__(self, store, events=None, max_pending: int = MAX_PENDING):
+        self.store = store
+        self.events = events
+        self.max_pending = max_pending
+        # Guards everything below, and wakes the writer / flush()
+        self._cond = threading.Condition()
+        self._records = deque()          # session records waiting
+        self._rows = deque()             # event row batches waiting
+        self._busy = False               # the writer holds a batch right now
+        self._failing = False            # the last write failed; retry pending
+        self._closed = False
+        self.dropped_records = self.dropped_rows = 0
+        self.failures = 0
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="stats-writer",
+                                        daemon=True)
+        self._thread.start()
+
+    # ── Producer side (any thread) ────────────────────────────────────────────
+    def append(self, record: dict):
+        self._put(self._records, record)
+
+    def write_events(self, rows: np.ndarray):
+        """EventLog sink: queue a batch of event rows."""
+        if len(rows):
+            self._put(self._rows, rows)
+
+    def _put(self, pending: deque, item):
+        with self._cond:
+            if not self._closed:
+                pending.append(item)
+                self._shed()
+                self._cond.notify_all()
+                return
+        # Late writes after close(): the thread is gone, do it now
+        if pending is self._records:
+            records, rows = self._write([item], [])
+        else:
+            records, rows = self._write([], [item])
+        with self._cond:
+            self.dropped_records += len(records)
+            self.dropped_rows += sum(len(r) for r in rows)
+
+    def _shed(self):
+        # Caller holds the lock.  Event batches go first: a session record is
+        # a whole session's summary, an event batch a few answers' detail.
+        while len(self._records) + len(self._rows) > self.max_pending:
+            if self._rows:
+                self.dropped_rows += len(self._rows.popleft())
+            else:
+                self._records.popleft()
+                self.dropped_records += 1
+
+    def flush(self):
+        """Block until everything queued so far is written (or has failed)."""
+        with self._cond:
+            while ((self._busy or self._records or self._rows)
+                   and not self._failing and not self._closed):
+                self._cond.wait()
+
+    def close(self, timeout: float = 10.0):
+        """Drain the queue and stop the thread.  Safe to call twice."""
+        if self.events is not None:
+            self.events.flush()          # buffered rows -> queue
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self.store.flush()               # e.g. the JSONL aggregates sidecar
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"pending": len(self._records) + len(self._rows),
+                    "dropped_records": self.dropped_records,
+                    "dropped_rows": self.dropped_rows,
+                    "failures": self.failures, "last_error": self.last_error}
+
+    # ── Writer thread ─────────────────────────────────────────────────────────
+    def _run(self):
+        while True:
+            with self._cond:
+                while not (self._records or self._rows or self._closed):
+                    self._cond.wait()
+                if self._failing:
+                    # Back off before retrying; close() cuts this short
+                    deadline = time.monotonic() + RETRY_DELAY
+                    while not self._closed and time.monotonic() < deadline:
+                        self._cond.wait(deadline - time.monotonic())
+                if not (self._records or self._rows):
+                    return                           # closed and drained
+                # Coalesce everything waiting
+                records, self._records = list(self._records), deque()
+                rows, self._rows = list(self._rows), deque()
+                self._busy = True
+            records, rows = self._write(records, rows)
+            with self._cond:
+                self._busy = False
+                self._failing = bool(records or rows)
+                if self._failing and self._closed:
+                    # Last chance at exit: give up rather than hang
+                    self.dropped_records += len(records)
+                    self.dropped_rows += sum(len(r) for r in rows)
+                    records, rows = [], []
+                # Failed items go back in front of anything queued meanwhile
+                self._records.extendleft(reversed(records))
+                self._rows.extendleft(reversed(rows))
+                self._shed()
+                self._cond.notify_all()
+
+    def _write(self, records: list, rows: list):
+        """Write what it can; returns the (records, rows) that failed."""
+        if records:
+            try:
+                self.store.append_many(records)
+                records = []
+            except Exception as e:
+                self._failed(e)
+        if rows and self.events is not None:
+            try:
+                self.events.write_rows(np.concatenate(rows))
+                rows = []
+            except Exception as e:
+                self._failed(e)
+        else:
+            rows = []
+        return records, rows
+
+    def _failed(self, e: Exception):
+        with self._cond:
+            self.failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+
+
+def start(store, events=None) -> StatsWriter:
+    """Start a writer, route the event log through it and flush it at exit."""
+    writer = StatsWriter(store, events)
+    if events is not None:
+        events.sink = writer.write_events
+    atexit.register(writer.close)
+    app = _qt_app()
+    if app is not None:
+        app.aboutToQuit.connect(writer.close)
+    return writer
+
+
+def _qt_app():
+    # Only touch Qt if the GUI already imported it
+    qt = sys.modules.get("PyQt5.QtWidgets")
+    return qt.QApplication.instance() if qt is not None else None
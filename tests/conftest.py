@@ -0,0 +1,12 @@
+# conftest.py
+# The modules live at the repo root and import each other by bare name (the
+# training ones also from training/), so put both on sys.path as the tool
+# launchers do.
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _path in (os.path.join(_ROOT, "training"), _ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
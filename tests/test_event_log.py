@@ -0,0 +1,107 @@
+# test_event_log.py
+# Event rows survive tiered compaction in order, and a compaction cut short
+# by a crash neither loses nor double-counts rows.
+
+import os
+
+import numpy as np
+import pytest
+
+import event_log
+from event_log import EVENT_DTYPE, EventLog, align
+
+
+def _rows(start, n):
+    rows = np.zeros(n, dtype=EVENT_DTYPE)
+    rows["attempt"] = np.arange(start, start + n)
+    rows["target"] = ord("E")
+    rows["response"] = ord("E")
+    rows["correct"] = True
+    return rows
+
+
+@pytest.fixture
+def small_tiers(monkeypatch):
+    # Merge after a few small writes instead of megabytes of history
+    monkeypatch.setattr(event_log, "TIER_BYTES", 8192)
+
+
+def test_align():
+    assert align("ABC", "AXC") == [("A", "A"), ("B", "X"), ("C", "C")]
+    assert align("ABC", "AC") == [("A", "A"), ("B", ""), ("C", "C")]
+    assert align("ABC", "ABXC") == [("A", "A"), ("B", "B"), ("C", "C")]
+
+
+def test_record_attempt_and_flush(tmp_path):
+    log = EventLog(str(tmp_path), flush_every=16)
+    log.record_attempt("WPM Trainer", "CQ DE", "CQ DX", latency_ms=900, wpm=20)
+    log.record_attempt("WPM Trainer", "K", "K")
+    log.flush()
+    data = log.load()
+    assert "".join(map(chr, data["target"])) == "CQDEK"
+    assert data["correct"].tolist() == [True, True, True, False, True]
+    assert data["attempt"].tolist() == [1, 1, 1, 1, 2]
+    assert (data["tool"] == event_log.tool_id("WPM Trainer")).all()
+    assert EventLog(str(tmp_path)).last_attempt() == 2
+
+
+def test_tiered_compaction_keeps_rows_in_order(tmp_path, small_tiers):
+    log = EventLog(str(tmp_path))
+    n = 0
+    for i in range(300):
+        size = 1 + (i * 7) % 40
+        log.write_rows(_rows(n, size))
+        n += size
+    names = log._segments()
+    assert len(names) <= event_log.COMPACT_SEGMENTS
+    assert any("~" in name for name in names)
+    assert names == sorted(names)
+    assert log.load(("attempt",))["attempt"].tolist() == list(range(n))
+    assert len(log) == n
+
+
+def test_compact_merges_everything(tmp_path, small_tiers):
+    log = EventLog(str(tmp_path))
+    for i in range(10):
+        log.write_rows(_rows(i * 50, 50))
+    log.compact()
+    assert len(log._segments()) == 1
+    assert log.load(("attempt",))["attempt"].tolist() == list(range(500))
+
+
+def test_crash_mid_merge_is_finished_on_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(EventLog, "_compact_tiers", lambda self: None)
+    log = EventLog(str(tmp_path))
+    for i in range(4):
+        log.write_rows(_rows(i * 10, 10))
+    names = log._segments()
+    assert len(names) == 4
+
+    # The merged segment was written but the inputs never deleted
+    oldest, newest = event_log._span(names[0])[0], event_log._span(names[-1])[1]
+    merged = f"{newest}~{oldest}.npz"
+    log._write_segment(merged, log._read(names, event_log.COLUMNS))
+    with open(os.path.join(str(tmp_path), "junk.npz.tmp"), "wb") as f:
+        f.write(b"half a segment")
+
+    fresh = EventLog(str(tmp_path))
+    assert fresh.load(("attempt",))["attempt"].tolist() == list(range(40))
+    assert sorted(os.listdir(str(tmp_path))) == sorted([".lock", merged])
+
+
+def test_new_segments_sort_after_merged_ones(tmp_path, small_tiers, monkeypatch):
+    log = EventLog(str(tmp_path))
+    for i in range(8):
+        log.write_rows(_rows(i * 100, 100))
+    monkeypatch.setattr(event_log.time, "time_ns", lambda: 1)   # clock stepped back
+    log.write_rows(_rows(800, 5))
+    assert log.load(("attempt",))["attempt"].tolist() == list(range(805))
+
+
+def test_pick_merge():
+    small, big = 1000, event_log.TIER_BYTES * event_log.COMPACT_FANOUT
+    names = [f"{i:020d}-1.npz" for i in range(6)]
+    assert event_log._pick_merge(names[:3], [small] * 3) == []
+    # A big segment splits the small ones; only the newest block of four merges
+    sizes = [small, big, small, small, small, small]
+    assert event_log._pick_merge(names, sizes) == names[2:]
@@ -0,0 +1,127 @@
+# test_koch.py
+# The Koch unlock rule: a full window of answers at UNLOCK_ACCURACY or better.
+
+import json
+import random
+
+import koch
+from koch import KochLesson
+
+
+def _lesson(**kw):
+    return KochLesson(path=None, rng=random.Random(0), **kw)
+
+
+def _answer(lesson, right, wrong=0):
+    """Record `right` correct and then `wrong` missed characters, one group each."""
+    unlocked = []
+    for ok in [True] * right + [False] * wrong:
+        ch = lesson.chars[0]
+        unlocked.append(lesson.record(ch, ch if ok else ""))
+    return unlocked
+
+
+def test_starts_with_two_characters():
+    lesson = _lesson()
+    assert lesson.chars == koch.KOCH_ORDER[:koch.START_CHARS]
+    assert lesson.newest == koch.KOCH_ORDER[koch.START_CHARS - 1]
+    assert lesson.accuracy == 0.0
+
+
+def test_no_unlock_before_the_window_is_full():
+    lesson = _lesson()
+    assert not any(_answer(lesson, koch.WINDOW - 1))
+    assert lesson.level == koch.START_CHARS
+
+
+def test_unlock_at_threshold():
+    lesson = _lesson()
+    wrong = round(koch.WINDOW * (1 - koch.UNLOCK_ACCURACY))
+    assert not any(_answer(lesson, 0, wrong))
+    unlocked = _answer(lesson, koch.WINDOW - wrong)
+    assert unlocked[-1] and not any(unlocked[:-1])
+    assert lesson.level == koch.START_CHARS + 1
+    assert not lesson.results
+    assert lesson.newest == koch.KOCH_ORDER[koch.START_CHARS]
+
+
+def test_no_unlock_below_threshold():
+    lesson = _lesson()
+    wrong = round(koch.WINDOW * (1 - koch.UNLOCK_ACCURACY)) + 1
+    _answer(lesson, 0, wrong)
+    assert not any(_answer(lesson, koch.WINDOW - wrong))
+    assert len(lesson.results) == koch.WINDOW
+    assert lesson.accuracy < koch.UNLOCK_ACCURACY
+    assert lesson.level == koch.START_CHARS
+    # Old misses roll out of the window
+    assert _answer(lesson, 1)[-1]
+
+
+def test_record_scores_each_character():
+    lesson = _lesson(window=10)
+    group = "KMKMK"
+    lesson.record(group, "km k")            # spaces and case are ignored
+    assert list(lesson.results) == [True, True, True, False, False]
+
+
+def test_dropped_or_extra_letter_costs_only_that_letter():
+    lesson = _lesson(window=20)
+    lesson.record("KMKMK", "MKMK")
+    assert list(lesson.results) == [False, True, True, True, True]
+    lesson.record("KMKMK", "KMMKMK")
+    assert list(lesson.results)[5:] == [True] * 5
+
+
+def test_whole_groups_fill_the_window():
+    lesson = _lesson(window=10, group_size=5)
+    assert not lesson.record("KMKMK", "KMKMK")
+    assert lesson.record("KMKMK", "KMKMK")
+    assert lesson.level == koch.START_CHARS + 1
+
+
+def test_no_unlock_past_the_last_character():
+    lesson = _lesson(order="KM", window=5)
+    assert not any(_answer(lesson, 10))
+    assert lesson.complete
+
+
+def test_ahead_is_what_next_group_returns():
+    lesson = _lesson()
+    upcoming = lesson.ahead(3)
+    assert [lesson.next_group() for _ in range(3)] == upcoming
+    assert all(set(g) <= set(lesson.chars) and len(g) == koch.GROUP_SIZE
+               for g in upcoming)
+
+
+def test_unlock_drops_upcoming_groups():
+    lesson = _lesson(window=5)
+    lesson.ahead(5)
+    _answer(lesson, 5)
+    assert not lesson._upcoming
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "koch.json")
+    lesson = KochLesson(path=path, rng=random.Random(0), window=5)
+    _answer(lesson, 5)                  # an unlock is saved at once
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"level": koch.START_CHARS + 1, "results": ""}
+    _answer(lesson, 2, 1)               # plain answers wait for save()
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["results"] == ""
+    lesson.save()
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"level": koch.START_CHARS + 1, "results": "110"}
+    back = KochLesson(path=path, window=5)
+    assert back.level == lesson.level
+    assert list(back.results) == list(lesson.results)
+
+
+def test_saves_every_few_answers(tmp_path):
+    path = str(tmp_path / "koch.json")
+    lesson = KochLesson(path=path, rng=random.Random(0))
+    _answer(lesson, 0, koch.SAVE_EVERY - 1)
+    assert not (tmp_path / "koch.json").exists()
+    _answer(lesson, 0, 1)
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)["results"]) == koch.SAVE_EVERY
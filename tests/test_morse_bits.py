@@ -0,0 +1,76 @@
+# test_morse_bits.py
+# Packed symbols and messages against the string codec.
+
+import numpy as np
+import pytest
+
+import morse_bits
+import morse_codec
+
+
+def test_pack_examples():
+    assert morse_bits.pack("") == morse_bits.EMPTY
+    assert morse_bits.pack(".") == 0b10
+    assert morse_bits.pack("-") == 0b11
+    assert morse_bits.pack(".-") == 0b101
+    assert morse_bits.pack("-..") == 0b1100
+
+
+def test_pack_unpack_round_trip():
+    for pattern in morse_codec.DEFAULT_CODEC.decode_table:
+        if pattern == "/":
+            continue
+        code = morse_bits.pack(pattern)
+        assert morse_bits.unpack(code) == pattern
+        assert morse_bits.length(code) == len(pattern)
+
+
+def test_append_builds_the_same_code():
+    code = morse_bits.EMPTY
+    for el in "-.-.":
+        code = morse_bits.append(code, el)
+    assert code == morse_bits.pack("-.-.") == morse_bits.CHAR_TO_CODE["C"]
+
+
+def test_overlong_pattern_is_invalid():
+    assert morse_bits.pack("." * (morse_bits.MAX_ELEMENTS + 1)) == morse_bits.INVALID
+    assert morse_bits.pack("-" * morse_bits.MAX_ELEMENTS) != morse_bits.INVALID
+
+
+@pytest.mark.parametrize("pattern", ["01", "._-", ". -", "x", ".-\n", "." * 20 + "x"])
+def test_pack_rejects_other_chars(pattern):
+    with pytest.raises(ValueError):
+        morse_bits.pack(pattern)
+
+
+def test_dit_and_dah_prefixes_differ():
+    # '.' vs '..' vs '-': the length bit keeps equal-valued bit strings apart
+    codes = {morse_bits.pack(p) for p in (".", "..", "-", ".-", "-.", "--")}
+    assert len(codes) == 6
+
+
+def test_message_decode_matches_codec():
+    text = "CQ DE TA1ABC 73 <SK>"
+    morse = morse_codec.encode(text)
+    packed = morse_bits.pack_message(morse)
+    assert packed.dtype == np.uint16
+    assert morse_bits.decode(packed) == morse_codec.decode(morse)
+
+
+def test_pack_text_matches_pack_message():
+    text = "the quick brown fox <AR>"
+    assert morse_bits.messages_equal(morse_bits.pack_text(text),
+                                     morse_bits.pack_message(morse_codec.encode(text)))
+
+
+def test_messages_equal():
+    a = morse_bits.pack_message(".- / -...")
+    assert morse_bits.messages_equal(a, morse_bits.pack_message(".- / -..."))
+    assert not morse_bits.messages_equal(a, morse_bits.pack_message(".- / -..-"))
+    assert not morse_bits.messages_equal(a, morse_bits.pack_message(".-"))
+
+
+def test_message_with_bad_token_is_invalid():
+    codes = morse_bits.pack_message(".- 01 ._-")
+    assert codes.tolist() == [morse_bits.CHAR_TO_CODE["A"], morse_bits.INVALID,
+                              morse_bits.INVALID]
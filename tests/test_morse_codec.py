@@ -0,0 +1,76 @@
+# test_morse_codec.py
+# Round trips through the compiled codec and chunked streaming.
+
+import random
+
+import pytest
+
+import dicts
+import morse_codec
+from morse_codec import UNKNOWN_REPLACE, UNKNOWN_SKIP, UNKNOWN_STRICT
+
+
+def _chunked(text: str, rng, max_cuts: int = 6) -> list:
+    """Split text at random positions (empty chunks included)."""
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, max_cuts)))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+def test_round_trip_itu():
+    text = "".join(ch for ch in dicts.CODE_TABLES["itu"] if ch != " ")
+    assert morse_codec.decode(morse_codec.encode(text)) == text
+
+
+def test_round_trip_words():
+    morse = morse_codec.encode("cq de ta1abc k")
+    assert morse == "-.-. --.- / -.. . / - .- .---- .- -... -.-. / -.-"
+    assert morse_codec.decode(morse) == "CQ DE TA1ABC K"
+
+
+def test_prosigns_encode_as_one_token():
+    morse = morse_codec.encode("QRV <AR>")
+    assert morse.split(" / ")[1] == dicts.CODE_TABLES["prosigns"]["<AR>"]
+
+
+def test_whitespace_is_a_word_gap():
+    assert morse_codec.encode("Hello\nworld") == morse_codec.encode("Hello world")
+    assert morse_codec.encode("a\tb c") == ".- / -... / -.-."
+    assert morse_codec.encode("end\n") == ". -. -.."
+
+
+def test_unknown_policies():
+    assert morse_codec.encode("a~b") == ".- -..."
+    assert morse_codec.encode("a~b", UNKNOWN_REPLACE) == ".- ? -..."
+    with pytest.raises(ValueError):
+        morse_codec.encode("a~b", UNKNOWN_STRICT)
+    assert morse_codec.decode(".- -.-.-.-.- -...") == "A?B"
+    assert morse_codec.decode(".- -.-.-.-.- -...", UNKNOWN_SKIP) == "AB"
+
+
+@pytest.mark.parametrize("unknown", [UNKNOWN_SKIP, UNKNOWN_REPLACE])
+def test_encode_stream_matches_encode(unknown):
+    rng = random.Random(1)
+    alphabet = "AB9 <AR><SK>\n\t~é"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        joined = "".join(morse_codec.encode_stream(_chunked(text, rng), unknown))
+        assert joined == morse_codec.encode(text, unknown), text
+
+
+def test_prosign_split_across_chunks():
+    chunks = ["QRV <", "A", "R> K"]
+    assert "".join(morse_codec.encode_stream(chunks)) == morse_codec.encode("QRV <AR> K")
+
+
+def test_decode_stream_matches_decode():
+    rng = random.Random(2)
+    morse = morse_codec.encode("the quick brown fox 73 <SK>")
+    for _ in range(500):
+        joined = "".join(morse_codec.decode_stream(_chunked(morse, rng)))
+        assert joined == morse_codec.decode(morse)
+
+
+def test_national_tables():
+    codec = morse_codec.get_codec(morse_codec.TURKISH_TABLES)
+    assert codec is morse_codec.get_codec(morse_codec.TURKISH_TABLES)
+    assert codec.decode(codec.encode("ŞÜ")) == "ŞÜ"
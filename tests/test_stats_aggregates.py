@@ -0,0 +1,130 @@
+# test_stats_aggregates.py
+# Welford running stats and Chan merges against NumPy, and the day/tool cells.
+
+import random
+
+import numpy as np
+import pytest
+
+from stats_aggregates import ALL_TIME, Aggregate, Aggregates, RunningStat
+
+
+def _values(seed, n):
+    rng = random.Random(seed)
+    return [rng.gauss(70.0, 15.0) for _ in range(n)]
+
+
+def test_running_stat_matches_numpy():
+    values = _values(1, 1000)
+    stat = RunningStat()
+    for x in values:
+        stat.add(x)
+    assert stat.n == len(values)
+    assert stat.mean == pytest.approx(np.mean(values))
+    assert stat.variance == pytest.approx(np.var(values, ddof=1))
+    assert stat.std == pytest.approx(np.std(values, ddof=1))
+
+
+@pytest.mark.parametrize("split", [0, 1, 2, 500, 999, 1000])
+def test_merge_matches_numpy(split):
+    values = _values(2, 1000)
+    left, right = RunningStat(), RunningStat()
+    for x in values[:split]:
+        left.add(x)
+    for x in values[split:]:
+        right.add(x)
+    left.merge(right)
+    assert left.n == len(values)
+    assert left.mean == pytest.approx(np.mean(values))
+    assert left.variance == pytest.approx(np.var(values, ddof=1))
+
+
+def test_merge_many_cells_matches_numpy():
+    values = _values(3, 5000)
+    rng = random.Random(4)
+    cells = [RunningStat() for _ in range(37)]
+    for x in values:
+        rng.choice(cells).add(x)
+    total = RunningStat()
+    for cell in cells:
+        total.merge(cell)
+    assert total.mean == pytest.approx(np.mean(values))
+    assert total.variance == pytest.approx(np.var(values, ddof=1))
+
+
+def test_variance_of_fewer_than_two_values_is_zero():
+    stat = RunningStat()
+    assert stat.variance == 0.0
+    stat.add(42.0)
+    assert stat.mean == 42.0
+    assert stat.variance == 0.0
+
+
+def _record(day, tool, accuracy, wpm=0.0, total=10):
+    return {"timestamp": f"{day}T12:00:00", "tool": tool, "total": total,
+            "correct": round(total * accuracy / 100), "accuracy": accuracy, "wpm": wpm}
+
+
+def test_aggregate_skips_missing_wpm():
+    agg = Aggregate()
+    agg.add(_record("2024-01-01", "Trainer", 80.0, wpm=20.0))
+    agg.add(_record("2024-01-01", "Trainer", 90.0))
+    assert agg.sessions == 2
+    assert agg.attempts == 20
+    assert agg.accuracy.n == 2
+    assert agg.wpm.n == 1
+    assert agg.wpm.mean == 20.0
+
+
+def test_aggregate_tuple_round_trip():
+    agg = Aggregate()
+    for acc in (70.0, 85.0, 99.0):
+        agg.add(_record("2024-01-01", "Trainer", acc, wpm=acc / 4))
+    back = Aggregate.from_tuple(agg.to_tuple())
+    assert back.to_row("Trainer") == agg.to_row("Trainer")
+
+
+def test_summary_all_time_and_day_range():
+    aggs = Aggregates()
+    records = [_record(f"2024-01-0{d}", tool, 60.0 + d * 5 + i, wpm=15.0 + d)
+               for d in range(1, 6) for i, tool in enumerate(("Trainer", "Exercise"))]
+    for r in records:
+        aggs.add(r)
+
+    rows = {row["tool"]: row for row in aggs.summary()}
+    assert set(rows) == {"Trainer", "Exercise"}
+    acc = [r["accuracy"] for r in records if r["tool"] == "Trainer"]
+    assert rows["Trainer"]["sessions"] == 5
+    assert rows["Trainer"]["avg_accuracy"] == pytest.approx(np.mean(acc))
+    assert rows["Trainer"]["sd_accuracy"] == pytest.approx(np.std(acc, ddof=1))
+
+    # start inclusive, end exclusive
+    rows = aggs.summary(tool="Exercise", start="2024-01-02", end="2024-01-05")
+    acc = [r["accuracy"] for r in records
+           if r["tool"] == "Exercise" and "2024-01-02" <= r["timestamp"][:10] < "2024-01-05"]
+    assert len(rows) == 1
+    assert rows[0]["sessions"] == 3
+    assert rows[0]["avg_accuracy"] == pytest.approx(np.mean(acc))
+    assert rows[0]["sd_accuracy"] == pytest.approx(np.std(acc, ddof=1))
+
+
+def test_daily_merges_tools():
+    aggs = Aggregates()
+    aggs.add(_record("2024-01-02", "Trainer", 80.0))
+    aggs.add(_record("2024-01-01", "Exercise", 70.0))
+    aggs.add(_record("2024-01-02", "Exercise", 90.0))
+    days = aggs.daily()
+    assert [d for d, _ in days] == ["2024-01-01", "2024-01-02"]
+    assert days[1][1].sessions == 2
+    assert days[1][1].accuracy.mean == pytest.approx(85.0)
+    assert [d for d, _ in aggs.daily(tool="Trainer")] == ["2024-01-02"]
+
+
+def test_json_round_trip():
+    aggs = Aggregates()
+    for d in range(1, 4):
+        aggs.add(_record(f"2024-01-0{d}", "Trainer", 70.0 + d, wpm=18.0))
+    back = Aggregates.from_json(aggs.to_json())
+    assert set(back.cells) == set(aggs.cells)
+    assert (ALL_TIME, "Trainer") in back.cells
+    assert back.summary() == aggs.summary()
@@ -0,0 +1,95 @@
+# test_stats_analytics.py
+# Vectorised confusion counts and per-character stats against plain Python.
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import stats_analytics
+from stats_analytics import MISSING, accuracy_by_wpm, char_stats, confusion_matrix, top_confusions
+
+
+def _events(pairs, latency=None, wpm=None):
+    n = len(pairs)
+    target = np.array([ord(t) for t, _ in pairs], dtype=np.uint32)
+    response = np.array([ord(r) if r else 0 for _, r in pairs], dtype=np.uint32)
+    return {
+        "target": target,
+        "response": response,
+        "correct": target == response,
+        "latency_ms": np.asarray(latency if latency is not None else [0.0] * n,
+                                 dtype=np.float32),
+        "wpm": np.asarray(wpm if wpm is not None else [0.0] * n, dtype=np.float32),
+    }
+
+
+def _random_pairs(seed, n):
+    rng = random.Random(seed)
+    chars = "EISHTMOAN"
+    pairs = []
+    for _ in range(n):
+        t = rng.choice(chars)
+        r = t if rng.random() < 0.8 else rng.choice(chars + "\0")
+        pairs.append((t, "" if r == "\0" else r))
+    return pairs
+
+
+def test_confusion_matrix_matches_counter():
+    pairs = _random_pairs(1, 5000)
+    labels, matrix = confusion_matrix(_events(pairs))
+    counts = Counter(pairs)
+    index = {stats_analytics.char_label(cp): i for i, cp in enumerate(labels)}
+    assert matrix.sum() == len(pairs)
+    for (t, r), n in counts.items():
+        assert matrix[index[t], index[r or MISSING]] == n
+
+
+def test_confusion_matrix_empty():
+    labels, matrix = confusion_matrix(_events([]))
+    assert len(labels) == 0
+    assert matrix.shape == (0, 0)
+    assert char_stats(_events([])) == []
+
+
+def test_top_confusions():
+    pairs = [("E", "I")] * 5 + [("S", "H")] * 3 + [("T", "")] * 2 + [("A", "A")] * 50
+    top = top_confusions(*confusion_matrix(_events(pairs)), n=10)
+    assert top == [("E", "I", 5), ("S", "H", 3), ("T", MISSING, 2)]
+
+
+def test_char_stats():
+    pairs = [("E", "E")] * 9 + [("E", "I")] + [("S", "H")] * 2 + [("S", "S")] * 2
+    latency = [100.0 * (i + 1) for i in range(10)] + [0.0, 400.0, 800.0, 1200.0]
+    rows = char_stats(_events(pairs, latency=latency))
+    assert [r["char"] for r in rows] == ["S", "E"]
+    s, e = rows
+    assert s["attempts"] == 4 and s["accuracy"] == 50.0
+    assert s["confused_with"] == "H"
+    # The untimed attempt (0 ms) is left out of the percentiles
+    assert s["p50_ms"] == pytest.approx(np.percentile([400, 800, 1200], 50))
+    assert e["accuracy"] == 90.0
+    assert e["p50_ms"] == pytest.approx(np.percentile(latency[:10], 50))
+    assert e["p90_ms"] == pytest.approx(np.percentile(latency[:10], 90))
+
+
+def test_group_percentiles_match_numpy():
+    rng = np.random.default_rng(2)
+    groups = rng.integers(0, 7, 3000)
+    values = rng.gamma(2.0, 400.0, 3000).round()
+    out = stats_analytics._group_percentiles(groups, values, 8, (10, 50, 90))
+    for g in range(7):
+        expected = np.percentile(values[groups == g], (10, 50, 90))
+        assert out[:, g] == pytest.approx(expected)
+    assert (out[:, 7] == 0).all()           # a group with no values
+
+
+def test_accuracy_by_wpm():
+    pairs = [("E", "E"), ("E", "I"), ("T", "T"), ("T", "T"), ("A", "A")]
+    wpm = [20.2, 19.8, 25.0, 25.4, 0.0]
+    assert accuracy_by_wpm(_events(pairs, wpm=wpm)) == [
+        {"wpm": 20.0, "attempts": 2, "accuracy": 50.0},
+        {"wpm": 25.0, "attempts": 2, "accuracy": 100.0},
+    ]
+    assert accuracy_by_wpm(_events(pairs[-1:], wpm=wpm[-1:])) == []
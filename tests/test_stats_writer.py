@@ -0,0 +1,115 @@
+# test_stats_writer.py
+# The background writer never blocks callers, and failed writes are retried.
+
+import threading
+import time
+
+import numpy as np
+
+import stats_writer
+from event_log import EVENT_DTYPE
+from stats_writer import StatsWriter
+
+
+class Store:
+    """In-memory store; append_many() waits on `gate` and fails `fail` times."""
+
+    def __init__(self, fail=0):
+        self.records = []
+        self.fail = fail
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def append_many(self, records):
+        self.gate.wait()
+        if self.fail:
+            self.fail -= 1
+            raise OSError("disk full")
+        self.records.extend(records)
+
+    def flush(self):
+        pass
+
+
+class Events:
+    def __init__(self):
+        self.rows = []
+
+    def write_rows(self, rows):
+        self.rows.extend(rows["attempt"].tolist())
+
+    def flush(self):
+        pass
+
+
+def _batch(attempt):
+    rows = np.zeros(1, dtype=EVENT_DTYPE)
+    rows["attempt"] = attempt
+    return rows
+
+
+def test_writes_records_and_events():
+    store, events = Store(), Events()
+    writer = StatsWriter(store, events)
+    for i in range(100):
+        writer.append({"n": i})
+        writer.write_events(_batch(i))
+    writer.flush()
+    assert [r["n"] for r in store.records] == list(range(100))
+    assert events.rows == list(range(100))
+    writer.close()
+
+
+def test_full_queue_drops_oldest_events_without_blocking():
+    store, events = Store(), Events()
+    store.gate.clear()                   # the disk stalls
+    writer = StatsWriter(store, events, max_pending=10)
+    writer.append({"n": -1})
+    time.sleep(0.05)                     # the writer is now stuck on it
+    t0 = time.perf_counter()
+    writer.append({"n": 0})
+    for i in range(100):
+        writer.write_events(_batch(i))
+    assert time.perf_counter() - t0 < 0.5
+    st = writer.stats()
+    assert st["pending"] == 10
+    assert st["dropped_rows"] == 91 and st["dropped_records"] == 0
+    store.gate.set()
+    writer.close()
+    assert [r["n"] for r in store.records] == [-1, 0]
+    assert events.rows == list(range(91, 100))
+
+
+def test_failed_records_are_retried_and_events_still_written(monkeypatch):
+    monkeypatch.setattr(stats_writer, "RETRY_DELAY", 0.01)
+    store, events = Store(fail=2), Events()
+    writer = StatsWriter(store, events)
+    writer.append({"n": 1})
+    writer.write_events(_batch(7))
+    deadline = time.monotonic() + 5
+    while not store.records and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+    assert store.records == [{"n": 1}]
+    assert events.rows == [7]
+    st = writer.stats()
+    assert st["failures"] == 2
+    assert st["last_error"] == "OSError: disk full"
+    assert st["dropped_records"] == 0
+
+
+def test_close_gives_up_on_a_dead_store():
+    store = Store(fail=10 ** 6)
+    writer = StatsWriter(store)
+    writer.append({"n": 1})
+    writer.close(timeout=5)
+    assert not writer._thread.is_alive()
+    assert writer.stats()["dropped_records"] == 1
+
+
+def test_append_after_close_is_written():
+    store = Store()
+    writer = StatsWriter(store)
+    writer.close()
+    writer.append({"n": 1})
+    assert store.records == [{"n": 1}]
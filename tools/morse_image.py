@@ -0,0 +1,113 @@
+# morse_image.py
+# Morse <-> image helpers with no Qt imports, shared by the image tool windows
+# (svg2morse.py, morse2svg.py) and the command line (morse_cli.py).
+#
+#   extract_morse()   read green signal bars from a PNG/JPG/BMP/WEBP image
+#   morse_to_svg()    draw a Morse string as a green waveform SVG
+#
+# Pillow and matplotlib are imported on first use; matplotlib through its
+# Figure API only, so no GUI backend (or display) is ever needed.
+
+from itertools import groupby
+
+import numpy as np
+
+NO_SIGNAL = "No Morse signal detected."
+DEFAULT_SVG_PATH = "./morse_output.svg"
+
+
+# ── Image -> Morse ────────────────────────────────────────────────────────────
+def extract_morse(image_path, word_sep: str = "   ") -> str:
+    """
+    Read green-bar Morse signal from an image file (path or binary file).
+    Returns "" if no signal is found.
+    """
+    from PIL import Image
+
+    rgb_image = Image.open(image_path).convert("RGB")
+    rgb_array = np.array(rgb_image)
+
+    green_mask = (
+        (rgb_array[:, :, 1] > 200) &
+        (rgb_array[:, :, 0] < 100) &
+        (rgb_array[:, :, 2] < 100)
+    )
+
+    green_signal_1d = green_mask.any(axis=0).astype(int)
+    runs = [(val, sum(1 for _ in group)) for val, group in groupby(green_signal_1d)]
+
+    signal_lengths = [length for val, length in runs if val == 1]
+    space_lengths  = [length for val, length in runs if val == 0]
+
+    if not signal_lengths or not space_lengths:
+        return ""
+
+    min_dot               = min(signal_lengths)
+    dot_dash_threshold    = min_dot * 2
+    min_space             = min(space_lengths)
+    letter_space_thr      = min_space * 3
+    word_space_thr        = min_space * 6
+
+    morse = ""
+    for val, length in runs:
+        if val == 1:
+            morse += "." if length < dot_dash_threshold else "-"
+        else:
+            if length >= word_space_thr:
+                morse += word_sep
+            elif length >= letter_space_thr:
+                morse += " "
+    return morse
+
+
+# ── Morse -> SVG ──────────────────────────────────────────────────────────────
+def morse_to_svg(morse_code: str, svg_path=DEFAULT_SVG_PATH):
+    """Draw `morse_code` and save it as SVG to a path or file; returns svg_path."""
+    from matplotlib.figure import Figure
+    import matplotlib.patches as patches
+
+    elements = []
+    for char in morse_code:
+        if char in ['.', '-']:
+            elements.append(char)
+        elif char == ' ':
+            elements.append(' ')  # Space between letters
+    if not elements:
+        raise ValueError("no Morse elements to draw")
+
+    spacing = 0.6
+    x_positions = []
+    current_x = 0
+    for element in elements:
+        x_positions.append(current_x)
+        if element == ' ':
+            current_x += spacing * 2
+        else:
+            current_x += spacing
+
+    x_vals = np.array(x_positions)
+    y_vals = np.sin(x_vals / 3) * 0.8
+
+    fig = Figure(figsize=(24, 6), facecolor='white')
+    ax = fig.subplots()
+    ax.set_facecolor('white')
+    green = '#00FF41'
+
+    for i, element in enumerate(elements):
+        x, y = x_vals[i], y_vals[i]
+        if element == '.':
+            circle = patches.Circle((x, y), radius=0.1, color=green)
+            ax.add_patch(circle)
+        elif element == '-':
+            rect = patches.FancyBboxPatch((x - 0.15, y - 0.05), 0.3, 0.1,
+                                          boxstyle="round,pad=0.02", color=green)
+            ax.add_patch(rect)
+
+    ax.plot(x_vals, y_vals, color=green, linewidth=0.5, alpha=0.15)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_xlim(x_vals.min() - 1, x_vals.max() + 1)
+    ax.set_ylim(y_vals.min() - 1, y_vals.max() + 1)
+
+    fig.savefig(svg_path, format='svg', bbox_inches='tight', transparent=True)
+    return svg_path
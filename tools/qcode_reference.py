@@ -109,6 +109,12 @@ class ReferenceWindow(QWidget):
                         if q in a or q in m.upper()]
             self._fill_abbr(filtered)
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self.tabs.setCurrentIndex(0)
+        self.search_box.clear()          # refills the table via _filter
+        self.search_box.setFocus()
+
     def closeEvent(self, event):
         if self.return_callback:
             self.return_callback()
@@ -0,0 +1,108 @@
+# stats_stress.py
+# Concurrency stress check for the stats stores: many processes log sessions
+# (and attempt events) into one store at once, then the results are verified.
+#
+#   python tools/stats_stress.py                     # 8 procs x 200 records, jsonl
+#   python tools/stats_stress.py -p 16 -n 500 --backend sqlite
+#
+# Runs in a temporary directory; the real session_stats files are untouched.
+# Exits non-zero if any record or event was lost or duplicated.
+
+import sys as _sys, os as _os
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
+
+import argparse
+import multiprocessing as mp
+import random
+import shutil
+import tempfile
+import time
+
+import event_log
+import stats_store
+
+
+def _open(backend: str, workdir: str):
+    jsonl = _os.path.join(workdir, "session_stats.jsonl")
+    if backend == stats_store.BACKEND_SQLITE:
+        return stats_store.SqliteStore(_os.path.join(workdir, "session_stats.db"), jsonl)
+    return stats_store.JsonlStore(jsonl, _os.path.join(workdir, "session_stats.json"))
+
+
+def _worker(args):
+    worker_id, backend, workdir, count, compact_every = args
+    # Frequent compaction exercises the rewrite path under contention
+    stats_store.COMPACT_EVERY = compact_every
+    store = _open(backend, workdir)
+    events = event_log.EventLog(_os.path.join(workdir, "session_events"), flush_every=64)
+    rng = random.Random(worker_id)
+    for i in range(count):
+        store.append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "tool": f"Worker {worker_id}",
+            "correct": i, "total": count, "accuracy": 50.0, "wpm": 20.0,
+        })
+        events.record_attempt("WPM Trainer", "CQ", "CQ" if rng.random() < .5 else "C")
+        if rng.random() < 0.02:
+            time.sleep(0.001)
+    events.flush()
+    store.flush()
+
+
+def _check(backend: str, workdir: str, procs: int, count: int) -> list:
+    store = _open(backend, workdir)
+    records = store.load()
+    problems = []
+    if len(records) != procs * count:
+        problems.append(f"expected {procs * count} records, found {len(records)}")
+    for w in range(procs):
+        seen = sorted(r["correct"] for r in records if r["tool"] == f"Worker {w}")
+        if seen != list(range(count)):
+            problems.append(f"worker {w}: {len(seen)} records, "
+                            f"{len(set(seen))} distinct (expected {count})")
+    sessions = sum(row["sessions"] for row in store.summary())
+    if sessions != procs * count:
+        problems.append(f"aggregates count {sessions} sessions, expected {procs * count}")
+    events = event_log.EventLog(_os.path.join(workdir, "session_events"))
+    n_events = len(events)
+    if n_events != procs * count * 2:
+        problems.append(f"expected {procs * count * 2} events, found {n_events}")
+    return problems
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Concurrent stats store stress check")
+    p.add_argument("-p", "--procs", type=int, default=8)
+    p.add_argument("-n", "--count", type=int, default=200, help="records per process")
+    p.add_argument("--backend", choices=(stats_store.BACKEND_JSONL,
+                                         stats_store.BACKEND_SQLITE),
+                   default=stats_store.BACKEND_JSONL)
+    p.add_argument("--compact-every", type=int, default=50)
+    p.add_argument("--keep", action="store_true", help="keep the temp directory")
+    args = p.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="stats_stress_")
+    t0 = time.perf_counter()
+    jobs = [(w, args.backend, workdir, args.count, args.compact_every)
+            for w in range(args.procs)]
+    with mp.Pool(args.procs) as pool:
+        pool.map(_worker, jobs)
+    elapsed = time.perf_counter() - t0
+
+    problems = _check(args.backend, workdir, args.procs, args.count)
+    total = args.procs * args.count
+    print(f"{args.backend}: {args.procs} processes x {args.count} records "
+          f"in {elapsed:.2f} s ({total / elapsed:.0f} records/s)")
+    for msg in problems:
+        print("  FAIL:", msg)
+    if not problems:
+        print("  OK: no lost or duplicated records / events")
+    if args.keep:
+        print("  data kept in", workdir)
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    _sys.exit(main())
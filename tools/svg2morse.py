@@ -6,9 +6,6 @@ import sys as _sys, os as _os
 _sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
 _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))                    # tools/
 
-from PIL import Image
-import numpy as np
-from itertools import groupby
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QFrame, QFileDialog
@@ -16,44 +13,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 import cw_audio
-
-
-def _extract_morse(image_path: str) -> str:
-    """Read green-bar Morse signal from an image file."""
-    rgb_image = Image.open(image_path).convert("RGB")
-    rgb_array = np.array(rgb_image)
-
-    green_mask = (
-        (rgb_array[:, :, 1] > 200) &
-        (rgb_array[:, :, 0] < 100) &
-        (rgb_array[:, :, 2] < 100)
-    )
-
-    green_signal_1d = green_mask.any(axis=0).astype(int)
-    runs = [(val, sum(1 for _ in group)) for val, group in groupby(green_signal_1d)]
-
-    signal_lengths = [length for val, length in runs if val == 1]
-    space_lengths  = [length for val, length in runs if val == 0]
-
-    if not signal_lengths or not space_lengths:
-        return "No Morse signal detected."
-
-    min_dot               = min(signal_lengths)
-    dot_dash_threshold    = min_dot * 2
-    min_space             = min(space_lengths)
-    letter_space_thr      = min_space * 3
-    word_space_thr        = min_space * 6
-
-    morse = ""
-    for val, length in runs:
-        if val == 1:
-            morse += "." if length < dot_dash_threshold else "-"
-        else:
-            if length >= word_space_thr:
-                morse += "   "
-            elif length >= letter_space_thr:
-                morse += " "
-    return morse
+from morse_image import extract_morse, NO_SIGNAL
 
 
 class Svg2MorseWindow(QWidget):
@@ -137,7 +97,7 @@ class Svg2MorseWindow(QWidget):
             return
         self.label_file.setText(path)
         try:
-            morse = _extract_morse(path)
+            morse = extract_morse(path) or NO_SIGNAL
         except Exception as e:
             morse = f"Error: {e}"
         self.output_field.setPlainText(morse)
@@ -154,6 +114,11 @@ class Svg2MorseWindow(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self.label_file.setText("No file selected.")
+        self.output_field.clear()
+
     def closeEvent(self, event):
         cw_audio.stop()
         if self.return_callback:
@@ -7,12 +7,68 @@ _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QLineEdit, QFrame
+    QPlainTextEdit, QFrame, QComboBox, QFileDialog
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
-from dicts import MORSE_CODE_DICT, normalize_turkish_characters
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 import cw_audio
+import morse_codec
+import transliterate
+
+# Code table choices -> transliterate.LANGUAGES
+_CODE_TABLES = {
+    "International":           "international",
+    "Turkish  (Ç Ğ İ Ö Ş Ü)":  "turkish",
+    "German  (Ä Ö Ü)":         "german",
+}
+
+_CONVERT_DELAY_MS = 150     # debounce while typing / after a big paste
+
+
+# ── File worker ───────────────────────────────────────────────────────────────
+class FileConvertWorker(QThread):
+    """Streams a text file through transliteration + encoding to disk."""
+    progress = pyqtSignal(int)          # percent of the input read
+    done = pyqtSignal(str)              # status message for the output field
+
+    def __init__(self, src: str, dst: str, language: str):
+        super().__init__()
+        self.src = src
+        self.dst = dst
+        self.language = language
+
+    def _chunks(self, fin, size: int):
+        read = 0
+        last = -1
+        for chunk in morse_codec.read_chunks(fin):
+            if self.isInterruptionRequested():
+                raise InterruptedError
+            read += len(chunk)          # characters vs bytes: close enough
+            percent = min(99, read * 100 // size) if size else 0
+            if percent != last:
+                self.progress.emit(percent)
+                last = percent
+            yield chunk
+
+    def run(self):
+        codec, translit = transliterate.pipeline(self.language)
+        try:
+            size = _os.path.getsize(self.src)
+            with open(self.src, "r", encoding="utf-8", errors="replace") as fin, \
+                 open(self.dst, "w", encoding="utf-8") as fout:
+                for chunk in codec.encode_stream(translit.stream(self._chunks(fin, size)),
+                                                 unknown=morse_codec.UNKNOWN_REPLACE):
+                    fout.write(chunk)
+        except InterruptedError:
+            try:
+                _os.remove(self.dst)    # don't leave half a file behind
+            except OSError:
+                pass
+            self.done.emit("Conversion cancelled.")
+        except OSError as e:
+            self.done.emit(f"Error: {e}")
+        else:
+            self.done.emit(f"Saved Morse to:\n{self.dst}")
 
 
 class TextToMorseWindow(QWidget):
@@ -21,6 +77,13 @@ class TextToMorseWindow(QWidget):
         self.return_callback = return_callback
         self.setWindowTitle("Text to Morse Converter")
         self.setGeometry(200, 150, 620, 420)
+
+        self._convert_timer = QTimer(self)
+        self._convert_timer.setSingleShot(True)
+        self._convert_timer.setInterval(_CONVERT_DELAY_MS)
+        self._convert_timer.timeout.connect(self._convert)
+        self._file_worker: FileConvertWorker | None = None
+
         self._build_ui()
 
     # ── UI ────────────────────────────────────────────────────────────────────
@@ -39,17 +102,29 @@ class TextToMorseWindow(QWidget):
         line.setStyleSheet("color: #444;")
         layout.addWidget(line)
 
+        # Code table
+        table_row = QHBoxLayout()
+        table_row.addWidget(QLabel("Code table:"))
+        self.table_combo = QComboBox()
+        self.table_combo.addItems(list(_CODE_TABLES))
+        self.table_combo.setToolTip("Character set used for encoding (punctuation and <AR>-style prosigns are always included)")
+        self.table_combo.currentIndexChanged.connect(self._convert_timer.start)
+        table_row.addWidget(self.table_combo)
+        table_row.addStretch()
+        layout.addLayout(table_row)
+
         # Input
         layout.addWidget(QLabel("Enter text (supports Turkish characters):"))
-        self.input_field = QLineEdit()
+        self.input_field = QPlainTextEdit()
         self.input_field.setFont(QFont("Courier", 14))
-        self.input_field.setPlaceholderText("Type here…")
-        self.input_field.textChanged.connect(self._convert)
+        self.input_field.setPlaceholderText("Type or paste here…")
+        self.input_field.setMaximumHeight(110)
+        self.input_field.textChanged.connect(self._convert_timer.start)
         layout.addWidget(self.input_field)
 
         # Output
         layout.addWidget(QLabel("Morse code output:"))
-        self.output_field = QTextEdit()
+        self.output_field = QPlainTextEdit()
         self.output_field.setReadOnly(True)
         self.output_field.setFont(QFont("Courier", 15))
         self.output_field.setStyleSheet("letter-spacing: 3px; line-height: 1.5;")
@@ -70,6 +145,12 @@ class TextToMorseWindow(QWidget):
         self.stop_btn.clicked.connect(cw_audio.stop)
         btn_row.addWidget(self.stop_btn)
 
+        self.file_btn = QPushButton("📄  Convert File…")
+        self.file_btn.setFont(QFont("Arial", 11))
+        self.file_btn.setToolTip("Convert a whole text file to Morse and save the result")
+        self.file_btn.clicked.connect(self._convert_file)
+        btn_row.addWidget(self.file_btn)
+
         btn_row.addStretch()
 
         back_btn = QPushButton("← Back to Menu")
@@ -82,17 +163,65 @@ class TextToMorseWindow(QWidget):
         self.setLayout(layout)
 
     # ── Logic ─────────────────────────────────────────────────────────────────
+    def _language(self) -> str:
+        return _CODE_TABLES[self.table_combo.currentText()]
+
+    def _pipeline(self):
+        return transliterate.pipeline(self._language())
+
     def _convert(self):
-        raw = self.input_field.text()
-        normalized = normalize_turkish_characters(raw.upper())
-        morse = []
-        for ch in normalized:
-            if ch == " ":
-                morse.append("/")
-            else:
-                code = MORSE_CODE_DICT.get(ch, "?")
-                morse.append(code)
-        self.output_field.setPlainText(" ".join(morse))
+        raw = self.input_field.toPlainText()
+        codec, translit = self._pipeline()
+        chunks = (raw[i:i + morse_codec.DEFAULT_CHUNK_SIZE]
+                  for i in range(0, len(raw), morse_codec.DEFAULT_CHUNK_SIZE))
+        morse = "".join(codec.encode_stream(translit.stream(chunks),
+                                            unknown=morse_codec.UNKNOWN_REPLACE))
+        self.output_field.setPlainText(morse)
+
+    def _convert_file(self):
+        """Convert a text file to Morse on a worker thread."""
+        if self._file_worker is not None:
+            return
+        src, _ = QFileDialog.getOpenFileName(
+            self, "Select Text File", "", "Text files (*.txt);;All files (*)"
+        )
+        if not src:
+            return
+        dst, _ = QFileDialog.getSaveFileName(
+            self, "Save Morse As", _os.path.splitext(src)[0] + "_morse.txt",
+            "Text files (*.txt)"
+        )
+        if not dst:
+            return
+        self.file_btn.setEnabled(False)
+        self.output_field.setPlainText("Converting…")
+        self._file_worker = FileConvertWorker(src, dst, self._language())
+        self._file_worker.progress.connect(self._file_progress)
+        self._file_worker.done.connect(self._file_done)
+        self._file_worker.start()
+
+    def _file_progress(self, percent: int):
+        self.output_field.setPlainText(f"Converting… {percent}%")
+
+    def _file_done(self, message: str):
+        if self._file_worker is None:       # cancelled; a late queued signal
+            return
+        self._file_worker.wait()
+        self._file_worker = None
+        self.file_btn.setEnabled(True)
+        self.output_field.setPlainText(message)
+
+    def _cancel_file(self):
+        """Stop a running file conversion and wait for the worker to exit."""
+        worker = self._file_worker
+        if worker is None:
+            return
+        worker.progress.disconnect(self._file_progress)
+        worker.done.disconnect(self._file_done)
+        worker.requestInterruption()
+        worker.wait()
+        self._file_worker = None
+        self.file_btn.setEnabled(True)
 
     def _play(self):
         morse = self.output_field.toPlainText().strip()
@@ -106,8 +235,16 @@ class TextToMorseWindow(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self._convert_timer.stop()
+        self._cancel_file()
+        self.input_field.clear()
+        self.output_field.clear()
+
     def closeEvent(self, event):
         cw_audio.stop()
+        self._cancel_file()
         if self.return_callback:
             self.return_callback()
         event.accept()
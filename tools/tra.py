@@ -7,10 +7,14 @@ from PyQt5.QtWidgets import (
     QPushButton, QTextEdit
 )
 from PyQt5.QtCore import Qt, QObject, QEvent
-from morse_handler import MorseHandler
+from PyQt5.QtGui import QTextCursor
+from morse_handler import MorseHandler, BUFFER_APPEND, BUFFER_DELETE, BUFFER_CLEAR
 from text2morse_window import TextToMorseWindow
 import cw_audio
 
+# How many candidate characters the live hint lists before eliding
+MAX_HINT_CANDIDATES = 8
+
 
 class KeyEventFilter(QObject):
     def __init__(self, handler, update_callback):
@@ -47,9 +51,11 @@ class MyApp(QWidget):
 
         self.morse = MorseHandler()
         self.text_to_morse_window = None
+        cw_audio.prewarm()      # open the sidetone stream before the first key
         self.return_callback = return_callback
 
         self.init_ui()
+        self.morse.decoded.subscribe(self._on_decoded_changed)
 
         # Global key listener
         self.key_filter = KeyEventFilter(self.morse, self.update_display)
@@ -66,6 +72,10 @@ class MyApp(QWidget):
         layout.addWidget(QLabel("Current Morse Symbol:"))
         layout.addWidget(self.morse_display)
 
+        self.hint_label = QLabel("")
+        self.hint_label.setStyleSheet("color: #888;")
+        layout.addWidget(self.hint_label)
+
         self.decoded_display = QTextEdit()
         self.decoded_display.setReadOnly(True)
         layout.addWidget(QLabel("Decoded Text (live):"))
@@ -82,8 +92,38 @@ class MyApp(QWidget):
         self.setLayout(layout)
 
     def update_display(self):
+        # Decoded text is kept in sync by _on_decoded_changed; only the
+        # (short) current symbol is re-rendered here.
         self.morse_display.setPlainText(self.morse.get_morse_buffer())
-        self.decoded_display.setPlainText(self.morse.get_decoded_text())
+        self._update_hint()
+
+    def _on_decoded_changed(self, event, text):
+        """Apply one buffer change to the display with a QTextCursor edit."""
+        if event == BUFFER_CLEAR:
+            self.decoded_display.clear()
+            return
+        cursor = self.decoded_display.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if event == BUFFER_APPEND:
+            cursor.insertText(text)
+        elif event == BUFFER_DELETE:
+            cursor.movePosition(QTextCursor.Left, QTextCursor.KeepAnchor, len(text))
+            cursor.removeSelectedText()
+        self.decoded_display.setTextCursor(cursor)
+
+    def _update_hint(self):
+        if not self.morse.get_morse_buffer():
+            self.hint_label.setText("")
+        elif not self.morse.is_valid_prefix():
+            self.hint_label.setText("No character starts with this pattern")
+            self.hint_label.setStyleSheet("color: #f44336;")
+        else:
+            cands = self.morse.candidates()
+            shown = "/".join(cands[:MAX_HINT_CANDIDATES])
+            if len(cands) > MAX_HINT_CANDIDATES:
+                shown += "…"
+            self.hint_label.setText(f"Could be: {shown}")
+            self.hint_label.setStyleSheet("color: #888;")
 
     def clear_all(self):
         self.morse.clear()
@@ -112,6 +152,15 @@ class MyApp(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        if self.text_to_morse_window is not None:
+            self.text_to_morse_window.hide()
+        self.clear_all()
+        cw_audio.prewarm()
+        # closeEvent removed the global key listener
+        QApplication.instance().installEventFilter(self.key_filter)
+
     def closeEvent(self, event):
         QApplication.instance().removeEventFilter(self.key_filter)
         if self.return_callback:
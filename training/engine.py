@@ -0,0 +1,374 @@
+# engine.py
+# Qt-free training engine: the drill state machines and scoring that the
+# trainer widgets drive, so they can also be run headless (see simulate.py).
+#
+#   ExerciseEngine   Morse Exercise — key a shown letter; waiting / hint / revealed
+#   RecallEngine     WPM Trainer    — hear a text, type it back
+#   SendEngine       Send Practice  — key a shown word, timed for WPM
+#
+# Engines never touch audio, widgets or the stats log: every answered trial
+# returns an Attempt that the caller logs / plays / displays.  Time comes from
+# an injectable clock, and the next item from a pluggable selector (anything
+# with next(items) and record(item, correct, latency_ms)).
+
+import random
+import time
+from collections import deque, namedtuple
+
+import morse_bits
+import morse_codec
+from koch import KochLesson
+
+# ── Word banks ────────────────────────────────────────────────────────────────
+COMMON_WORDS = [
+    "THE", "AND", "FOR", "ARE", "BUT", "NOT", "YOU", "ALL",
+    "CAN", "HER", "WAS", "ONE", "OUR", "OUT", "DAY", "GET",
+    "HAS", "HIM", "HOW", "MAN", "NEW", "NOW", "OLD", "SEE",
+    "TWO", "WAY", "WHO", "BOY", "DID", "ITS", "LET", "PUT",
+    "SAY", "TOO", "USE",
+]
+CW_WORDS = [
+    "CQ", "DE", "RST", "QTH", "QRZ", "QSO", "QRM", "QRN",
+    "73", "88", "K", "AR", "SK", "BK", "TNX", "UR", "ES",
+    "AGN", "PSE", "RPT", "HR", "HW", "FB", "NR", "OM",
+]
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# ── Callsign generator ────────────────────────────────────────────────────────
+_PREFIXES = ["W", "K", "N", "AA", "VK", "G", "F", "DL", "JA", "HS", "TA"]
+_DIGITS   = "0123456789"
+
+
+def random_callsign(rng=random) -> str:
+    prefix = rng.choice(_PREFIXES)
+    digit  = rng.choice(_DIGITS)
+    suffix = "".join(rng.choices(LETTERS, k=rng.randint(2, 3)))
+    return f"{prefix}{digit}{suffix}"
+
+
+# ── Shared pieces ─────────────────────────────────────────────────────────────
+Attempt = namedtuple("Attempt", "target response correct latency_ms wpm",
+                     defaults=(0.0,))
+
+
+class Score:
+    __slots__ = ("correct", "total")
+
+    def __init__(self):
+        self.correct = 0
+        self.total = 0
+
+    def add(self, correct: bool):
+        self.total += 1
+        self.correct += bool(correct)
+
+    @property
+    def percent(self) -> int:
+        return round(self.correct / self.total * 100) if self.total else 0
+
+    def __str__(self):
+        if not self.total:
+            return "Score: —"
+        return f"Score: {self.correct}/{self.total}  ({self.percent}%)"
+
+
+class RandomSelector:
+    """Uniform choice — the drills' original behaviour."""
+
+    adaptive = False        # picks don't depend on answers, so can be made ahead
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def next(self, items):
+        return self.rng.choice(items)
+
+    def record(self, item, correct: bool, latency_ms=None):
+        pass
+
+
+def _ms(clock, start) -> float:
+    return (clock() - start) * 1000
+
+
+# Packed code -> the character it answers (prosigns don't count as one)
+_ANSWERS = {code: ch for code, ch in morse_bits.CODE_TO_CHAR.items()
+            if ord(ch) not in morse_codec.DEFAULT_CODEC.expand_table}
+
+
+# ── Morse Exercise ────────────────────────────────────────────────────────────
+STATE_WAITING  = "waiting"   # showing letter, waiting for user input
+STATE_HINT     = "hint"      # wrong answer: mnemonic shown, answer hidden
+STATE_REVEALED = "revealed"  # correct code shown, waiting for Enter → next
+
+
+class ExerciseEngine:
+    """
+    Key the Morse for a shown letter.  A wrong answer (or skip) moves to the
+    hint state; advance() reveals the answer, then moves to the next letter.
+    A skip is not scored but is reported to the selector as a miss.
+    """
+
+    def __init__(self, letters, selector=None, clock=time.monotonic):
+        self.letters = list(letters)
+        self.selector = selector or RandomSelector()
+        self.clock = clock
+        self.score = Score()
+        self.state = STATE_WAITING
+        self.current = ""
+        self.expected = ""
+        self._expected_code = morse_bits.EMPTY
+        self.user_input = ""
+        self._prompt_time = 0.0
+
+    def new_session(self):
+        self.score = Score()
+
+    def next(self) -> str:
+        self.current = self.selector.next(self.letters)
+        self.expected = morse_codec.encode(self.current)
+        self._expected_code = morse_bits.CHAR_TO_CODE[self.current]
+        self.user_input = ""
+        self.state = STATE_WAITING
+        self._prompt_time = self.clock()
+        return self.current
+
+    def key(self, element: str) -> bool:
+        """Add '.' or '-' to the answer (waiting state only)."""
+        if self.state != STATE_WAITING:
+            return False
+        self.user_input += element
+        return True
+
+    def backspace(self) -> bool:
+        if self.state != STATE_WAITING or not self.user_input:
+            return False
+        self.user_input = self.user_input[:-1]
+        return True
+
+    def submit(self, code: str | None = None):
+        """Check the keyed (or given) code; the Attempt, or None if nothing to check."""
+        if code is not None:
+            self.user_input = code
+        if self.state != STATE_WAITING or not self.user_input:
+            return None
+        try:
+            code = morse_bits.pack(self.user_input)
+        except ValueError:
+            code = morse_bits.INVALID
+        correct = code == self._expected_code
+        attempt = Attempt(self.current, _ANSWERS.get(code, ""), correct,
+                          _ms(self.clock, self._prompt_time))
+        self.score.add(correct)
+        self.selector.record(self.current, correct, attempt.latency_ms)
+        self.state = STATE_REVEALED if correct else STATE_HINT
+        return attempt
+
+    def skip(self) -> bool:
+        """Jump to the hint without penalising the score."""
+        if self.state != STATE_WAITING:
+            return False
+        self.selector.record(self.current, False, None)
+        self.state = STATE_HINT
+        return True
+
+    def advance(self) -> str:
+        """Enter: hint -> revealed -> next letter.  Returns the new state."""
+        if self.state == STATE_HINT:
+            self.state = STATE_REVEALED
+        elif self.state == STATE_REVEALED:
+            self.next()
+        return self.state
+
+
+# ── WPM Trainer ───────────────────────────────────────────────────────────────
+MODE_LETTERS   = "Letters"
+MODE_WORDS     = "Common Words"
+MODE_ABBREVS   = "CW Abbreviations"
+MODE_CALLSIGNS = "Callsigns"
+MODE_KOCH      = "Koch"
+MODES = (MODE_LETTERS, MODE_WORDS, MODE_ABBREVS, MODE_CALLSIGNS, MODE_KOCH)
+
+
+class RecallEngine:
+    """
+    Hear a text, type it back.  present() picks the next text; the answer
+    clock starts at ready() (when playback has finished).  Koch mode draws
+    groups from `koch` (an in-memory lesson if none is given) and reports
+    every answer to it; `unlocked` is set when one adds a character.
+    upcoming() picks texts ahead of time (e.g. to render their audio early).
+    """
+
+    def __init__(self, selector=None, rng=None, clock=time.monotonic, koch=None):
+        self.rng = rng or random.Random()
+        self.selector = selector or RandomSelector(self.rng)
+        self.koch = koch or KochLesson(path=None, rng=self.rng)
+        self.unlocked = False
+        self._ahead = {}                # mode -> deque of texts picked early
+        self.clock = clock
+        self.score = Score()
+        self.mode = MODE_LETTERS
+        self.text = ""
+        self.morse = ""
+        self.answered = True
+        self._answer_start = 0.0
+
+    def new_session(self):
+        self.score = Score()
+
+    def pick(self, mode: str = MODE_LETTERS) -> str:
+        if mode == MODE_LETTERS:
+            return self.selector.next(LETTERS)
+        elif mode == MODE_WORDS:
+            return self.rng.choice(COMMON_WORDS)
+        elif mode == MODE_ABBREVS:
+            return self.rng.choice(CW_WORDS)
+        elif mode == MODE_KOCH:
+            return self.koch.next_group()
+        else:
+            return random_callsign(self.rng)
+
+    def upcoming(self, mode: str, n: int) -> list:
+        """
+        The texts the next n present(mode) calls will use.  [] for letters
+        chosen by an adaptive selector, whose next pick depends on the answer.
+        """
+        if mode == MODE_KOCH:
+            return self.koch.ahead(n)
+        if mode == MODE_LETTERS and getattr(self.selector, "adaptive", True):
+            return []
+        ahead = self._ahead.setdefault(mode, deque())
+        while len(ahead) < n:
+            ahead.append(self.pick(mode))
+        return list(ahead)[:n]
+
+    def present(self, mode: str = MODE_LETTERS, text: str | None = None) -> str:
+        """Start a new trial with `text`, or one picked for `mode`; returns its Morse."""
+        self.mode = mode
+        if text is None:
+            ahead = self._ahead.get(mode)
+            text = ahead.popleft() if ahead else self.pick(mode)
+        self.text = text
+        self.morse = morse_codec.encode(self.text)
+        self.answered = False
+        self.unlocked = False
+        return self.morse
+
+    def ready(self):
+        """Playback finished: the answer clock starts now."""
+        self._answer_start = self.clock()
+
+    def answer(self, response: str):
+        """Score a typed answer; None if there is nothing to answer."""
+        if self.answered or not self.text:
+            return None
+        response = response.strip().upper()
+        if self.mode == MODE_KOCH:              # groups may be typed spaced out
+            response = response.replace(" ", "")
+        return self._finish(response, response == self.text.upper())
+
+    def skip(self):
+        if self.answered or not self.text:
+            return None
+        return self._finish("", False)
+
+    def _finish(self, response: str, correct: bool) -> Attempt:
+        self.answered = True
+        self.score.add(correct)
+        attempt = Attempt(self.text.upper(), response, correct,
+                          _ms(self.clock, self._answer_start))
+        if self.mode == MODE_LETTERS:        # the selector only picks letters
+            self.selector.record(self.text, correct, attempt.latency_ms)
+        elif self.mode == MODE_KOCH:
+            self.unlocked = self.koch.record(self.text, response)
+        return attempt
+
+
+# ── Send Practice ─────────────────────────────────────────────────────────────
+def char_count(text: str) -> int:
+    """Standard Morse WPM: 5 chars = 1 word."""
+    return len(text.replace(" ", ""))
+
+
+def calc_wpm(chars: int, elapsed_sec: float) -> float:
+    if elapsed_sec <= 0:
+        return 0.0
+    words = chars / 5.0
+    minutes = elapsed_sec / 60.0
+    return round(words / minutes, 1)
+
+
+LETTER_GAP = " "         # keyed between letters (Space)
+WORD_GAP   = " / "       # keyed between words (Tab)
+
+
+class SendEngine:
+    """
+    Key a shown word.  The clock starts at the first dot or dash; submit()
+    compares bit-packed messages and derives WPM from the elapsed time.
+    """
+
+    def __init__(self, words=None, selector=None, rng=None, clock=time.monotonic):
+        self.words = list(words or COMMON_WORDS + CW_WORDS)
+        self.rng = rng or random.Random()
+        self.selector = selector or RandomSelector(self.rng)
+        self.clock = clock
+        self.score = Score()
+        self.text = ""
+        self.morse = ""
+        self._packed = morse_bits.pack_message("")
+        self.user_input = ""
+        self._start_time = None
+        self.awaiting_next = False
+
+    def new_session(self):
+        self.score = Score()
+
+    def next(self) -> str:
+        self.text = self.selector.next(self.words)
+        self.morse = morse_codec.encode(self.text)
+        self._packed = morse_bits.pack_message(self.morse)
+        self.user_input = ""
+        self._start_time = None
+        self.awaiting_next = False
+        return self.text
+
+    def key(self, element: str) -> bool:
+        """'.', '-', LETTER_GAP or WORD_GAP (or a run of them); ignored once answered."""
+        if self.awaiting_next:
+            return False
+        if self._start_time is None and element.strip(" /"):
+            self._start_time = self.clock()
+        self.user_input += element
+        return True
+
+    def backspace(self) -> bool:
+        if self.awaiting_next:
+            return False
+        self.user_input = self.user_input[:-1]
+        return True
+
+    def submit(self, morse: str | None = None):
+        """Score the keyed (or given) Morse; None if there is nothing to score."""
+        if morse is not None:
+            self.user_input = morse
+        if self.awaiting_next or not self.user_input.strip():
+            return None
+        elapsed = self.clock() - self._start_time if self._start_time is not None else 0
+        correct = morse_bits.messages_equal(morse_bits.pack_message(self.user_input),
+                                            self._packed)
+        self.score.add(correct)
+        self.selector.record(self.text, correct, elapsed * 1000)
+        self.awaiting_next = True
+        return Attempt(self.text,
+                       morse_codec.decode(self.user_input, unknown=morse_codec.UNKNOWN_SKIP),
+                       correct, elapsed * 1000,
+                       calc_wpm(char_count(self.text), elapsed))
+
+    def skip(self):
+        if self.awaiting_next:
+            return None
+        self.score.add(False)
+        self.selector.record(self.text, False, None)
+        self.awaiting_next = True
+        return Attempt(self.text, "", False, 0.0)
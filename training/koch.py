@@ -0,0 +1,146 @@
+# koch.py
+# Koch-method lessons: characters are always sent at full speed, starting
+# with two; one more is unlocked each time accuracy over the last WINDOW
+# characters reaches UNLOCK_ACCURACY.  Trials are random groups drawn from
+# the unlocked set.  Qt-free; the WPM Trainer's "Koch" mode drives it through
+# RecallEngine, and the next groups are known in advance (ahead()) so their
+# audio can be rendered before they are asked for.
+#
+# Progress is kept in koch_lesson.json: saved on unlock, every SAVE_EVERY
+# answers and on save() (the trainer calls it when closed).
+
+import sys as _sys, os as _os
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
+
+import json
+import random
+from collections import deque
+
+from event_log import align
+
+KOCH_FILE = _os.path.join(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))),
+                          "koch_lesson.json")
+
+# The usual Koch order (as used by LCWO)
+KOCH_ORDER = "KMURESNAPTLWI.JZ=FOY,VG5/Q92H38B?47C1D60X"
+
+START_CHARS     = 2
+GROUP_SIZE      = 5
+WINDOW          = 50         # characters in the rolling accuracy window
+UNLOCK_ACCURACY = 0.9
+SAVE_EVERY      = 25         # answers between automatic saves
+
+
+class KochLesson:
+    """Lesson state: the unlocked characters and the rolling window of results."""
+
+    def __init__(self, path: str | None = KOCH_FILE, rng=None,
+                 order: str = KOCH_ORDER, group_size: int = GROUP_SIZE,
+                 window: int = WINDOW):
+        self.path = path
+        self.rng = rng or random.Random()
+        self.order = order
+        self.group_size = group_size
+        self.level = START_CHARS
+        self.results = deque(maxlen=window)     # per-character True / False
+        self._upcoming = deque()
+        self._unsaved = 0
+        if path is not None:
+            self._load()
+
+    @property
+    def chars(self) -> str:
+        return self.order[:self.level]
+
+    @property
+    def newest(self) -> str:
+        return self.order[self.level - 1]
+
+    @property
+    def accuracy(self) -> float:
+        """Rolling accuracy, 0.0 - 1.0 (0.0 before any answers)."""
+        return sum(self.results) / len(self.results) if self.results else 0.0
+
+    @property
+    def complete(self) -> bool:
+        return self.level >= len(self.order)
+
+    # ── Groups ────────────────────────────────────────────────────────────────
+    def _group(self) -> str:
+        return "".join(self.rng.choices(self.chars, k=self.group_size))
+
+    def ahead(self, n: int) -> list:
+        """The groups the next n next_group() calls will return."""
+        while len(self._upcoming) < n:
+            self._upcoming.append(self._group())
+        return list(self._upcoming)[:n]
+
+    def peek(self) -> str:
+        """The group next_group() will return."""
+        return self.ahead(1)[0]
+
+    def next_group(self) -> str:
+        self.peek()
+        return self._upcoming.popleft()
+
+    # ── Scoring ───────────────────────────────────────────────────────────────
+    def record(self, group: str, response: str) -> bool:
+        """
+        Score `response` character by character against `group`; True when
+        that unlocks a new character.  Characters are paired up as in the
+        event log (event_log.align), so one dropped or extra letter only
+        costs that letter.
+        """
+        response = response.replace(" ", "").upper()
+        for ch, got in align(group, response):
+            self.results.append(got == ch)
+        unlocked = False
+        if (not self.complete and len(self.results) == self.results.maxlen
+                and self.accuracy >= UNLOCK_ACCURACY):
+            self.level += 1
+            self.results.clear()
+            self._upcoming.clear()      # the next groups may use the new character
+            unlocked = True
+        self._unsaved += 1
+        if unlocked or self._unsaved >= SAVE_EVERY:
+            self.save()
+        return unlocked
+
+    def reset(self):
+        self.level = START_CHARS
+        self.results.clear()
+        self._upcoming.clear()
+        self._unsaved += 1
+        self.save()
+
+    def status(self) -> str:
+        if not self.results:
+            window = "no answers yet"
+        else:
+            window = f"{self.accuracy * 100:.0f}% of last {len(self.results)}"
+        return f"Koch lesson {self.level - 1}: {' '.join(self.chars)}   ({window})"
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            level = int(data["level"])
+            results = str(data.get("results", ""))
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self.level = min(max(level, START_CHARS), len(self.order))
+        self.results.extend(c == "1" for c in results)
+
+    def save(self):
+        if self.path is None or not self._unsaved:
+            return
+        self._unsaved = 0
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"level": self.level,
+                           "results": "".join("1" if r else "0" for r in self.results)}, f)
+            _os.replace(tmp, self.path)
+        except OSError:
+            pass
@@ -2,7 +2,6 @@ import sys as _sys, os
 _sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # project root
 _sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))                   # this dir
 
-import random
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
 )
@@ -10,17 +9,14 @@ from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtCore import Qt
 from dicts import MORSE_CODE_DICT
 import cw_audio
-from session_stats import log_session
+from engine import ExerciseEngine, STATE_WAITING, STATE_HINT, STATE_REVEALED
+from scheduler import Scheduler
+from session_stats import log_session, log_attempt
 
 # Resolve assets relative to the PROJECT ROOT (not this file's dir)
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _MNEMONIC_DIR = os.path.join(_PROJECT_ROOT, "mnemonic_letter_images")
 
-# States
-STATE_WAITING  = "waiting"   # showing letter, waiting for user input
-STATE_HINT     = "hint"      # wrong answer: mnemonic shown, answer hidden
-STATE_REVEALED = "revealed"  # correct code shown, waiting for Enter → next
-
 
 class MorseExerciseApp(QWidget):
     def __init__(self, return_callback=None):
@@ -29,13 +25,11 @@ class MorseExerciseApp(QWidget):
         self.setGeometry(200, 100, 480, 600)
         self.return_callback = return_callback
 
-        self.letters = [k for k in MORSE_CODE_DICT.keys() if k.isalpha()]
-        self.current_letter = ""
-        self.user_input = ""
-        self.state = STATE_WAITING
-        self._score_correct = 0
-        self._score_total   = 0
+        # Letters come up by spaced repetition: missed ones soon, known ones rarely
+        self.engine = ExerciseEngine((k for k in MORSE_CODE_DICT.keys() if k.isalpha()),
+                                     selector=Scheduler("Morse Exercise"))
 
+        cw_audio.prewarm()      # open the sidetone stream before the first key
         self._build_ui()
         self.next_letter()
 
@@ -123,11 +117,12 @@ class MorseExerciseApp(QWidget):
         if not checked:
             cw_audio.stop()
 
-    def next_letter(self):
-        self.current_letter = random.choice(self.letters)
-        self.user_input = ""
-        self.state = STATE_WAITING
+    @property
+    def current_letter(self) -> str:
+        return self.engine.current
 
+    def next_letter(self):
+        self.engine.next()
         self.label_letter.setText(self.current_letter)
         self.label_input.setText("")
         self.label_feedback.setText("")
@@ -141,21 +136,18 @@ class MorseExerciseApp(QWidget):
 
     def _skip(self):
         """Jump straight to hint state without penalising."""
-        if self.state == STATE_WAITING:
+        if self.engine.skip():
             self._go_to_hint(skipped=True)
 
     def _on_next_clicked(self):
         """Button click: act based on current state."""
-        if self.state == STATE_HINT:
+        if self.engine.state == STATE_HINT:
             self._reveal_answer()
-        elif self.state == STATE_REVEALED:
+        elif self.engine.state == STATE_REVEALED:
             self.next_letter()
 
     def _go_to_hint(self, skipped: bool = False):
         """Show mnemonic image + keyword, but hide the correct code."""
-        if not skipped:
-            self._score_total += 1   # wrong answer counts as one attempt
-        self.state = STATE_HINT
         if skipped:
             self.label_feedback.setText("Hint  —  can you guess the code?")
             self.label_feedback.setStyleSheet("color: #e8a838;")
@@ -169,8 +161,8 @@ class MorseExerciseApp(QWidget):
 
     def _reveal_answer(self):
         """Transition from HINT to REVEALED — show the correct code."""
-        self.state = STATE_REVEALED
-        expected = MORSE_CODE_DICT.get(self.current_letter, "")
+        self.engine.advance()
+        expected = self.engine.expected
         self.label_feedback.setText(
             f"{self.label_feedback.text().split('—')[0].strip()}  →  {expected}"
         )
@@ -183,10 +175,7 @@ class MorseExerciseApp(QWidget):
 
     def _correct(self):
         """Handle a correct answer — show mnemonic as positive reinforcement."""
-        self._score_correct += 1
-        self._score_total   += 1
-        self.state = STATE_REVEALED
-        expected = MORSE_CODE_DICT.get(self.current_letter, "")
+        expected = self.engine.expected
         self.label_feedback.setText(f"Correct!   {expected}")
         self.label_feedback.setStyleSheet("color: #4caf50;")
         self._show_mnemonic(show_code=True)
@@ -226,52 +215,63 @@ class MorseExerciseApp(QWidget):
             self.close()
             return
 
-        if self.state == STATE_REVEALED:
+        state = self.engine.state
+        if state == STATE_REVEALED:
             if event.key() in (Qt.Key_Return, Qt.Key_Enter):
                 self.next_letter()
             return
 
-        if self.state == STATE_HINT:
+        if state == STATE_HINT:
             if event.key() in (Qt.Key_Return, Qt.Key_Enter):
                 self._reveal_answer()
             return
 
         # STATE_WAITING
         if event.key() == Qt.Key_Q:
-            self.user_input += "."
+            self.engine.key(".")
             if self._audio_enabled():
                 cw_audio.play_dit()
         elif event.key() == Qt.Key_E:
-            self.user_input += "-"
+            self.engine.key("-")
             if self._audio_enabled():
                 cw_audio.play_dah()
         elif event.key() == Qt.Key_Backspace:
-            self.user_input = self.user_input[:-1]
+            self.engine.backspace()
         elif event.key() in (Qt.Key_Return, Qt.Key_Enter):
             self._check_input()
             return
 
-        self.label_input.setText(self.user_input)
+        self.label_input.setText(self.engine.user_input)
 
     def _check_input(self):
-        if not self.user_input:
+        attempt = self.engine.submit()
+        if attempt is None:
             return
-        expected = MORSE_CODE_DICT.get(self.current_letter, "")
-        if self.user_input == expected:
+        log_attempt("Morse Exercise", attempt.target, attempt.response,
+                    latency_ms=attempt.latency_ms)
+        if attempt.correct:
             self._correct()
         else:
             self._go_to_hint()
 
     # ------------------------------------------------------------------ #
-    #  Window close                                                        #
+    #  Window reuse / close                                                #
     # ------------------------------------------------------------------ #
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self.engine.new_session()
+        cw_audio.prewarm()
+        self.next_letter()
+
     def closeEvent(self, event):
         cw_audio.stop()
-        if self._score_total > 0:
+        self.engine.selector.save()
+        score = self.engine.score
+        if score.total > 0:
             log_session(
                 "Morse Exercise",
-                correct=self._score_correct,
-                total=self._score_total
+                correct=score.correct,
+                total=score.total
             )
         if self.return_callback:
             self.return_callback()
@@ -5,7 +5,7 @@ import sys as _sys, os as _os
 _sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
 _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))                    # training/
 
-import random
+import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QComboBox, QFrame
@@ -13,7 +13,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 from dicts import NATO_PHONETIC_DICT
-from session_stats import log_session
+from scheduler import Scheduler
+from session_stats import log_session, log_attempt
 
 # Reverse: word -> letter
 PHONETIC_TO_LETTER = {v.upper(): k for k, v in NATO_PHONETIC_DICT.items()}
@@ -30,6 +31,9 @@ class PhoneticDrill(QWidget):
         self._score_total   = 0
         self._current_key   = ""
         self._awaiting_next = False
+        self._prompt_time   = 0.0
+        self._letters       = list(NATO_PHONETIC_DICT.keys())
+        self.scheduler      = Scheduler("Phonetic Drill")
 
         self._build_ui()
         self._next()
@@ -119,17 +123,17 @@ class PhoneticDrill(QWidget):
         self.next_btn.setEnabled(False)
 
         mode = self.mode_combo.currentText()
+        self._current_key = self.scheduler.next(self._letters)
         if mode == "Letter → NATO word":
-            self._current_key = random.choice(list(NATO_PHONETIC_DICT.keys()))
             self.label_prompt.setText(self._current_key)
             self.label_prompt_desc.setText("Type the NATO phonetic word:")
         else:
-            self._current_key = random.choice(list(NATO_PHONETIC_DICT.keys()))
             word = NATO_PHONETIC_DICT[self._current_key]
             self.label_prompt.setText(word)
             self.label_prompt_desc.setText("Type the letter for this word:")
 
         self.input_field.setFocus()
+        self._prompt_time = time.monotonic()
 
     def _check(self):
         if self._awaiting_next:
@@ -140,8 +144,16 @@ class PhoneticDrill(QWidget):
 
         if mode == "Letter → NATO word":
             expected = NATO_PHONETIC_DICT[self._current_key].upper()
+            letter = PHONETIC_TO_LETTER.get(user, "")
         else:
             expected = self._current_key.upper()
+            letter = user if len(user) == 1 else ""
+        # Logged (and scheduled) per letter either way, so both modes feed
+        # the same analytics
+        latency_ms = (time.monotonic() - self._prompt_time) * 1000
+        log_attempt("Phonetic Drill", self._current_key.upper(), letter,
+                    latency_ms=latency_ms)
+        self.scheduler.record(self._current_key, user == expected, latency_ms)
 
         self._score_total += 1
         if user == expected:
@@ -165,7 +177,15 @@ class PhoneticDrill(QWidget):
         if event.key() == Qt.Key_Escape:
             self.close()
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self._score_correct = 0
+        self._score_total   = 0
+        self.label_score.setText("Score: —")
+        self._next()
+
     def closeEvent(self, event):
+        self.scheduler.save()
         if self._score_total > 0:
             log_session(
                 "Phonetic Drill",
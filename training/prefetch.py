@@ -0,0 +1,96 @@
+# prefetch.py
+# Background audio pre-rendering for the trainers: the next few trials'
+# buffers are rendered on a worker thread while the current one is being
+# answered, so starting a trial (or replaying it) costs only the audio
+# device's latency.
+#
+# Items are (text, settings) pairs, where settings is a hashable tuple of
+# everything that changes the sound (WPM, Farnsworth, noise, QRM...).  The
+# owner says what it wants next with want(); a change of settings simply
+# produces different items, and buffers nobody wants any more are dropped.
+# The current trial's buffer stays until the next want(), so replays reuse it.
+# No Qt imports.
+
+import threading
+from collections import deque
+
+DEFAULT_DEPTH = 2            # trials rendered ahead
+
+
+class AudioPrefetcher:
+    def __init__(self, render):
+        """render(text, settings) -> buffer, called on the worker thread."""
+        self._render = render
+        self._cond = threading.Condition()
+        self._ready = {}             # item -> buffer
+        self._queue = deque()        # items still to render, in order
+        self._wanted = set()
+        self._busy = None            # item being rendered right now
+        self._thread = None          # idles once the queue is empty
+        self.hits = 0
+        self.misses = 0
+
+    def want(self, items, current=None):
+        """
+        Render `items` (in order) ahead of time; everything else except
+        `current` (the trial now playing) is dropped.
+        """
+        items = list(items)
+        with self._cond:
+            self._wanted = set(items)
+            if current is not None:
+                self._wanted.add(current)
+            for item in [i for i in self._ready if i not in self._wanted]:
+                del self._ready[item]
+            self._queue = deque(i for i in items
+                                if i not in self._ready and i != self._busy)
+            if self._queue:
+                self._start()
+                self._cond.notify_all()
+
+    def get(self, text: str, settings: tuple):
+        """The buffer for (text, settings): ready, awaited, or rendered now."""
+        item = (text, settings)
+        with self._cond:
+            self._wanted.add(item)
+            if item in self._queue:          # not started yet: it goes next
+                self._queue.remove(item)
+                self._queue.appendleft(item)
+            while item == self._busy or item in self._queue:
+                self._cond.wait()
+            if item in self._ready:
+                self.hits += 1
+                return self._ready[item]
+            self.misses += 1
+        audio = self._render(text, settings)
+        with self._cond:
+            if item in self._wanted:
+                self._ready[item] = audio
+        return audio
+
+    def clear(self):
+        """Drop every buffer and pending render."""
+        self.want(())
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audio-prefetch",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                item = self._busy = self._queue.popleft()
+            try:
+                audio = self._render(*item)
+            except Exception:
+                audio = None
+            with self._cond:
+                self._busy = None
+                if audio is not None and item in self._wanted:
+                    self._ready[item] = audio
+                self._cond.notify_all()
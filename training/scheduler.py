@@ -0,0 +1,223 @@
+# scheduler.py
+# Spaced-repetition item scheduler for the drills — SM-2 intervals on a
+# seconds-to-days scale, so letters you keep missing come back within a few
+# trials and letters you know drift out to minutes, hours and days.
+#
+# Each item has a card: ease, interval, repetition count and due time.  Cards
+# sit in a heap ordered by due time, so picking the next item is O(log n);
+# rescheduling pushes a fresh entry and the stale one is skipped when it
+# surfaces.  When nothing is due yet the earliest-due card is still shown —
+# a drill always has a next item.
+#
+# Implements the engine selector protocol (next(items), record(item, correct,
+# latency_ms)), so any engine or drill can use it in place of RandomSelector.
+# State is kept per deck (one per drill) in training_schedule.json.
+
+import sys as _sys, os as _os
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
+
+import heapq
+import json
+import random
+import time
+from collections import deque
+
+from file_lock import FileLock
+
+SCHEDULE_FILE = _os.path.join(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))),
+                              "training_schedule.json")
+
+START_EASE      = 2.5
+MIN_EASE        = 1.3
+FIRST_INTERVAL  = 60.0       # seconds after the first good answer
+SECOND_INTERVAL = 300.0      # ... and after the second; then interval * ease
+LAPSE_INTERVAL  = 15.0       # a miss comes back this soon
+FAST_MS         = 1500       # answer latency for a "perfect" grade
+SLOW_MS         = 4000       # slower than this is a "hard" grade
+SAVE_EVERY      = 25         # records between automatic saves
+RECENT          = 3          # the last few items are held back while others remain
+
+
+def grade(correct: bool, latency_ms=None) -> int:
+    """SM-2 quality 0-5 from a drill answer; a skip (no latency) is 0."""
+    if not correct:
+        return 0 if latency_ms is None else 1
+    if latency_ms is None or latency_ms <= FAST_MS:
+        return 5
+    return 4 if latency_ms <= SLOW_MS else 3
+
+
+class Card:
+    __slots__ = ("ease", "interval", "reps", "lapses", "due", "seq")
+
+    def __init__(self, due: float, ease: float = START_EASE, interval: float = 0.0,
+                 reps: int = 0, lapses: int = 0):
+        self.ease = ease
+        self.interval = interval
+        self.reps = reps
+        self.lapses = lapses
+        self.due = due
+        self.seq = 0             # id of the card's live heap entry
+
+    def review(self, quality: int, now: float):
+        if quality < 3:
+            self.reps = 0
+            self.lapses += 1
+            self.interval = LAPSE_INTERVAL
+        else:
+            self.reps += 1
+            if self.reps == 1:
+                self.interval = FIRST_INTERVAL
+            elif self.reps == 2:
+                self.interval = SECOND_INTERVAL
+            else:
+                self.interval *= self.ease
+        q = 5 - quality
+        self.ease = max(MIN_EASE, self.ease + 0.1 - q * (0.08 + q * 0.02))
+        self.due = now + self.interval
+
+    def to_list(self) -> list:
+        return [round(self.ease, 3), round(self.interval, 1), self.reps,
+                self.lapses, round(self.due, 1)]
+
+    @classmethod
+    def from_list(cls, v) -> "Card":
+        ease, interval, reps, lapses, due = v
+        return cls(due, float(ease), float(interval), int(reps), int(lapses))
+
+
+class Scheduler:
+    """
+    Spaced-repetition selector for one deck.  path=None keeps it in memory
+    (simulations); otherwise the deck is loaded now and saved every
+    SAVE_EVERY records and on save().
+    """
+
+    adaptive = True         # the next pick depends on the last answer
+
+    def __init__(self, deck: str = "default", path: str | None = SCHEDULE_FILE,
+                 clock=time.time, rng=None):
+        self.deck = deck
+        self.path = path
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.cards = {}
+        self._heap = []              # (due, seq, item)
+        self._seq = 0
+        self._pool = None            # the items last passed to next()
+        self._pool_set = frozenset()
+        self._recent = deque(maxlen=RECENT)
+        self._unsaved = 0
+        if path is not None:
+            self._load()
+
+    # ── Selector protocol ─────────────────────────────────────────────────────
+    def next(self, items):
+        """The earliest-due of `items` (new ones first come due now)."""
+        if items is not self._pool:
+            self._pool = items
+            self._pool_set = frozenset(items)
+            new = [i for i in self._pool_set if i not in self.cards]
+            self.rng.shuffle(new)          # don't introduce new items A-Z
+            now = self.clock()
+            for item in new:
+                self.cards[item] = Card(now)
+                self._push(item)
+        if not self._pool_set:
+            raise IndexError("no items to schedule")
+
+        heap, cards = self._heap, self.cards
+        # Hold back recent items only if something else in the pool is left
+        recent = self._recent if len(self._pool_set) > len(self._recent) else ()
+        held = []
+        pick = fallback = None
+        while heap:
+            entry = heapq.heappop(heap)
+            item = entry[2]
+            if cards[item].seq != entry[1]:
+                continue                    # stale: the card was rescheduled
+            held.append(entry)
+            if item not in self._pool_set:
+                continue
+            if item in recent:
+                fallback = fallback or item
+                continue
+            pick = item
+            break
+        for entry in held:
+            heapq.heappush(heap, entry)
+        if pick is None:
+            pick = fallback
+        if len(heap) > 4 * len(cards) + 64:
+            self._compact()
+        return pick
+
+    def record(self, item, correct: bool, latency_ms=None):
+        card = self.cards.get(item)
+        if card is None:
+            card = self.cards[item] = Card(self.clock())
+        card.review(grade(correct, latency_ms), self.clock())
+        self._push(item)
+        if item not in self._recent:
+            self._recent.append(item)
+        self._unsaved += 1
+        if self.path is not None and self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    # ── Heap ──────────────────────────────────────────────────────────────────
+    def _push(self, item):
+        self._seq += 1
+        card = self.cards[item]
+        card.seq = self._seq
+        heapq.heappush(self._heap, (card.due, card.seq, item))
+
+    def _compact(self):
+        self._heap = [(c.due, c.seq, i) for i, c in self.cards.items()]
+        heapq.heapify(self._heap)
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+    def due_count(self, now: float | None = None) -> int:
+        now = self.clock() if now is None else now
+        return sum(1 for c in self.cards.values() if c.due <= now)
+
+    def weakest(self, n: int = 5) -> list:
+        """Items with the lowest ease (most often missed) first."""
+        return sorted(self.cards, key=lambda i: (self.cards[i].ease,
+                                                 -self.cards[i].lapses))[:n]
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+    def _read_all(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self):
+        deck = self._read_all().get(self.deck, {})
+        for item, v in deck.items():
+            try:
+                self.cards[item] = Card.from_list(v)
+            except (TypeError, ValueError):
+                continue
+        for i, c in enumerate(self.cards.values(), 1):
+            c.seq = i
+        self._seq = len(self.cards)
+        self._compact()
+
+    def save(self):
+        """Write this deck back; other decks in the file are left as they are."""
+        if self.path is None or not self._unsaved:
+            return
+        self._unsaved = 0
+        try:
+            with FileLock(self.path + ".lock"):
+                data = self._read_all()
+                data[self.deck] = {item: c.to_list() for item, c in self.cards.items()}
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                _os.replace(tmp, self.path)
+        except OSError:
+            pass    # losing the schedule only costs some review history
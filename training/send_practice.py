@@ -2,41 +2,16 @@ import sys as _sys, os as _os
 _sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
 _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))                    # training/
 
-import random
-import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame
 )
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt, QEvent
-from dicts import MORSE_CODE_DICT
-from wpm_trainer import COMMON_WORDS, CW_WORDS, _random_callsign
 import cw_audio
-from session_stats import log_session
-
-# ── Helpers ───────────────────────────────────────────────────────────────────
-def _to_morse(text: str) -> str:
-    parts = []
-    for ch in text.upper():
-        if ch == " ":
-            parts.append("/")
-        elif ch in MORSE_CODE_DICT:
-            parts.append(MORSE_CODE_DICT[ch])
-    return " ".join(parts)
-
-
-def _char_count(text: str) -> int:
-    """Standard Morse WPM: 5 chars = 1 word."""
-    return len(text.replace(" ", ""))
-
-
-def _calc_wpm(chars: int, elapsed_sec: float) -> float:
-    if elapsed_sec <= 0:
-        return 0.0
-    words = chars / 5.0
-    minutes = elapsed_sec / 60.0
-    return round(words / minutes, 1)
+from engine import SendEngine, LETTER_GAP, WORD_GAP
+from scheduler import Scheduler
+from session_stats import log_session, log_attempt
 
 
 # ── Main widget ───────────────────────────────────────────────────────────────
@@ -50,15 +25,9 @@ class SendPractice(QWidget):
         # Prevent Qt from using Tab for focus cycling inside this widget
         self.setFocusPolicy(Qt.StrongFocus)
 
-        self._target_text  = ""
-        self._target_morse = ""
-        self._user_input   = ""
-        self._start_time   = None
-        self._awaiting_next = False
-
-        self._score_total  = 0
-        self._score_correct = 0
+        self.engine = SendEngine(selector=Scheduler("Send Practice"))
 
+        cw_audio.prewarm()      # open the sidetone stream before the first key
         self._build_ui()
         self._next_word()
         # Install event filter on the application so we catch Tab
@@ -146,14 +115,7 @@ class SendPractice(QWidget):
 
     # ── Logic ────────────────────────────────────────────────────────────────
     def _next_word(self):
-        pool = COMMON_WORDS + CW_WORDS
-        self._target_text  = random.choice(pool)
-        self._target_morse = _to_morse(self._target_text)
-        self._user_input   = ""
-        self._start_time   = None
-        self._awaiting_next = False
-
-        self.label_target.setText(self._target_text)
+        self.label_target.setText(self.engine.next())
         self.label_expected_morse.setText("")
         self.label_user_input.setText("")
         self.label_feedback.setText("")
@@ -178,43 +140,40 @@ class SendPractice(QWidget):
             self.close()
             return
 
-        if self._awaiting_next:
+        if self.engine.awaiting_next:
             if key in (Qt.Key_Return, Qt.Key_Enter):
                 self.skip_button.setEnabled(True)
                 self._next_word()
             return
 
-        # Start timer on first real keypress
-        if self._start_time is None and key in (Qt.Key_Q, Qt.Key_E):
-            self._start_time = time.time()
-
         if key == Qt.Key_Q:
-            self._user_input += "."
+            self.engine.key(".")            # the first dot / dash starts the clock
             cw_audio.play_dit()
         elif key == Qt.Key_E:
-            self._user_input += "-"
+            self.engine.key("-")
             cw_audio.play_dah()
         elif key == Qt.Key_Backspace:
-            self._user_input = self._user_input[:-1]
+            self.engine.backspace()
         elif key == Qt.Key_Space:
-            self._user_input += " "      # inter-letter separator
+            self.engine.key(LETTER_GAP)
         elif key == Qt.Key_Tab:
-            self._user_input += " / "    # inter-word separator
+            self.engine.key(WORD_GAP)
         elif key in (Qt.Key_Return, Qt.Key_Enter):
-            if self._user_input.strip():
-                self._submit()
+            self._submit()
             return
 
-        self.label_user_input.setText(self._user_input)
+        self.label_user_input.setText(self.engine.user_input)
 
 
     def _skip(self):
-        self._score_total += 1
+        attempt = self.engine.skip()
+        if attempt is None:
+            return
+        log_attempt("Send Practice", attempt.target, "")
         self._show_answer(correct=False, skipped=True)
 
     def _show_answer(self, correct: bool, skipped: bool = False, wpm: float = 0):
-        self._awaiting_next = True
-        self.label_expected_morse.setText(self._target_morse)
+        self.label_expected_morse.setText(self.engine.morse)
         self.next_button.setEnabled(True)
         self.skip_button.setEnabled(False)
 
@@ -231,36 +190,42 @@ class SendPractice(QWidget):
             self.label_feedback.setStyleSheet("color: #f44336;")
             self.label_wpm.setText("")
 
-        pct = round(self._score_correct / self._score_total * 100) if self._score_total else 0
-        self.label_score.setText(
-            f"Score: {self._score_correct}/{self._score_total}  ({pct}%)"
-        )
+        self.label_score.setText(str(self.engine.score))
 
     def _submit(self):
-        elapsed = time.time() - self._start_time if self._start_time else 0
-        user_morse = self._user_input.strip()
-        correct = (user_morse == self._target_morse.strip())
-        self._score_total += 1
-        if correct:
-            self._score_correct += 1
-        wpm = _calc_wpm(_char_count(self._target_text), elapsed)
+        attempt = self.engine.submit()
+        if attempt is None:
+            return
+        log_attempt("Send Practice", attempt.target, attempt.response,
+                    latency_ms=attempt.latency_ms, wpm=attempt.wpm)
         # Play back the correct Morse so user can hear it
         if cw_audio.is_available():
-            cw_audio.play_morse(self._target_morse)
-        self._show_answer(correct=correct, wpm=wpm if correct else 0)
+            cw_audio.play_morse(self.engine.morse)
+        self._show_answer(correct=attempt.correct, wpm=attempt.wpm if attempt.correct else 0)
 
     # keyPressEvent intentionally omitted:
     # all key handling happens in eventFilter (app-level) so it
     # fires regardless of which child widget currently has focus.
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        self.engine.new_session()
+        self.label_score.setText("Score: —")
+        cw_audio.prewarm()
+        self._next_word()
+        # closeEvent removed the app-level key filter
+        QApplication.instance().installEventFilter(self)
+
     def closeEvent(self, event):
         QApplication.instance().removeEventFilter(self)
         cw_audio.stop()
-        if self._score_total > 0:
+        self.engine.selector.save()
+        score = self.engine.score
+        if score.total > 0:
             log_session(
                 "Send Practice",
-                correct=self._score_correct,
-                total=self._score_total,
+                correct=score.correct,
+                total=score.total,
                 wpm=0.0
             )
         if self.return_callback:
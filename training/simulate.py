@@ -0,0 +1,282 @@
+# simulate.py
+# Headless simulation harness for the training engines (engine.py): scripted
+# learners answer synthetic trials against a virtual clock, so selection and
+# scoring algorithms can be benchmarked and tuned offline — no Qt, no audio,
+# no stats log.
+#
+#   python -m training.simulate                          # exercise, static learner
+#   python -m training.simulate -n 2000000 --learner forgetting
+#   python -m training.simulate --engine recall --selector srs --seed 7
+#   python -m training.simulate --engine koch -n 100000   # trials per Koch lesson
+#
+# Learners
+#   static      fixed per-letter accuracy (long codes are harder) — a stable
+#               target for comparing selectors
+#   forgetting  per-letter memory that decays with (virtual) time since the
+#               letter was last seen and strengthens with spaced reviews
+#
+# Reports trials/s, overall and final-stretch accuracy, retention (the
+# learner's mean accuracy over every item at the end) and per-item exposure
+# against the learner's own accuracy for that item.
+
+import sys as _sys, os as _os
+_sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
+_sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))                    # training/
+
+import argparse
+import math
+import random
+import time
+from collections import Counter
+
+import morse_codec
+from engine import (ExerciseEngine, RecallEngine, SendEngine, RandomSelector,
+                    LETTERS, MODE_LETTERS, MODE_KOCH, STATE_WAITING)
+from koch import KochLesson
+from scheduler import Scheduler
+
+
+# ── Virtual clock ─────────────────────────────────────────────────────────────
+class VirtualClock:
+    """Callable clock (seconds) that only moves when advanced."""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+# ── Learner models ────────────────────────────────────────────────────────────
+class StaticLearner:
+    """
+    Fixed accuracy per item: `base` for the shortest codes, dropping by
+    `per_element` for each extra dot or dash.  Never learns.
+    """
+
+    def __init__(self, rng, base: float = 0.97, per_element: float = 0.06,
+                 latency_ms: float = 900.0):
+        self.rng = rng
+        self.base = base
+        self.per_element = per_element
+        self.latency_ms = latency_ms
+        self._p = {}
+
+    def accuracy(self, item: str) -> float:
+        p = self._p.get(item)
+        if p is None:
+            elements = len(morse_codec.encode(item).replace(" ", ""))
+            p = self._p[item] = max(0.05, self.base - self.per_element * (elements - 1))
+        return p
+
+    def respond(self, item: str, now: float):
+        """(correct, latency_ms) for one trial."""
+        p = self.accuracy(item)
+        correct = self.rng.random() < p
+        latency = self.rng.expovariate(1.0 / self.latency_ms) * (2.0 - p)
+        return correct, latency
+
+    def observe(self, item: str, correct: bool, now: float):
+        pass
+
+
+class ForgettingLearner(StaticLearner):
+    """
+    Recall probability ceiling * exp(-elapsed / stability), where the ceiling
+    is the static learner's accuracy for the item.  Seeing an item resets its
+    clock; a correct answer grows its stability by `gain` x the time since it
+    was last seen, up to 3x the stability (spaced reviews help, massed ones
+    barely do); a miss (after which the answer is shown) adds `relearn`
+    seconds.  Unseen items are 0%.
+    """
+
+    def __init__(self, rng, stability: float = 10.0, gain: float = 2.0,
+                 relearn: float = 5.0, latency_ms: float = 900.0):
+        super().__init__(rng, latency_ms=latency_ms)
+        self.start = stability
+        self.gain = gain
+        self.relearn = relearn
+        self._stability = {}
+        self._seen = {}
+        self._now = 0.0
+
+    def accuracy(self, item: str, now: float | None = None) -> float:
+        last = self._seen.get(item)
+        if last is None:
+            return 0.0
+        elapsed = (self._now if now is None else now) - last
+        return super().accuracy(item) * math.exp(-elapsed / self._stability[item])
+
+    def respond(self, item: str, now: float):
+        self._now = now
+        return super().respond(item, now)
+
+    def observe(self, item: str, correct: bool, now: float):
+        self._now = now
+        last = self._seen.get(item)
+        s = self._stability.get(item, self.start)
+        if last is not None:
+            s = s + self.gain * min(now - last, 3 * s) if correct else s + self.relearn
+        self._stability[item] = s
+        self._seen[item] = now
+
+
+LEARNERS = {"static": StaticLearner, "forgetting": ForgettingLearner}
+# Selector factories: (rng, clock) -> selector.  The scheduler runs in memory.
+SELECTORS = {
+    "random": lambda rng, clock: RandomSelector(rng),
+    "srs":    lambda rng, clock: Scheduler("simulation", path=None, clock=clock, rng=rng),
+}
+
+
+# ── Trial loops ───────────────────────────────────────────────────────────────
+# Each yields (item, correct) per trial and keeps the clock moving:
+# the learner's latency, then `pause` seconds of feedback / playback.
+def _exercise_trials(selector, learner, clock, rng, pause: float):
+    engine = ExerciseEngine(LETTERS, selector=selector, clock=clock)
+    engine.next()
+    while True:
+        item = engine.current
+        correct, latency = learner.respond(item, clock.now)
+        clock.advance(latency / 1000)
+        # A wrong answer is the right code with one element too many
+        engine.submit(engine.expected if correct else engine.expected + ".")
+        learner.observe(item, correct, clock.now)
+        clock.advance(pause)
+        while engine.advance() != STATE_WAITING:
+            pass
+        yield item, correct
+
+
+def _recall_trials(selector, learner, clock, rng, pause: float):
+    engine = RecallEngine(selector=selector, rng=rng, clock=clock)
+    while True:
+        item = engine.pick(MODE_LETTERS)
+        engine.present(MODE_LETTERS, item)
+        clock.advance(pause)                    # playback
+        engine.ready()
+        correct, latency = learner.respond(item, clock.now)
+        clock.advance(latency / 1000)
+        engine.answer(item if correct else "")
+        learner.observe(item, correct, clock.now)
+        yield item, correct
+
+
+def _send_trials(selector, learner, clock, rng, pause: float):
+    # Send Practice picks whole words; the learner keys the word as a unit
+    engine = SendEngine(selector=selector, rng=rng, clock=clock)
+    while True:
+        item = engine.next()
+        correct, latency = learner.respond(item, clock.now)
+        engine.key(engine.morse if correct else engine.morse + ".")
+        clock.advance(latency / 1000)
+        engine.submit()
+        learner.observe(item, correct, clock.now)
+        clock.advance(pause)
+        yield item, correct
+
+
+def _koch_trials(selector, learner, clock, rng, pause: float):
+    # The learner copies each character of the group on its own; trials are
+    # reported against the newest character, so exposure reads as trials
+    # spent on each Koch lesson
+    engine = RecallEngine(rng=rng, clock=clock, koch=KochLesson(path=None, rng=rng))
+    while True:
+        engine.present(MODE_KOCH)
+        lesson = engine.koch.newest
+        clock.advance(pause)
+        engine.ready()
+        response = []
+        for ch in engine.text:
+            correct, latency = learner.respond(ch, clock.now)
+            clock.advance(latency / 1000)
+            response.append(ch if correct else "?")
+            learner.observe(ch, correct, clock.now)
+        attempt = engine.answer("".join(response))
+        yield lesson, attempt.correct
+
+
+ENGINES = {"exercise": _exercise_trials, "recall": _recall_trials, "send": _send_trials,
+           "koch": _koch_trials}
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+def run(engine: str = "exercise", learner: str = "static", selector: str = "random",
+        trials: int = 1_000_000, seed: int = 0, pause: float = 1.0,
+        tail: int = 10_000) -> dict:
+    """Run `trials` synthetic trials; returns the measurements as a dict."""
+    rng = random.Random(seed)
+    clock = VirtualClock()
+    model = LEARNERS[learner](random.Random(seed + 1))
+    picker = SELECTORS[selector](random.Random(seed + 2), clock)
+    loop = ENGINES[engine](picker, model, clock, rng, pause)
+
+    exposure = Counter()
+    correct_total = 0
+    tail_correct = 0
+    tail_from = max(trials - tail, 0)
+    t0 = time.perf_counter()
+    for i in range(trials):
+        item, correct = next(loop)
+        exposure[item] += 1
+        correct_total += correct
+        if i >= tail_from:
+            tail_correct += correct
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "engine": engine, "learner": learner, "selector": selector,
+        "trials": trials,
+        "seconds": elapsed,
+        "trials_per_s": trials / elapsed if elapsed else 0.0,
+        "virtual_hours": clock.now / 3600,
+        "accuracy": correct_total / trials * 100 if trials else 0.0,
+        "tail_accuracy": tail_correct / (trials - tail_from) * 100 if trials else 0.0,
+        # What the learner would get right on every item, right now
+        "retention": sum(model.accuracy(i) for i in exposure) / len(exposure) * 100
+                     if exposure else 0.0,
+        "exposure": {item: (n, model.accuracy(item) * 100)
+                     for item, n in exposure.items()},
+    }
+
+
+def format_report(r: dict, top: int = 40) -> str:
+    out = [f"{r['engine']} / {r['learner']} learner / {r['selector']} selector",
+           f"  {r['trials']:,} trials in {r['seconds']:.2f} s  "
+           f"({r['trials_per_s']:,.0f} trials/s, "
+           f"{r['trials_per_s'] * 60 / 1e6:.1f} M/min)",
+           f"  {r['virtual_hours']:.1f} h of simulated practice",
+           f"  accuracy {r['accuracy']:.1f}%   last stretch {r['tail_accuracy']:.1f}%   "
+           f"retention {r['retention']:.1f}%",
+           "",
+           f"  {'item':<6}{'exposure':>10}{'share':>8}{'learner p':>11}"]
+    rows = sorted(r["exposure"].items(), key=lambda kv: -kv[1][0])
+    for item, (n, p) in rows[:top]:
+        out.append(f"  {item:<6}{n:>10,}{n / r['trials'] * 100:>7.1f}%{p:>10.1f}%")
+    if len(rows) > top:
+        out.append(f"  … {len(rows) - top} more")
+    return "\n".join(out)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(prog="python -m training.simulate",
+                                description="Simulated learners against the training engines")
+    p.add_argument("--engine", choices=sorted(ENGINES), default="exercise")
+    p.add_argument("--learner", choices=sorted(LEARNERS), default="static")
+    p.add_argument("--selector", choices=sorted(SELECTORS), default="random")
+    p.add_argument("-n", "--trials", type=int, default=1_000_000)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--pause", type=float, default=1.0,
+                   help="virtual seconds of feedback / playback per trial")
+    args = p.parse_args(argv)
+    report = run(args.engine, args.learner, args.selector, args.trials,
+                 args.seed, args.pause)
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    _sys.exit(main())
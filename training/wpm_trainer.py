@@ -1,71 +1,41 @@
 # wpm_trainer.py
 # WPM Speed Trainer — plays random Morse audio and scores the user's decode.
-# Supports Farnsworth spacing mode.
+# Supports Farnsworth spacing mode.  The next trials' audio is rendered in the
+# background (prefetch.py), so Play and Replay start without synthesis delay.
 
 import sys as _sys, os as _os
 _sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))  # root
 _sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))                    # training/
 
-import random
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QComboBox, QCheckBox, QSpinBox, QFrame, QSlider
 )
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from dicts import MORSE_CODE_DICT
 import cw_audio
-from session_stats import log_session
-
-# ── Word banks ────────────────────────────────────────────────────────────────
-COMMON_WORDS = [
-    "THE", "AND", "FOR", "ARE", "BUT", "NOT", "YOU", "ALL",
-    "CAN", "HER", "WAS", "ONE", "OUR", "OUT", "DAY", "GET",
-    "HAS", "HIM", "HOW", "MAN", "NEW", "NOW", "OLD", "SEE",
-    "TWO", "WAY", "WHO", "BOY", "DID", "ITS", "LET", "PUT",
-    "SAY", "TOO", "USE",
-]
-CW_WORDS = [
-    "CQ", "DE", "RST", "QTH", "QRZ", "QSO", "QRM", "QRN",
-    "73", "88", "K", "AR", "SK", "BK", "TNX", "UR", "ES",
-    "AGN", "PSE", "RPT", "HR", "HW", "FB", "NR", "OM",
-]
-
-# ── Callsign generator ────────────────────────────────────────────────────────
-_PREFIXES = ["W", "K", "N", "AA", "VK", "G", "F", "DL", "JA", "HS", "TA"]
-_LETTERS  = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-_DIGITS   = "0123456789"
-
-def _random_callsign() -> str:
-    prefix = random.choice(_PREFIXES)
-    digit  = random.choice(_DIGITS)
-    suffix = "".join(random.choices(_LETTERS, k=random.randint(2, 3)))
-    return f"{prefix}{digit}{suffix}"
-
-
-def _to_morse(text: str) -> str:
-    parts = []
-    for ch in text.upper():
-        if ch == " ":
-            parts.append("/")
-        elif ch in MORSE_CODE_DICT:
-            parts.append(MORSE_CODE_DICT[ch])
-    return " ".join(parts)
+import morse_codec
+from engine import RecallEngine, MODES, MODE_KOCH
+from koch import KochLesson
+from prefetch import AudioPrefetcher, DEFAULT_DEPTH
+from scheduler import Scheduler
+from session_stats import log_session, log_attempt
 
 
 # ── Audio worker ──────────────────────────────────────────────────────────────
 class AudioWorker(QThread):
     finished = pyqtSignal()
 
-    def __init__(self, morse: str, wpm: int, farnsworth: bool):
+    def __init__(self, prefetch: AudioPrefetcher, text: str, settings: tuple):
         super().__init__()
-        self.morse = morse
-        self.wpm = wpm
-        self.farnsworth = farnsworth
+        self.prefetch = prefetch
+        self.text = text
+        self.settings = settings
 
     def run(self):
-        fw = max(5, self.wpm - 5) if self.farnsworth else 0
-        cw_audio.play_morse(self.morse, wpm=self.wpm, farnsworth_wpm=fw, blocking=True)
+        # Usually rendered already; if not, it is rendered here, off the GUI thread
+        audio = self.prefetch.get(self.text, self.settings)
+        cw_audio.play_audio(audio, blocking=True)
         self.finished.emit()
 
 
@@ -77,13 +47,15 @@ class WpmTrainer(QWidget):
         self.setWindowTitle("WPM Speed Trainer")
         self.setGeometry(200, 100, 520, 480)
 
-        self._current_text = ""
-        self._current_morse = ""
-        self._score_correct = 0
-        self._score_total   = 0
+        # Letters mode is scheduled by spaced repetition, Koch mode follows the
+        # saved lesson; the other modes are random
+        self.engine = RecallEngine(selector=Scheduler("WPM Trainer"), koch=KochLesson())
+        self._settings = {}             # playback settings of the current text
         self._worker: AudioWorker | None = None
+        self.prefetch = AudioPrefetcher(self._render)
 
         self._build_ui()
+        self._mode_changed()
 
     # ── UI ──────────────────────────────────────────────────────────────────
     def _build_ui(self):
@@ -98,22 +70,32 @@ class WpmTrainer(QWidget):
         self.wpm_spin.setRange(5, 40)
         self.wpm_spin.setValue(15)
         self.wpm_spin.setFixedWidth(60)
+        self.wpm_spin.valueChanged.connect(self._prefetch)
         settings.addWidget(self.wpm_spin)
 
         self.farnsworth_cb = QCheckBox("Farnsworth")
         self.farnsworth_cb.setToolTip(
             "Letters sent at selected WPM; extra gaps between letters/words to allow thinking time."
         )
+        self.farnsworth_cb.toggled.connect(self._prefetch)
         settings.addWidget(self.farnsworth_cb)
 
         settings.addWidget(QLabel("  Mode:"))
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["Letters", "Common Words", "CW Abbreviations", "Callsigns"])
+        self.mode_combo.addItems(MODES)
+        self.mode_combo.currentTextChanged.connect(self._mode_changed)
         settings.addWidget(self.mode_combo)
 
         settings.addStretch()
         main.addLayout(settings)
 
+        # ── Koch lesson (Koch mode only) ──
+        self.label_koch = QLabel("")
+        self.label_koch.setAlignment(Qt.AlignCenter)
+        self.label_koch.setFont(QFont("Arial", 10))
+        self.label_koch.setStyleSheet("color: #4fc3f7;")
+        main.addWidget(self.label_koch)
+
         # ── Noise row ──
         noise_row = QHBoxLayout()
         noise_row.addWidget(QLabel("Noise (SNR dB, 0=off):"))
@@ -126,6 +108,7 @@ class WpmTrainer(QWidget):
         self.noise_slider.valueChanged.connect(
             lambda v: self.noise_label.setText(str(v))
         )
+        self.noise_slider.valueChanged.connect(self._prefetch)
         noise_row.addWidget(self.noise_slider)
         noise_row.addWidget(self.noise_label)
 
@@ -136,6 +119,7 @@ class WpmTrainer(QWidget):
         self.qrm_spin.setSingleStep(50)
         self.qrm_spin.setValue(0)
         self.qrm_spin.setFixedWidth(75)
+        self.qrm_spin.valueChanged.connect(self._prefetch)
         noise_row.addWidget(self.qrm_spin)
         noise_row.addStretch()
         main.addLayout(noise_row)
@@ -221,24 +205,41 @@ class WpmTrainer(QWidget):
         self.setLayout(main)
 
     # ── Logic ────────────────────────────────────────────────────────────────
-    def _pick_text(self) -> str:
-        mode = self.mode_combo.currentText()
-        if mode == "Letters":
-            return random.choice([k for k in MORSE_CODE_DICT if k.isalpha()])
-        elif mode == "Common Words":
-            return random.choice(COMMON_WORDS)
-        elif mode == "CW Abbreviations":
-            return random.choice(CW_WORDS)
-        else:
-            return _random_callsign()
+    def _koch_mode(self) -> bool:
+        return self.mode_combo.currentText() == MODE_KOCH
+
+    def _mode_changed(self, *_):
+        self.label_koch.setVisible(self._koch_mode())
+        if self._koch_mode():
+            self.label_koch.setText(self.engine.koch.status())
+        self._prefetch()
+
+    # ── Audio ────────────────────────────────────────────────────────────────
+    def _audio_settings(self) -> tuple:
+        """Everything that changes the rendered sound (the prefetch key)."""
+        fw = max(5, self.wpm_spin.value() - 5) if self.farnsworth_cb.isChecked() else 0
+        return (self.wpm_spin.value(), fw,
+                float(self.noise_slider.value()), float(self.qrm_spin.value()))
+
+    @staticmethod
+    def _render(text: str, settings: tuple):
+        wpm, fw, noise_db, qrm_freq = settings
+        return cw_audio.build_audio(morse_codec.encode(text), wpm=wpm, farnsworth_wpm=fw,
+                                    noise_db=noise_db, qrm_freq=qrm_freq)
+
+    def _prefetch(self, *_):
+        """Render the next trials for the current mode and settings in the background."""
+        settings = self._audio_settings()
+        upcoming = self.engine.upcoming(self.mode_combo.currentText(), DEFAULT_DEPTH)
+        current = (self.engine.text, settings) if self.engine.text else None
+        self.prefetch.want([(text, settings) for text in upcoming], current)
 
     def _play(self):
-        self._current_text  = self._pick_text()
-        self._current_morse = _to_morse(self._current_text)
+        self.engine.present(self.mode_combo.currentText())
         self._start_playback(new=True)
 
     def _replay(self):
-        if self._current_morse:
+        if self.engine.morse:
             self._start_playback(new=False)
 
     def _start_playback(self, new: bool):
@@ -257,17 +258,19 @@ class WpmTrainer(QWidget):
         self.skip_button.setEnabled(False)
         self.label_status.setText("Playing...")
 
-        # Apply noise settings before building audio
-        cw_audio.set_noise(
-            noise_db=float(self.noise_slider.value()),
-            qrm_freq=float(self.qrm_spin.value())
-        )
-
-        fw = max(5, self.wpm_spin.value() - 5) if self.farnsworth_cb.isChecked() else 0
-        self._worker = AudioWorker(self._current_morse, self.wpm_spin.value(), fw > 0)
-        self._worker.farnsworth = fw > 0
+        settings = self._audio_settings()
+        wpm, fw, noise_db, qrm_freq = settings
+        self._settings = {
+            "wpm": wpm,
+            "farnsworth": fw,
+            "noise_db": int(noise_db),
+            "qrm_hz": int(qrm_freq),
+        }
+        self._worker = AudioWorker(self.prefetch, self.engine.text, settings)
         self._worker.finished.connect(self._on_playback_done)
         self._worker.start()
+        if new:
+            self._prefetch()                # top up behind the trial just started
 
     def _on_playback_done(self):
         self.input_field.setEnabled(True)
@@ -276,43 +279,46 @@ class WpmTrainer(QWidget):
         self.replay_button.setEnabled(True)
         self.skip_button.setEnabled(True)
         self.input_field.setFocus()
+        self.engine.ready()
         self.label_status.setText("Type what you heard, then press Check or Enter.")
 
     def _check_answer(self):
-        if not self._current_text:
+        attempt = self.engine.answer(self.input_field.text())
+        if attempt is None:
             return
-        user = self.input_field.text().strip().upper()
-        correct = self._current_text.upper()
-        self._score_total += 1
-
-        if user == correct:
-            self._score_correct += 1
+        self._log_attempt(attempt)
+        if self.engine.unlocked:
+            self.label_feedback.setText(f"New character: {self.engine.koch.newest}")
+            self.label_feedback.setStyleSheet("color: #4fc3f7;")
+        elif attempt.correct:
             self.label_feedback.setText(f"Correct!")
             self.label_feedback.setStyleSheet("color: #4caf50;")
         else:
             self.label_feedback.setText(f"Wrong!")
             self.label_feedback.setStyleSheet("color: #f44336;")
+        self._show_answer()
 
-        self.label_answer.setText(correct)
-        self.label_morse.setText(self._current_morse)
-        pct = round(self._score_correct / self._score_total * 100)
-        self.label_score.setText(
-            f"Score: {self._score_correct}/{self._score_total}  ({pct}%)"
-        )
-        self.input_field.setEnabled(False)
-        self.check_button.setEnabled(False)
-        self.skip_button.setEnabled(False)
+    def _log_attempt(self, attempt):
+        log_attempt("WPM Trainer", attempt.target, attempt.response,
+                    latency_ms=attempt.latency_ms, **self._settings)
 
     def _skip(self):
-        self._score_total += 1
-        self.label_answer.setText(self._current_text.upper())
-        self.label_morse.setText(self._current_morse)
+        attempt = self.engine.skip()
+        if attempt is None:
+            return
+        self._log_attempt(attempt)
         self.label_feedback.setText("Skipped")
         self.label_feedback.setStyleSheet("color: #e8a838;")
-        pct = round(self._score_correct / self._score_total * 100)
-        self.label_score.setText(
-            f"Score: {self._score_correct}/{self._score_total}  ({pct}%)"
-        )
+        self._show_answer()
+
+    def _show_answer(self):
+        self.label_answer.setText(self.engine.text.upper())
+        self.label_morse.setText(self.engine.morse)
+        self.label_score.setText(str(self.engine.score))
+        if self.engine.mode == MODE_KOCH:
+            self.label_koch.setText(self.engine.koch.status())
+            if self.engine.unlocked:
+                self._prefetch()           # the next groups may use the new character
         self.input_field.setEnabled(False)
         self.check_button.setEnabled(False)
         self.skip_button.setEnabled(False)
@@ -323,14 +329,37 @@ class WpmTrainer(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def reset_session(self):
+        """Start a fresh session in a reused window (see main_menu.WindowPool)."""
+        # A playback still finishing from the last session must not
+        # re-enable the answer field
+        if self._worker is not None:
+            self._worker.finished.disconnect(self._on_playback_done)
+            self._worker = None
+        self.engine = RecallEngine(selector=self.engine.selector, koch=self.engine.koch)
+        self._settings = {}
+        for label in (self.label_morse, self.label_answer, self.label_feedback):
+            label.setText("")
+        self.label_score.setText("Score: —")
+        self.label_status.setText("Press ▶ Play to hear a Morse sequence, then type what you heard.")
+        self.input_field.clear()
+        self.input_field.setEnabled(False)
+        self.play_button.setEnabled(True)
+        for button in (self.replay_button, self.check_button, self.skip_button):
+            button.setEnabled(False)
+        self._mode_changed()
+
     def closeEvent(self, event):
         cw_audio.stop()
-        cw_audio.set_noise(0.0, 0.0)   # reset noise on exit
-        if self._score_total > 0:
+        self.prefetch.clear()
+        self.engine.selector.save()
+        self.engine.koch.save()
+        score = self.engine.score
+        if score.total > 0:
             log_session(
                 "WPM Trainer",
-                correct=self._score_correct,
-                total=self._score_total,
+                correct=score.correct,
+                total=score.total,
                 wpm=self.wpm_spin.value()
             )
         if self.return_callback:
@@ -0,0 +1,102 @@
+# transliterate.py
+# Unicode -> Morse-friendly text, per language profile.
+# Each profile is a compiled str.translate table; characters it does not know
+# fall back to NFKD decomposition (é -> e, Å -> A) and the result is memoised
+# back into the table, so every character is only ever decomposed once.
+
+import re
+import unicodedata
+
+from dicts import TURKISH_REPLACEMENTS
+import morse_codec
+from morse_codec import DEFAULT_CHUNK_SIZE, read_chunks
+
+# Letters and punctuation that NFKD does not decompose to ASCII
+_COMMON = {
+    'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ø': 'o', 'Ø': 'O',
+    'ł': 'l',  'Ł': 'L',  'đ': 'd',  'Đ': 'D',  'ð': 'd', 'Ð': 'D',
+    'þ': 'th', 'Þ': 'TH', 'ß': 'ss', 'ı': 'i',
+    '‘': "'",  '’': "'",  '‚': "'",  '“': '"',  '”': '"', '„': '"',
+    '–': '-',  '—': '-',  '«': '"',  '»': '"',
+}
+
+
+class Transliterator:
+    """
+    replacements : char -> replacement string, applied first
+    keep         : non-ASCII characters passed through untouched
+                   (e.g. Ç/Ş when the target code table can send them)
+    """
+
+    def __init__(self, replacements: dict, keep: str = ""):
+        self._table = str.maketrans(replacements)
+        self._keep = frozenset(keep)
+        self._foreign_re = re.compile(f"[^\\x00-\\x7f{re.escape(keep)}]")
+
+    def __call__(self, text: str) -> str:
+        text = text.translate(self._table)
+        if text.isascii():
+            return text
+        foreign = set(self._foreign_re.findall(text))
+        if not foreign:
+            return text
+        for ch in foreign:
+            self._table[ord(ch)] = _fold(ch)
+        return text.translate(self._table)
+
+    def stream(self, chunks):
+        """Transliterate an iterable of text chunks, yielding text chunks."""
+        for chunk in chunks:
+            yield self(chunk)
+
+    def file(self, f, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Transliterate an open text file chunk by chunk."""
+        return self.stream(read_chunks(f, chunk_size))
+
+
+def _fold(ch: str) -> str:
+    """NFKD-decompose one character and drop combining marks."""
+    decomposed = unicodedata.normalize("NFKD", ch)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    # Characters with no ASCII decomposition are left for the codec's
+    # unknown-character policy to handle.
+    return folded if folded.isascii() else ch
+
+
+# ── Profiles ──────────────────────────────────────────────────────────────────
+PROFILES = {
+    # Plain A–Z output: everything folded to ASCII
+    "ascii":         Transliterator(_COMMON),
+    # Turkish folded to ASCII digraphs (ç -> ch, ş -> sh), as before
+    "turkish_ascii": Transliterator({**_COMMON, **TURKISH_REPLACEMENTS}),
+    # Turkish letters kept for the Turkish code table; Turkish casing for i/ı
+    "turkish":       Transliterator({**_COMMON, 'i': 'İ', 'ı': 'I'},
+                                    keep="çğöşüÇĞİÖŞÜ"),
+    # Umlauts kept for the German code table
+    "german":        Transliterator({**_COMMON, 'ß': 'SS'}, keep="äöüÄÖÜ"),
+}
+
+
+def get_profile(name: str) -> Transliterator:
+    return PROFILES[name]
+
+
+def transliterate(text: str, profile: str = "ascii") -> str:
+    return PROFILES[profile](text)
+
+
+# ── Languages ─────────────────────────────────────────────────────────────────
+# Code tables plus the profile that prepares text for them.  "international"
+# folds Turkish letters to ASCII digraphs; the national tables send
+# Ç/Ş/Ğ/Ö/Ü… with their own Morse codes.
+LANGUAGES = {
+    "international": (morse_codec.DEFAULT_TABLES, "turkish_ascii"),
+    "turkish":       (morse_codec.TURKISH_TABLES, "turkish"),
+    "german":        (morse_codec.GERMAN_TABLES,  "german"),
+}
+
+
+def pipeline(language: str = "international"):
+    """(codec, transliterator) for a LANGUAGES key."""
+    tables, profile = LANGUAGES[language]
+    return morse_codec.get_codec(tables), PROFILES[profile]